@@ -0,0 +1,118 @@
+"""InquiryClassifier 학습·예측과 TextExtension.clean_text의 확장성을 측정합니다.
+
+사용법:
+    python benchmarks/bench_classifier.py
+    python benchmarks/bench_classifier.py --sizes 1k,10k --output before.json
+    python benchmarks/bench_classifier.py --features tfidf,char_hash
+"""
+import os
+import gc
+import argparse
+import tempfile
+import logging
+from common import (DEFAULT_SIZES, parse_sizes, timed, peak_memory, percentile, write_results, default_output_file,
+                    isolate_user_resources)
+from corpus import generate_corpus
+from core.classifier import InquiryClassifier
+from core.features import FEATURE_EXTRACTORS, DEFAULT_FEATURE_EXTRACTOR
+from utils.text_extension import TextExtension
+
+SUITE = 'classifier'
+SINGLE_PREDICT_SAMPLES = 1000  # 건별 예측 지연 시간을 잴 행 수
+
+def new_classifier(work_dir, features=DEFAULT_FEATURE_EXTRACTOR):
+    """사용자 모델과 예측 캐시를 건드리지 않도록 임시 디렉터리에 모델 경로를 둡니다."""
+    return InquiryClassifier(
+        model_file=os.path.join(work_dir, 'benchmark.joblib'), lazy=True, feature_extractor=features
+    )
+
+def clean_all(texts):
+    return TextExtension.clean_texts(texts)
+
+def predict_each(classifier, texts):
+    latencies = []
+    for text in texts:
+        elapsed, _ = timed(classifier.predict, text)
+        latencies.append(elapsed)
+    return latencies
+
+def bench_size(rows, seed, repeat, measure_memory, work_dir, features=DEFAULT_FEATURE_EXTRACTOR):
+    corpus = generate_corpus(rows, seed=seed)
+    texts = corpus['질문내용'].tolist()
+    labels = corpus['분류'].tolist()
+    metrics = {}
+
+    clean_seconds, cleaned = timed(clean_all, texts, repeat=repeat)
+    metrics['clean_text_seconds'] = clean_seconds
+    metrics['clean_text_us_per_row'] = clean_seconds / rows * 1e6
+
+    classifier = new_classifier(work_dir, features)
+    train_seconds, _ = timed(classifier.train, cleaned, labels, repeat=repeat)
+    metrics['train_seconds'] = train_seconds
+
+    # 캐시 효과를 빼고 순수 점수 계산만 측정
+    batch_seconds, _ = timed(classifier.predict_many, cleaned, use_cache=False, repeat=repeat)
+    metrics['predict_batch_seconds'] = batch_seconds
+    metrics['predict_batch_us_per_row'] = batch_seconds / rows * 1e6
+
+    latencies = predict_each(classifier, cleaned[:SINGLE_PREDICT_SAMPLES])
+    metrics['predict_single_p50_ms'] = percentile(latencies, 50) * 1000
+    metrics['predict_single_p95_ms'] = percentile(latencies, 95) * 1000
+
+    # 저장 모델과 압축 모델의 크기·불러오기 시간
+    classifier.save_model()
+    compact = classifier.export_compact_model()
+    metrics['model_bytes'] = compact['original_bytes']
+    metrics['model_load_seconds'] = compact['original_load_seconds']
+    metrics['compact_model_bytes'] = compact['compact_bytes']
+    metrics['compact_model_load_seconds'] = compact['compact_load_seconds']
+
+    if measure_memory:
+        gc.collect()
+        metrics['clean_text_peak_bytes'] = peak_memory(clean_all, texts)
+        gc.collect()
+        metrics['train_peak_bytes'] = peak_memory(new_classifier(work_dir, features).train, cleaned, labels)
+        gc.collect()
+        metrics['predict_batch_peak_bytes'] = peak_memory(classifier.predict_many, cleaned, use_cache=False)
+
+    return metrics
+
+def main():
+    parser = argparse.ArgumentParser(description='분류기 학습·예측·전처리 벤치마크')
+    parser.add_argument('--sizes', type=parse_sizes, default=list(DEFAULT_SIZES), help='행 수 목록 (예: 1k,10k,100k,1m)')
+    parser.add_argument('--seed', type=int, default=42, help='데이터 생성 시드')
+    parser.add_argument('--repeat', type=int, default=1, help='반복 측정 횟수 (가장 짧은 시간을 기록)')
+    parser.add_argument('--features', default=DEFAULT_FEATURE_EXTRACTOR,
+                        help=f"특성 추출 방식 목록 ({', '.join(FEATURE_EXTRACTORS)})")
+    parser.add_argument('--no-memory', action='store_true', help='메모리 측정 생략')
+    parser.add_argument('--output', default=None, help='결과 JSON 파일 (기본: benchmarks/results/)')
+    args = parser.parse_args()
+
+    feature_list = [name.strip() for name in args.features.split(',') if name.strip()]
+    unknown = [name for name in feature_list if name not in FEATURE_EXTRACTORS]
+    if unknown:
+        parser.error(f'알 수 없는 특성 추출 방식: {unknown}')
+
+    logging.basicConfig(level=logging.ERROR)
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        isolate_user_resources(work_dir)
+        for rows in args.sizes:
+            for features in feature_list:
+                # 기본 방식은 이전 결과 파일과 비교할 수 있도록 기존 케이스 이름을 유지
+                case = f'rows={rows}' if features == DEFAULT_FEATURE_EXTRACTOR else f'rows={rows},features={features}'
+                print(f'{case} 측정 중...')
+                metrics = bench_size(rows, args.seed, args.repeat, not args.no_memory, work_dir, features)
+                results.append({'case': case, 'rows': rows, 'features': features, 'metrics': metrics})
+                for name, value in metrics.items():
+                    print(f'  {name}: {value:,.3f}')
+
+    write_results(
+        SUITE,
+        results,
+        args.output or default_output_file(SUITE),
+        parameters={'sizes': args.sizes, 'features': feature_list, 'seed': args.seed, 'repeat': args.repeat}
+    )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+"""ExcelHandler와 pandas 엑셀 입출력의 소요 시간과 메모리를 측정합니다.
+
+행 수·열 수·스타일 종류·병합 셀 수를 바꿔 가며 서식이 있는 워크북을 만들고,
+읽기, 시트 목록 조회, 새 파일 저장, 원본 업데이트(is_update) 저장, 바뀐 셀만 고치는 부분 업데이트를 각각 측정합니다.
+ExcelHandler 읽기는 시트 캐시가 빈 상태(변환 포함)와 캐시에 있는 상태를 나눠 측정합니다.
+
+사용법:
+    python benchmarks/bench_excel.py
+    python benchmarks/bench_excel.py --sizes 1k,10k --scenarios base,styled --output before.json
+"""
+import os
+import gc
+import shutil
+import argparse
+import tempfile
+import logging
+import openpyxl
+import pandas as pd
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+from openpyxl.utils import get_column_letter
+from common import parse_sizes, timed, peak_memory, write_results, default_output_file
+from corpus import generate_corpus
+from core.excel_handler import ExcelHandler
+from core.sheet_cache import SheetCache
+
+SUITE = 'excel'
+DEFAULT_SIZES = (1000, 10000, 100000)
+SHEET_NAME = 'Data'
+CONTENT_COLUMN = '질문내용'
+CATEGORY_COLUMN = '분류'
+REVIEW_EDITS = 100  # 부분 업데이트 측정에서 검수로 고친 셀 수
+
+# 시나리오별 (열 수, 스타일 종류, 병합 셀 수)
+SCENARIOS = {
+    'base': (8, 4, 0),
+    'wide': (30, 4, 0),
+    'styled': (8, 200, 0),
+    'merged': (8, 4, 500)
+}
+
+PALETTE = ['FFFFFF', 'FFF2CC', 'DDEBF7', 'E2EFDA', 'FCE4D6', 'EDEDED', 'D9E1F2', 'FFE699']
+NUMBER_FORMATS = ['General', '0', '#,##0', '0.00', 'yyyy-mm-dd', '@']
+
+def build_styles(variety):
+    """서로 다른 셀 서식 조합 variety개를 만듭니다."""
+    thin = Side(style='thin', color='BFBFBF')
+    styles = []
+    for index in range(variety):
+        styles.append({
+            'font': Font(name='맑은 고딕', size=10 + index % 3, bold=index % 2 == 1, color=PALETTE[(index + 3) % len(PALETTE)]),
+            'fill': PatternFill('solid', fgColor=PALETTE[index % len(PALETTE)]),
+            'border': Border(left=thin, right=thin, top=thin, bottom=thin) if index % 4 else Border(),
+            'alignment': Alignment(wrap_text=index % 5 == 0, vertical='center'),
+            'number_format': NUMBER_FORMATS[index % len(NUMBER_FORMATS)]
+        })
+    return styles
+
+def generate_workbook(path, rows, columns, style_variety, merged_cells, seed=42):
+    """벤치마크용 서식 있는 워크북을 만듭니다. 분류 컬럼은 절반 정도만 채워 둡니다."""
+    corpus = generate_corpus(rows, seed=seed)
+    header = ['번호', CONTENT_COLUMN, CATEGORY_COLUMN] + [f'항목{i}' for i in range(1, columns - 2)]
+    styles = build_styles(style_variety)
+    header_style = {'font': Font(bold=True), 'fill': PatternFill('solid', fgColor='BDD7EE')}
+
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet.title = SHEET_NAME
+    for col_idx, name in enumerate(header, 1):
+        cell = sheet.cell(row=1, column=col_idx, value=name)
+        cell.font = header_style['font']
+        cell.fill = header_style['fill']
+        sheet.column_dimensions[get_column_letter(col_idx)].width = 40 if name == CONTENT_COLUMN else 12
+
+    contents = corpus[CONTENT_COLUMN].tolist()
+    labels = corpus[CATEGORY_COLUMN].tolist()
+    for row in range(rows):
+        values = [row + 1, contents[row], labels[row] if row % 2 == 0 else None]
+        values += [(row * 7 + col) % 1000 for col in range(columns - 3)]
+        sheet.append(values)
+        if style_variety:
+            for col_idx in range(1, columns + 1):
+                style = styles[(row + col_idx) % style_variety]
+                cell = sheet.cell(row=row + 2, column=col_idx)
+                cell.font = style['font']
+                cell.fill = style['fill']
+                cell.border = style['border']
+                cell.alignment = style['alignment']
+                cell.number_format = style['number_format']
+
+    # 분류 컬럼을 건드리지 않도록 마지막 두 열을 행 단위로 병합
+    if merged_cells and columns >= 5:
+        step = max(1, rows // merged_cells)
+        first, last = get_column_letter(columns - 1), get_column_letter(columns)
+        for row in range(2, rows + 2, step)[:merged_cells]:
+            sheet.merge_cells(f'{first}{row}:{last}{row}')
+
+    category_sheet = wb.create_sheet('Category')
+    category_sheet.append(['분류3'])
+    for category in sorted(set(labels)):
+        category_sheet.append([category])
+    wb.save(path)
+
+def classified_frame(df):
+    """분류 결과가 채워진 DataFrame을 흉내 냅니다 (저장 경로 측정용)."""
+    df = df.copy()
+    categories = df[CATEGORY_COLUMN].astype(object)
+    categories[categories.isna() | (categories == '')] = '알수없음'
+    df[CATEGORY_COLUMN] = categories
+    return df
+
+def reviewed_frame(df):
+    """분류 결과 중 REVIEW_EDITS개 행만 검수에서 고친 DataFrame을 흉내 냅니다 (부분 업데이트 측정용)."""
+    df = df.copy()
+    categories = df[CATEGORY_COLUMN].astype(object)
+    categories.iloc[::max(1, len(df) // REVIEW_EDITS)] = '검수수정'
+    df[CATEGORY_COLUMN] = categories
+    return df
+
+def list_sheets(path):
+    return pd.ExcelFile(path).sheet_names
+
+def save_new(path, output_file, df, share_styles=True):
+    ExcelHandler.save_excel_with_style(path, output_file, SHEET_NAME, df, share_styles=share_styles)
+
+def save_update(path, work_file, df):
+    shutil.copyfile(path, work_file)
+    ExcelHandler.save_excel_with_style(work_file, work_file, SHEET_NAME, df, is_update=True)
+
+def save_delta(path, work_file, before, after):
+    """원본 업데이트의 부분 경로(바뀐 셀만 패치)를 실행합니다. 전체 저장으로 대신했으면 None을 반환합니다."""
+    shutil.copyfile(path, work_file)
+    return ExcelHandler.update_changed_cells(work_file, SHEET_NAME, before, after)
+
+def read_uncached(path):
+    SheetCache.default().clear()
+    return ExcelHandler.read_excel(path, SHEET_NAME)
+
+def bench_case(path, work_dir, repeat, measure_memory):
+    metrics = {'file_bytes': os.path.getsize(path)}
+    operations = {
+        'list_sheets': lambda: list_sheets(path),
+        'read_excel_handler': lambda: read_uncached(path),
+        'read_excel_handler_cached': lambda: ExcelHandler.read_excel(path, SHEET_NAME),
+        'read_pandas': lambda: pd.read_excel(path, sheet_name=SHEET_NAME)
+    }
+    for name, operation in operations.items():
+        metrics[f'{name}_seconds'], _ = timed(operation, repeat=repeat)
+
+    source_df = pd.read_excel(path, sheet_name=SHEET_NAME)
+    df = classified_frame(source_df)
+    reviewed_df = reviewed_frame(df)
+    output_file = os.path.join(work_dir, 'output.xlsx')
+    work_file = os.path.join(work_dir, 'update.xlsx')
+    copy_seconds, _ = timed(shutil.copyfile, path, work_file)
+    operations['save_new'] = lambda: save_new(path, output_file, df)
+    operations['save_update'] = lambda: save_update(path, work_file, df)
+    metrics['save_new_seconds'], _ = timed(operations['save_new'], repeat=repeat)
+    # 셀마다 스타일을 복사하던 이전 방식과 비교용
+    metrics['save_new_per_cell_styles_seconds'], _ = timed(save_new, path, output_file, df, False, repeat=repeat)
+    update_seconds, _ = timed(operations['save_update'], repeat=repeat)
+    metrics['save_update_seconds'] = max(0.0, update_seconds - copy_seconds)  # 원본 복사 시간 제외
+
+    # 부분 업데이트: 분류 결과 반영(미분류 행 전체)과 검수 수정 반영(일부 셀)
+    operations['save_delta_update'] = lambda: save_delta(path, work_file, source_df, df)
+    operations['save_delta_review'] = lambda: save_delta(path, work_file, df, reviewed_df)
+    fallbacks = 0
+    for name in ('save_delta_update', 'save_delta_review'):
+        delta_seconds, patched = timed(operations[name], repeat=repeat)
+        metrics[f'{name}_seconds'] = max(0.0, delta_seconds - copy_seconds)
+        fallbacks += patched is None
+    # 0이 아니면 부분 업데이트 대신 전체 저장이 실행된 것이므로 위 두 값은 부분 경로 측정이 아님
+    metrics['delta_update_fallbacks'] = fallbacks
+    metrics['output_bytes'] = os.path.getsize(output_file)
+
+    if measure_memory:
+        for name, operation in operations.items():
+            gc.collect()
+            metrics[f'{name}_peak_bytes'] = peak_memory(operation)
+    return metrics
+
+def main():
+    parser = argparse.ArgumentParser(description='엑셀 읽기·저장 벤치마크')
+    parser.add_argument('--sizes', type=parse_sizes, default=list(DEFAULT_SIZES), help='행 수 목록 (예: 1k,10k,100k)')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help=f"시나리오 목록 ({', '.join(SCENARIOS)})")
+    parser.add_argument('--seed', type=int, default=42, help='데이터 생성 시드')
+    parser.add_argument('--repeat', type=int, default=1, help='반복 측정 횟수 (가장 짧은 시간을 기록)')
+    parser.add_argument('--no-memory', action='store_true', help='메모리 측정 생략')
+    parser.add_argument('--output', default=None, help='결과 JSON 파일 (기본: benchmarks/results/)')
+    args = parser.parse_args()
+
+    scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f'알 수 없는 시나리오: {unknown}')
+
+    logging.basicConfig(level=logging.ERROR)
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        # 사용자 캐시를 건드리지 않도록 임시 폴더의 시트 캐시 사용
+        SheetCache._default = SheetCache(os.path.join(work_dir, SheetCache.CACHE_DIR))
+        for rows in args.sizes:
+            for scenario in scenarios:
+                columns, style_variety, merged_cells = SCENARIOS[scenario]
+                case = f'{scenario},rows={rows}'
+                print(f'{case} 측정 중...')
+                path = os.path.join(work_dir, 'input.xlsx')
+                generate_workbook(path, rows, columns, style_variety, merged_cells, seed=args.seed)
+                metrics = bench_case(path, work_dir, args.repeat, not args.no_memory)
+                results.append({
+                    'case': case,
+                    'rows': rows,
+                    'columns': columns,
+                    'style_variety': style_variety,
+                    'merged_cells': merged_cells,
+                    'metrics': metrics
+                })
+                for name, value in metrics.items():
+                    print(f'  {name}: {value:,.3f}')
+
+    write_results(
+        SUITE,
+        results,
+        args.output or default_output_file(SUITE),
+        parameters={'sizes': args.sizes, 'scenarios': scenarios, 'seed': args.seed, 'repeat': args.repeat}
+    )
+
+if __name__ == '__main__':
+    main()
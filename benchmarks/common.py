@@ -0,0 +1,118 @@
+"""벤치마크 스크립트가 함께 쓰는 시간·메모리 측정과 결과 저장 도구입니다."""
+import os
+import sys
+import json
+import time
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(REPO_ROOT, 'src')
+
+# 벤치마크는 src 밖에서 실행되므로 앱 모듈을 불러올 수 있게 경로를 추가
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+
+def isolate_user_resources(work_dir):
+    """앱의 버전 정보 파일을 work_dir 안의 새 파일로 바꿔 사용자 resources를 건드리지 않게 합니다.
+
+    InquiryClassifier는 생성될 때 버전 호환성을 확인하며, 저장된 버전이 낮으면 사용자 모델 파일을 지우고
+    version_info.json을 다시 씁니다. 새 버전 파일은 현재 버전으로 만들어지므로 이 작업이 일어나지 않습니다.
+    """
+    from utils.version_manager import VersionManager
+    version_file = os.path.join(work_dir, VersionManager.VERSION_FILE)
+    VersionManager.get_version_file_path = staticmethod(lambda: version_file)
+
+def parse_sizes(value):
+    """'1000,10k,1m' 형식의 행 수 목록을 정수 목록으로 바꿉니다."""
+    sizes = []
+    for part in value.split(','):
+        part = part.strip().lower()
+        multiplier = 1
+        if part.endswith('k'):
+            multiplier, part = 1000, part[:-1]
+        elif part.endswith('m'):
+            multiplier, part = 1000000, part[:-1]
+        sizes.append(int(float(part) * multiplier))
+    return sizes
+
+def timed(func, *args, repeat=1, **kwargs):
+    """함수를 repeat번 실행해 가장 짧은 소요 시간(초)과 마지막 결과를 반환합니다."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def peak_memory(func, *args, **kwargs):
+    """tracemalloc으로 함수 실행 중 파이썬 힙 최대 증가량(바이트)을 측정합니다.
+
+    추적 비용 때문에 실행이 느려지므로 시간 측정과 따로 실행합니다.
+    """
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - baseline)
+
+def percentile(values, percent):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+def _package_version(name):
+    try:
+        module = __import__(name)
+        return getattr(module, '__version__', None)
+    except ImportError:
+        return None
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def environment_info():
+    """결과를 비교할 때 참고할 실행 환경 정보를 반환합니다."""
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'packages': {name: _package_version(name) for name in ('numpy', 'pandas', 'sklearn', 'openpyxl')},
+        'git_commit': _git_commit()
+    }
+
+def write_results(suite, results, output_file, parameters=None):
+    """측정 결과를 compare.py가 읽을 수 있는 JSON 파일로 저장합니다.
+
+    results는 {'case': 이름, 'metrics': {지표: 값}} 목록이며, 모든 지표는 값이 작을수록 좋습니다.
+    """
+    payload = {
+        'suite': suite,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment_info(),
+        'parameters': parameters or {},
+        'results': results
+    }
+    directory = os.path.dirname(os.path.abspath(output_file))
+    os.makedirs(directory, exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    print(f'결과 저장: {output_file}')
+
+def default_output_file(suite):
+    return os.path.join(REPO_ROOT, 'benchmarks', 'results', f"{suite}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
@@ -0,0 +1,60 @@
+"""두 벤치마크 결과 JSON을 비교해 지표별 변화율을 출력합니다.
+
+사용법:
+    python benchmarks/compare.py before.json after.json --threshold 0.1
+
+모든 지표는 값이 작을수록 좋으며, 기준보다 threshold 비율 이상 커진 지표가 있으면 종료 코드 1을 반환합니다.
+"""
+import sys
+import json
+import argparse
+
+def load_results(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        payload = json.load(f)
+    return payload, {result['case']: result['metrics'] for result in payload['results']}
+
+def compare(baseline_file, candidate_file, threshold):
+    baseline, baseline_cases = load_results(baseline_file)
+    candidate, candidate_cases = load_results(candidate_file)
+    if baseline['suite'] != candidate['suite']:
+        print(f"경고: 다른 벤치마크 결과입니다 ({baseline['suite']} / {candidate['suite']})")
+
+    print(f"기준: {baseline_file} ({baseline['environment'].get('git_commit')}, {baseline['created_at']})")
+    print(f"비교: {candidate_file} ({candidate['environment'].get('git_commit')}, {candidate['created_at']})")
+
+    regressions = []
+    for case, metrics in baseline_cases.items():
+        if case not in candidate_cases:
+            print(f"\n[{case}] 비교 결과에 없음")
+            continue
+        print(f"\n[{case}]")
+        for name, before in metrics.items():
+            after = candidate_cases[case].get(name)
+            if after is None:
+                continue
+            change = (after - before) / before if before else 0.0
+            marker = ''
+            if change > threshold:
+                marker = '  <-- 느려짐'
+                regressions.append((case, name, change))
+            elif change < -threshold:
+                marker = '  개선'
+            print(f"  {name:32s} {before:14,.3f} -> {after:14,.3f} ({change:+.1%}){marker}")
+
+    if regressions:
+        print(f"\n기준 대비 {threshold:.0%} 이상 나빠진 지표 {len(regressions)}개")
+        return 1
+    print('\n성능 저하 없음')
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description='벤치마크 결과 비교')
+    parser.add_argument('baseline', help='기준 결과 JSON')
+    parser.add_argument('candidate', help='비교할 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.1, help='성능 저하로 판단할 변화율 (기본 0.1 = 10%%)')
+    args = parser.parse_args()
+    sys.exit(compare(args.baseline, args.candidate, args.threshold))
+
+if __name__ == '__main__':
+    main()
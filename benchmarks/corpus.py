@@ -0,0 +1,75 @@
+"""벤치마크용 한국어 문의 데이터를 시드 기반으로 생성합니다.
+
+실제 문의처럼 인사말·기기·증상·요청 문장을 조합하고, 일부 행에는 전처리에서 잘라내는
+'os:' 정보와 '문의경로:' 꼬리말을 붙입니다. 같은 시드와 행 수면 항상 같은 데이터가 나옵니다.
+"""
+import random
+import pandas as pd
+
+CATEGORIES = {
+    '로그인/계정': {
+        'subjects': ['로그인', '비밀번호', '계정', '회원가입', '본인인증', '간편 로그인'],
+        'problems': ['이 안 돼요', '을 잊어버렸어요', '이 잠겼습니다', '인증 문자가 오지 않아요', '후 바로 로그아웃돼요']
+    },
+    '기기연결': {
+        'subjects': ['에어컨', '세탁기', '냉장고', '공기청정기', '로봇청소기', 'TV', '스마트 플러그'],
+        'problems': ['이 앱에 연결되지 않아요', ' 등록 중 오류가 나요', '이 오프라인으로 표시돼요', ' 와이파이 연결이 자꾸 끊겨요']
+    },
+    '루틴기능(모드,자동화)': {
+        'subjects': ['스마트 루틴', '외출 모드', '취침 모드', '자동화', '예약 실행'],
+        'problems': ['이 실행되지 않아요', ' 설정이 저장되지 않아요', '이 정해진 시간에 동작하지 않아요', ' 조건을 추가할 수 없어요']
+    },
+    '우리단지': {
+        'subjects': ['우리단지', '우리 단지 연결', '관리비 조회', '주차 등록', '엘리베이터 호출'],
+        'problems': ['가 안 돼요', ' 메뉴가 보이지 않아요', ' 인증이 실패해요', ' 정보가 갱신되지 않아요']
+    },
+    '알림': {
+        'subjects': ['푸시 알림', '세탁 완료 알림', '에너지 알림', '방문자 알림'],
+        'problems': ['이 오지 않아요', '이 너무 자주 와요', '을 끌 수 없어요', '이 늦게 와요']
+    },
+    '앱오류': {
+        'subjects': ['앱', '홈 화면', '설정 화면', '업데이트 후 앱', '위젯'],
+        'problems': ['이 강제 종료돼요', '이 하얀 화면에서 멈춰요', '이 너무 느려요', '에서 오류 코드가 떠요']
+    },
+    '에너지': {
+        'subjects': ['전력 사용량', '에너지 리포트', '요금 예측', '절약 모드'],
+        'problems': ['이 표시되지 않아요', '이 실제와 달라요', '을 어디서 보나요', '이 0으로 나와요']
+    }
+}
+
+GREETINGS = ['', '', '안녕하세요. ', '수고하십니다. ', '문의드립니다. ', '급합니다. ']
+DETAILS = [
+    '', '', '어제부터 그렇습니다.', '재설치해도 똑같아요.', '몇 번을 해봐도 안 됩니다.',
+    '가족 계정에서도 같은 현상입니다.', '공유기를 바꾼 뒤부터 그래요.', '확인 부탁드립니다.'
+]
+REQUESTS = ['', '방법 알려주세요.', '해결 부탁드립니다.', '빠른 답변 부탁드려요.', '어떻게 해야 하나요?']
+OS_TAILS = ['Android 13', 'Android 14', 'iOS 16.5', 'iOS 17.2', 'iPadOS 17.1']
+APP_VERSIONS = ['3.1.0', '3.2.1', '3.3.0', '3.4.2']
+INQUIRY_PATHS = ['앱 > 고객센터 > 1:1 문의', '앱 > 기기 상세 > 도움말', '웹 > 고객지원', '앱 > 설정 > 의견 보내기']
+
+def generate_inquiry(rng, category):
+    """분류 하나에 해당하는 문의 내용을 한 건 만듭니다."""
+    template = CATEGORIES[category]
+    text = (
+        f"{rng.choice(GREETINGS)}{rng.choice(template['subjects'])}{rng.choice(template['problems'])}. "
+        f"{rng.choice(DETAILS)} {rng.choice(REQUESTS)}"
+    ).strip()
+
+    # 실제 데이터처럼 일부 문의에는 기기 정보와 문의 경로가 붙음
+    roll = rng.random()
+    if roll < 0.4:
+        text += f"\nos: {rng.choice(OS_TAILS)} / 앱 버전 {rng.choice(APP_VERSIONS)}"
+    if roll < 0.2 or roll > 0.8:
+        text += f"\n문의경로: {rng.choice(INQUIRY_PATHS)}"
+    return text
+
+def generate_corpus(rows, seed=42, content_column='질문내용', category_column='분류'):
+    """rows행의 (내용, 분류) DataFrame을 만듭니다. 분류 빈도는 실제처럼 고르지 않게 분포합니다."""
+    rng = random.Random(seed)
+    categories = list(CATEGORIES)
+    weights = [1 / (rank + 1) for rank in range(len(categories))]
+    labels = rng.choices(categories, weights=weights, k=rows)
+    return pd.DataFrame({
+        content_column: [generate_inquiry(rng, label) for label in labels],
+        category_column: labels
+    })
@@ -0,0 +1,220 @@
+"""명령행(헤드리스) 실행 진입점입니다. PyQt6를 불러오지 않으므로 GUI가 없는 서버에서도 실행할 수 있습니다.
+
+예시:
+    python src/main.py classify --input 문의.xlsx --sheet Data --output 결과.xlsx
+    python src/main.py classify --input 문의.xlsx --sheet Data --output 결과.xlsx --train
+    python src/main.py classify --input 문의.csv --sheet 문의 --output 결과.csv --category-file 분류.xlsx
+    python src/main.py classify --input 문의.xlsx --sheet Data --output 결과.xlsx --train --features char_hash
+    python src/main.py train-stream --source 2023.xlsx Data --source 2024.xlsx Data
+    python src/main.py train-stream --source 2023.xlsx Data --features char_hash
+    python src/main.py serve --port 8765
+    python src/main.py compact --holdout 검증.xlsx Data
+    python src/main.py serve --compact-model src/resources/inquiry_classifier.compact
+"""
+import sys
+import time
+import logging
+import argparse
+from core import InquiryClassifier, ClassificationPipeline, ClassificationService, ExcelHandler, get_backend
+from core.features import FEATURE_EXTRACTORS, STREAMING_FEATURE_EXTRACTORS
+from utils.logging_config import setup_logging
+
+COMMANDS = ('classify', 'train-stream', 'serve', 'compact')
+
+def build_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--verbose', action='store_true', help='처리 로그를 INFO 수준까지 출력')
+    common.add_argument('--model-file', default='inquiry_classifier.joblib', help='사용할 모델 파일')
+
+    parser = argparse.ArgumentParser(prog='InquiryClassifier', description='문의 분류 프로그램 명령행 실행')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    classify = subparsers.add_parser('classify', parents=[common], help='시트의 미분류 행을 분류하여 저장')
+    classify.add_argument('--input', required=True, help='입력 파일 (xlsx, xlsm, csv, parquet)')
+    classify.add_argument('--sheet', required=True, help='분석할 데이터 시트')
+    classify.add_argument('--output', required=True, help='출력 파일 (입력 파일과 같으면 원본 업데이트)')
+    classify.add_argument('--content-column', default='질문내용', help='분류할 내용 컬럼')
+    classify.add_argument('--category-column', default='분류', help='분류 결과 컬럼')
+    classify.add_argument('--category-file', default=None, help='카테고리 목록 파일 (기본: 입력 파일)')
+    classify.add_argument('--category-sheet', default='Category', help='카테고리 목록 시트')
+    classify.add_argument('--category-list-column', default='분류3', help='카테고리 목록 컬럼')
+    classify.add_argument('--train', action='store_true', help='분류 전에 라벨이 있는 행으로 새로 학습')
+    classify.add_argument('--features', choices=list(FEATURE_EXTRACTORS), default=None,
+                          help='--train으로 새로 학습할 때의 특성 추출 방식 (기본: 현재 모델과 같은 방식)')
+    classify.add_argument('--jobs', type=int, default=None, help='분류에 사용할 프로세스 수 (기본: CPU 코어 수)')
+    classify.add_argument('--write-recommendations', action='store_true', help='추천 분류/확률 컬럼 추가')
+
+    train_stream = subparsers.add_parser('train-stream', parents=[common], help='여러 워크북을 청크 단위로 읽어 학습')
+    train_stream.add_argument('--source', nargs='+', action='append', required=True,
+                              metavar=('FILE', 'SHEET'), help='학습 파일과 (선택) 시트 이름, 여러 번 지정 가능')
+    train_stream.add_argument('--content-column', default='질문내용', help='내용 컬럼')
+    train_stream.add_argument('--category-column', default='분류', help='분류 컬럼')
+    train_stream.add_argument('--chunk-size', type=int, default=None, help='한 번에 읽을 행 수')
+    train_stream.add_argument('--features', choices=list(STREAMING_FEATURE_EXTRACTORS), default=None,
+                              help='특성 추출 방식 (기본: word_hash)')
+
+    serve = subparsers.add_parser('serve', parents=[common], help='로컬 HTTP 분류 서비스 실행')
+    serve.add_argument('--host', default=ClassificationService.DEFAULT_HOST, help='바인딩할 주소')
+    serve.add_argument('--port', type=int, default=ClassificationService.DEFAULT_PORT, help='포트 번호')
+    serve.add_argument('--max-wait-ms', type=float, default=10, help='요청을 모으는 최대 대기 시간(ms)')
+    serve.add_argument('--max-batch-size', type=int, default=512, help='한 번에 분류할 최대 텍스트 수')
+    serve.add_argument('--compact-model', default=None, metavar='DIR',
+                       help='compact 명령으로 만든 압축 모델 디렉터리를 불러와 사용')
+
+    compact = subparsers.add_parser('compact', parents=[common], help='저장된 모델을 float32 압축 형식으로 내보내기')
+    compact.add_argument('--output', default=None, help='압축 모델 디렉터리 (기본: 모델 파일 이름.compact)')
+    compact.add_argument('--holdout', nargs='+', default=None, metavar=('FILE', 'SHEET'),
+                         help='원본과 예측을 비교할 검증 파일과 (선택) 시트 이름')
+    compact.add_argument('--content-column', default='질문내용', help='검증 파일의 내용 컬럼')
+    compact.add_argument('--category-column', default='분류', help='검증 파일의 분류 컬럼 (있으면 정확도도 비교)')
+    compact.add_argument('--tolerance', type=float, default=0.0,
+                         help='분류 간 가중치 차이가 이 값(로그 단위) 이하인 특성도 제거 (기본 0: 예측 동일)')
+    return parser
+
+def print_progress(event):
+    """진행 상황을 표준 에러의 한 줄에 덮어써서 표시합니다."""
+    print(f'\r[{event.percent:3d}%] {event.describe()}'.ljust(80), end='', file=sys.stderr, flush=True)
+
+def run_classify(classifier, args):
+    if not args.train and not classifier.is_model_trained():
+        raise ValueError('학습된 모델이 없습니다. --train 옵션으로 먼저 학습해주세요.')
+    if args.features:
+        if not args.train:
+            raise ValueError('--features는 --train과 함께 사용해야 합니다.')
+        classifier.feature_extractor = args.features
+        classifier.initialize_new_model()
+
+    categories = ExcelHandler.read_categories(
+        args.category_file or args.input, args.category_sheet, args.category_list_column
+    )
+    if not categories:
+        raise ValueError('유효한 카테고리가 없습니다. 카테고리 시트와 컬럼을 확인해주세요.')
+
+    pipeline = ClassificationPipeline(
+        classifier=classifier,
+        input_file=args.input,
+        output_file=args.output,
+        selected_sheet=args.sheet,
+        content_column=args.content_column,
+        category_column=args.category_column,
+        categories=categories,
+        should_train=args.train,
+        n_jobs=args.jobs,
+        write_recommendations=args.write_recommendations,
+        progress_callback=print_progress
+    )
+    pipeline.run()
+    print(file=sys.stderr)
+    print(f'분류 완료: {pipeline.classified_count:,}건 -> {args.output}')
+    if pipeline.dedup_stats.get('rows'):
+        print(
+            f"중복 제거: {pipeline.dedup_stats['rows']:,}행 중 고유 문장 {pipeline.dedup_stats['unique']:,}건만 분류 "
+            f"({pipeline.dedup_stats['ratio']:.1%} 중복)"
+        )
+    if pipeline.cache_stats:
+        print(f"예측 캐시: 적중 {pipeline.cache_stats['hits']:,}건, 미적중 {pipeline.cache_stats['misses']:,}건")
+
+def run_train_stream(classifier, args):
+    sources = []
+    for source in args.source:
+        if len(source) > 2:
+            raise ValueError(f'--source에는 파일과 시트 이름만 지정할 수 있습니다: {source}')
+        sources.append((source[0], source[1] if len(source) > 1 else None))
+
+    trained_rows = classifier.train_streaming(
+        sources,
+        args.content_column,
+        args.category_column,
+        chunk_size=args.chunk_size,
+        progress_callback=lambda rows: print(f'\r학습 중: {rows:,}행', end='', file=sys.stderr),
+        feature_extractor=args.features
+    )
+    print(file=sys.stderr)
+    classifier.save_model()
+    print(f'학습 완료: {trained_rows:,}행, 분류 {len(classifier.model.classes_)}개, 특성 {classifier.get_feature_extractor()}')
+
+def read_holdout(args):
+    """--holdout 파일에서 (내용 목록, 분류 목록 또는 None)을 읽습니다."""
+    if len(args.holdout) > 2:
+        raise ValueError(f'--holdout에는 파일과 시트 이름만 지정할 수 있습니다: {args.holdout}')
+    backend = get_backend(args.holdout[0])
+    sheet = args.holdout[1] if len(args.holdout) > 1 else backend.sheet_names()[0]
+    df = backend.read_sheet(sheet)
+    if args.content_column not in df.columns:
+        raise ValueError(f'검증 파일에 내용 컬럼이 없습니다: {args.content_column}')
+    if args.category_column in df.columns:
+        df = df[df[args.category_column].notna()]
+        return df[args.content_column].tolist(), df[args.category_column].tolist()
+    return df[args.content_column].tolist(), None
+
+def run_compact(classifier, args):
+    holdout_texts, holdout_labels = read_holdout(args) if args.holdout else (None, None)
+    report = classifier.export_compact_model(
+        directory=args.output,
+        holdout_texts=holdout_texts,
+        holdout_labels=holdout_labels,
+        tolerance=args.tolerance
+    )
+    directory = args.output or classifier.get_compact_model_dir(classifier.model_file)
+    print(f'압축 모델 저장: {directory}')
+    print(f"특성: {report['kept_features']:,}/{report['features']:,}개 유지")
+    print(
+        f"크기: {report['original_bytes'] / 1024 ** 2:.2f}MB -> {report['compact_bytes'] / 1024 ** 2:.2f}MB "
+        f"({1 - report['compact_bytes'] / report['original_bytes']:.1%} 감소)"
+    )
+    print(
+        f"불러오기: {report['original_load_seconds'] * 1000:.1f}ms -> {report['compact_load_seconds'] * 1000:.1f}ms"
+    )
+    if 'agreement' in report:
+        print(
+            f"검증 {report['holdout_rows']:,}건: 예측 일치 {report['agreement']:.2%}, "
+            f"최대 확률 차이 {report['max_probability_diff']:.2e}, "
+            f"차이 {report['probability_tolerance']:g} 이하 {report['within_tolerance']:.2%}"
+        )
+    if 'original_accuracy' in report:
+        print(f"정확도: 원본 {report['original_accuracy']:.2%}, 압축 {report['compact_accuracy']:.2%}")
+
+def run_serve(classifier, args):
+    if args.compact_model and not classifier.load_compact_model(args.compact_model):
+        raise ValueError(f'압축 모델을 불러올 수 없습니다: {args.compact_model}')
+    service = ClassificationService(
+        classifier,
+        host=args.host,
+        port=args.port,
+        max_wait_ms=args.max_wait_ms,
+        max_batch_size=args.max_batch_size
+    )
+    print(f'분류 서비스 시작: {service.address} (POST /classify, GET /stats, 종료: Ctrl+C)')
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(f"처리 통계: {service.batcher.get_stats()}")
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    setup_logging()
+    if args.verbose:
+        logging.getLogger().setLevel(logging.INFO)
+
+    start_time = time.time()
+    try:
+        classifier = InquiryClassifier(model_file=args.model_file)
+        if args.command == 'classify':
+            run_classify(classifier, args)
+        elif args.command == 'serve':
+            run_serve(classifier, args)
+        elif args.command == 'compact':
+            run_compact(classifier, args)
+        else:
+            run_train_stream(classifier, args)
+    except Exception as e:
+        logging.error(f"Error in command line run: {str(e)}", exc_info=args.verbose)
+        print(f'오류: {str(e)}', file=sys.stderr)
+        return 1
+
+    print(f'소요 시간: {time.time() - start_time:.1f}초')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
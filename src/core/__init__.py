@@ -1,7 +1,25 @@
 # src/core/__init__.py
+import importlib
 from .classifier import InquiryClassifier
 from .excel_handler import ExcelHandler
-from .training_thread import TrainingThread
-from .retraining_thread import RetrainingThread
+from .parallel_classifier import ParallelClassifier
+from .classification_pipeline import ClassificationPipeline
+from .classification_service import ClassificationService
+from .workbook_session import WorkbookSession
+from .tabular_backends import get_backend
 
-__all__ = ['InquiryClassifier', 'TrainingThread', 'ExcelHandler', 'RetrainingThread']
\ No newline at end of file
+# Qt 스레드 클래스는 처음 사용할 때 불러옴 (명령행 실행에서는 PyQt6를 로드하지 않음)
+_QT_CLASSES = {
+    'TrainingThread': '.training_thread',
+    'RetrainingThread': '.retraining_thread',
+    'ModelLoaderThread': '.model_loader_thread',
+}
+
+def __getattr__(name):
+    if name in _QT_CLASSES:
+        return getattr(importlib.import_module(_QT_CLASSES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ['InquiryClassifier', 'TrainingThread', 'ExcelHandler', 'RetrainingThread', 'ParallelClassifier',
+           'ModelLoaderThread', 'ClassificationPipeline', 'ClassificationService',
+           'WorkbookSession', 'get_backend']
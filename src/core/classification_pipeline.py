@@ -0,0 +1,180 @@
+import os
+import logging
+import numpy as np
+import pandas as pd
+from .parallel_classifier import ParallelClassifier
+from .progress import ProgressTracker
+from .tabular_backends import get_backend
+from .workbook_session import WorkbookSession
+from utils.text_extension import TextExtension
+
+class ClassificationPipeline:
+    """시트를 읽고 (필요하면 학습한 뒤) 미분류 행을 분류해 결과를 저장하는 처리 과정입니다.
+
+    Qt에 의존하지 않으므로 GUI의 TrainingThread와 명령행 실행(cli.py)이 함께 사용합니다.
+    """
+    TOP_K = 5  # 검수 화면용으로 보관하는 추천 분류 개수
+    RECOMMENDATION_COLUMNS = 3  # 출력 파일에 쓰는 추천 분류 개수
+    CLEAN_CHUNK_SIZE = 5000  # 전처리 진행 상황을 알리는 단위
+    # (단계, 표시 이름, 전체 소요 시간 중 대략의 비중)
+    STAGES = [
+        ('read', '파일 읽기', 15),
+        ('clean', '전처리', 10),
+        ('train', '학습', 25),
+        ('classify', '분류', 30),
+        ('write', '저장', 20)
+    ]
+
+    def __init__(self, classifier, input_file, output_file, selected_sheet, content_column,
+                 category_column, categories, should_train=False, n_jobs=None,
+                 write_recommendations=False, progress_callback=None, session=None):
+        self.classifier = classifier
+        self.input_file = input_file
+        self.output_file = output_file
+        self.selected_sheet = selected_sheet
+        self.content_column = content_column
+        self.category_column = category_column
+        self.categories = categories
+        self.should_train = should_train
+        self.n_jobs = n_jobs  # 분류에 사용할 프로세스 수 (None이면 CPU 코어 수)
+        self.write_recommendations = write_recommendations  # 추천 분류/확률 컬럼을 출력에 추가할지 여부
+        self.progress_callback = progress_callback  # ProgressEvent를 받는 콜백
+        self.session = session  # 입력 파일을 이미 읽어 둔 WorkbookSession (없으면 새로 열기)
+
+        # 실행 결과
+        self.result_df = None
+        self.classified_count = 0
+        self.recommendations = {}  # 행 인덱스 -> [(분류, 확률%), ...] (write_recommendations일 때만 계산)
+        self.rule_hit_counts = {}  # 규칙별로 분류를 결정한 행 수 (중복 문장은 행마다 셈)
+        self.cache_stats = {}  # 예측 캐시 적중/미적중 행 수 (중복 문장은 행마다 셈)
+        self.dedup_stats = {}  # 분류 대상 행 수와 고유 문장 수
+
+    def add_recommendation_columns(self, df, index, recommendations):
+        """신규 분류 행에 상위 추천 분류와 확률 컬럼을 추가합니다."""
+        for rank in range(self.RECOMMENDATION_COLUMNS):
+            categories = [recs[rank][0] if rank < len(recs) else None for recs in recommendations]
+            scores = [round(recs[rank][1], 1) if rank < len(recs) else None for recs in recommendations]
+            for column, values in ((f'추천 분류 {rank + 1}', categories), (f'추천 확률 {rank + 1}', scores)):
+                # 이전 실행에서 만든 컬럼이 있으면 신규 행만 갱신
+                column_values = df[column].astype(object) if column in df.columns else pd.Series(None, index=df.index, dtype=object)
+                column_values.loc[index] = values
+                df[column] = column_values
+
+    def clean_texts(self, texts, tracker, offset=0):
+        """텍스트 목록을 청크 단위로 전처리하며 진행 상황을 알립니다."""
+        cleaned = []
+        for start in range(0, len(texts), self.CLEAN_CHUNK_SIZE):
+            cleaned.extend(TextExtension.clean_texts(texts[start:start + self.CLEAN_CHUNK_SIZE]))
+            tracker.advance(offset + len(cleaned))
+        return cleaned
+
+    @staticmethod
+    def factorize(values):
+        """값 목록을 (행별 고유값 번호 배열, 고유값 목록)으로 바꿉니다. 결측값도 하나의 값으로 취급합니다."""
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+        return codes, list(uniques)
+
+    def run(self):
+        """전체 처리를 실행하고 분류 결과가 반영된 DataFrame을 반환합니다."""
+        stages = [
+            (name, label, weight if name != 'train' or self.should_train else 0)
+            for name, label, weight in self.STAGES
+        ]
+        tracker = ProgressTracker(stages, self.progress_callback)
+
+        logging.info(f"Processing started - Input: {self.input_file}, Sheet: {self.selected_sheet}")
+        tracker.start_stage('read')
+        if (self.session is None or self.session.file_path != os.path.abspath(self.input_file)
+                or self.session.is_stale()):
+            self.session = WorkbookSession.open(self.input_file)
+        df = self.session.read_sheet(self.selected_sheet)
+
+        mask = df[self.category_column].isna()
+        train_texts = df.loc[~mask, self.content_column].tolist() if self.should_train else []
+        # 미분류 행은 같은 원문을 한 번만 전처리 (학습은 같은 문장의 빈도도 반영해야 하므로 모든 행 사용)
+        raw_codes, raw_texts = self.factorize(df.loc[mask, self.content_column])
+
+        # 텍스트 전처리 (학습 데이터와 미분류 행만)
+        logging.info("Cleaning text data")
+        tracker.start_stage('clean', len(train_texts) + len(raw_texts))
+        cleaned_train_texts = self.clean_texts(train_texts, tracker)
+        cleaned_raw_texts = self.clean_texts(raw_texts, tracker, offset=len(train_texts))
+
+        # 전처리 후 같아진 문장까지 합쳐 고유 문장만 분류하고, 결과는 행마다 다시 펼침
+        clean_codes, unique_texts = self.factorize(cleaned_raw_texts)
+        codes = clean_codes[raw_codes]
+        rows = len(codes)
+        self.dedup_stats = {
+            'rows': rows,
+            'unique': len(unique_texts),
+            'ratio': 1 - len(unique_texts) / rows if rows else 0.0
+        }
+        logging.info(
+            f"Deduplicated {rows} unclassified rows to {len(unique_texts)} unique texts "
+            f"({self.dedup_stats['ratio']:.1%} duplicates)"
+        )
+
+        if self.should_train:
+            tracker.start_stage('train')
+            self.classifier.train(cleaned_train_texts, df.loc[~mask, self.category_column])
+            self.classifier.save_model()
+            logging.info("Model trained and saved")
+
+        # 고유 문장을 샤드 단위로 분류 (문장이 많으면 여러 프로세스 사용)
+        # 추천 분류는 출력 컬럼에 쓸 때만 계산 (검수 화면은 수정하는 행만 그때 계산하며, 캐시된 추천을 재사용)
+        top_k = self.TOP_K if self.write_recommendations else 0
+        tracker.start_stage(
+            'classify',
+            len(unique_texts),
+            label=f"분류 (고유 문장 {len(unique_texts):,}/{rows:,}건, 중복 {self.dedup_stats['ratio']:.0%})"
+        )
+        self.classifier.reset_rule_hit_counts()
+        self.classifier.prediction_cache.reset_stats()
+        unique_predictions, unique_recommendations = ParallelClassifier(self.classifier, self.n_jobs).classify(
+            unique_texts,
+            categories=self.categories,
+            top_k=top_k,
+            cleaned=True,
+            progress_callback=tracker.advance,
+            counts=np.bincount(codes, minlength=len(unique_texts)) if rows else None
+        )
+        predictions = [unique_predictions[code] for code in codes]
+        classified = df[self.category_column].astype(object)
+        classified.loc[mask] = predictions
+        df[self.category_column] = classified
+        self.classified_count = len(predictions)
+
+        # 같은 분류 과정에서 계산한 확률을 검수 화면용으로도 보관
+        if top_k:
+            unclassified_index = df.index[mask]
+            recommendations = [unique_recommendations[code] for code in codes]
+            self.recommendations = dict(zip(unclassified_index, recommendations))
+            self.add_recommendation_columns(df, unclassified_index, recommendations)
+        self.rule_hit_counts = self.classifier.get_rule_hit_counts()
+        self.cache_stats = self.classifier.get_cache_stats()
+        logging.info(
+            f"Classified {len(predictions)} rows, rule hits: {self.rule_hit_counts}, "
+            f"cache: {self.cache_stats}"
+        )
+
+        tracker.start_stage('write', len(df))
+        if os.path.abspath(self.output_file) == os.path.abspath(self.input_file):
+            # 원본 업데이트: 분류 전 시트와 비교해 바뀐 셀만 반영 (엑셀 이외 형식은 다시 씀)
+            self.session.backend.update(
+                self.selected_sheet,
+                self.session.read_sheet(self.selected_sheet, copy=False),
+                df,
+                progress_callback=tracker.advance
+            )
+        else:
+            # 출력 파일 확장자에 맞는 형식으로 저장 (엑셀 원본 → 엑셀 출력은 서식 유지)
+            get_backend(self.output_file).write(
+                self.input_file,
+                self.selected_sheet,
+                df,
+                progress_callback=tracker.advance
+            )
+        tracker.finish()
+
+        self.result_df = df
+        return df
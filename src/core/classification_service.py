@@ -0,0 +1,248 @@
+import json
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from utils.text_extension import TextExtension
+
+class _PendingRequest:
+    """배치 처리를 기다리는 요청 하나입니다."""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.enqueued_at = time.perf_counter()
+        self.done = threading.Event()
+        self.predictions = None
+        self.error = None
+        self.batch_size = 0
+
+class MicroBatcher:
+    """동시에 들어온 요청을 짧은 대기 시간 동안 모아 한 번의 predict_many 호출로 분류합니다.
+
+    분류기는 배치 스레드 하나에서만 호출되므로 요청 스레드 간 동기화가 필요 없습니다.
+    """
+    DEFAULT_MAX_WAIT_MS = 10
+    DEFAULT_MAX_BATCH_SIZE = 512  # 한 배치에 담을 최대 텍스트 수
+    STATS_WINDOW = 1000  # 지연 시간 통계에 사용하는 최근 요청 수
+
+    def __init__(self, classifier, max_wait_ms=DEFAULT_MAX_WAIT_MS, max_batch_size=DEFAULT_MAX_BATCH_SIZE):
+        self.classifier = classifier
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.pending = queue.Queue()
+        self.stats_lock = threading.Lock()
+        self.latencies = deque(maxlen=self.STATS_WINDOW)
+        self.batch_sizes = deque(maxlen=self.STATS_WINDOW)
+        self.request_count = 0
+        self.text_count = 0
+        self.batch_count = 0
+        self.running = False
+        self.worker = None
+
+    def start(self):
+        self.running = True
+        self.worker = threading.Thread(target=self._run, name='MicroBatcher', daemon=True)
+        self.worker.start()
+
+    def stop(self):
+        self.running = False
+        self.pending.put(None)
+        if self.worker is not None:
+            self.worker.join()
+
+    def submit(self, texts, timeout=None):
+        """텍스트 목록을 분류 대기열에 넣고 결과가 나올 때까지 기다립니다.
+
+        (예측 목록, 요청 지연 시간(ms), 함께 처리된 배치 크기)를 반환합니다.
+        """
+        request = _PendingRequest(list(texts))
+        self.pending.put(request)
+        if not request.done.wait(timeout):
+            raise TimeoutError('분류 요청 처리 시간이 초과되었습니다.')
+        if request.error is not None:
+            raise request.error
+
+        latency_ms = (time.perf_counter() - request.enqueued_at) * 1000
+        with self.stats_lock:
+            self.latencies.append(latency_ms)
+            self.request_count += 1
+            self.text_count += len(request.texts)
+        return request.predictions, latency_ms, request.batch_size
+
+    def _collect_batch(self, first):
+        """첫 요청 이후 대기 시간 안에 들어온 요청을 배치 크기 한도까지 모읍니다."""
+        batch = [first]
+        size = len(first.texts)
+        deadline = first.enqueued_at + self.max_wait
+        while size < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                request = self.pending.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:
+                self.running = False
+                break
+            batch.append(request)
+            size += len(request.texts)
+        return batch, size
+
+    def _run(self):
+        while self.running:
+            first = self.pending.get()
+            if first is None:
+                break
+            batch, size = self._collect_batch(first)
+            try:
+                cleaned_texts = TextExtension.clean_texts([text for request in batch for text in request.texts])
+                predictions = self.classifier.predict_many(cleaned_texts)
+                offset = 0
+                for request in batch:
+                    request.predictions = predictions[offset:offset + len(request.texts)]
+                    offset += len(request.texts)
+            except Exception as e:
+                logging.error(f"Error in batch classification: {str(e)}", exc_info=True)
+                for request in batch:
+                    request.error = e
+
+            with self.stats_lock:
+                self.batch_sizes.append(size)
+                self.batch_count += 1
+            for request in batch:
+                request.batch_size = size
+                request.done.set()
+
+    @staticmethod
+    def _percentile(values, percent):
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def get_stats(self):
+        """요청 지연 시간과 배치 크기 통계를 반환합니다 (최근 STATS_WINDOW건 기준)."""
+        with self.stats_lock:
+            latencies = list(self.latencies)
+            batch_sizes = list(self.batch_sizes)
+            stats = {
+                'requests': self.request_count,
+                'texts': self.text_count,
+                'batches': self.batch_count
+            }
+        stats['latency_ms'] = {
+            'avg': round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            'p50': round(self._percentile(latencies, 50), 2),
+            'p95': round(self._percentile(latencies, 95), 2),
+            'max': round(max(latencies), 2) if latencies else 0.0
+        }
+        stats['batch_size'] = {
+            'avg': round(sum(batch_sizes) / len(batch_sizes), 2) if batch_sizes else 0.0,
+            'max': max(batch_sizes) if batch_sizes else 0
+        }
+        return stats
+
+class _ClassificationRequestHandler(BaseHTTPRequestHandler):
+    """POST /classify 로 분류, GET /stats 로 통계, GET /health 로 상태를 제공합니다."""
+    server_version = 'InquiryClassifier'
+    MAX_BODY_BYTES = 32 * 1024 * 1024
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok', 'model_trained': self.server.classifier.is_model_trained()})
+        elif self.path == '/stats':
+            stats = self.server.batcher.get_stats()
+            stats['cache'] = self.server.classifier.get_cache_stats()
+            self._send_json(200, stats)
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        if self.path != '/classify':
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            if length > self.MAX_BODY_BYTES:
+                self._send_json(413, {'error': '요청 본문이 너무 큽니다.'})
+                return
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except (ValueError, UnicodeDecodeError):
+            self._send_json(400, {'error': '잘못된 JSON 요청입니다.'})
+            return
+
+        # {"text": "..."} 단건 또는 {"texts": ["...", ...]} 일괄 요청
+        if not isinstance(payload, dict):
+            self._send_json(400, {'error': "요청 본문은 JSON 객체여야 합니다."})
+            return
+        single = 'text' in payload
+        texts = [payload['text']] if single else payload.get('texts')
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            self._send_json(400, {'error': "'text' 문자열 또는 'texts' 문자열 목록이 필요합니다."})
+            return
+
+        try:
+            predictions, latency_ms, batch_size = self.server.batcher.submit(texts, timeout=self.server.request_timeout)
+        except TimeoutError as e:
+            self._send_json(503, {'error': str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+            return
+
+        result = {'latency_ms': round(latency_ms, 2), 'batch_size': batch_size}
+        if single:
+            result['category'] = predictions[0]
+        else:
+            result['categories'] = predictions
+        self._send_json(200, result)
+
+    def log_message(self, format, *args):
+        logging.info(f"{self.address_string()} - {format % args}")
+
+class ClassificationService:
+    """모델을 한 번 불러와 로컬 HTTP로 분류 요청을 받는 서비스입니다."""
+    DEFAULT_HOST = '127.0.0.1'
+    DEFAULT_PORT = 8765
+    REQUEST_TIMEOUT = 60  # 초
+
+    def __init__(self, classifier, host=DEFAULT_HOST, port=DEFAULT_PORT,
+                 max_wait_ms=MicroBatcher.DEFAULT_MAX_WAIT_MS, max_batch_size=MicroBatcher.DEFAULT_MAX_BATCH_SIZE):
+        if not classifier.is_model_trained():
+            raise ValueError('학습된 모델이 없습니다. 먼저 모델을 학습해주세요.')
+        self.classifier = classifier
+        self.batcher = MicroBatcher(classifier, max_wait_ms=max_wait_ms, max_batch_size=max_batch_size)
+        self.server = ThreadingHTTPServer((host, port), _ClassificationRequestHandler)
+        self.server.daemon_threads = True
+        self.server.classifier = classifier
+        self.server.batcher = self.batcher
+        self.server.request_timeout = self.REQUEST_TIMEOUT
+
+    @property
+    def address(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self):
+        self.batcher.start()
+        logging.info(f"Classification service listening on {self.address}")
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            self.batcher.stop()
+
+    def shutdown(self):
+        self.server.shutdown()
@@ -1,38 +1,102 @@
 import os
 import logging
+import numpy as np
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.naive_bayes import MultinomialNB
 import joblib
 import json
+import hashlib
 from utils.resource_manager import ResourceManager
 from utils.version_manager import VersionManager
+from utils.text_extension import TextExtension
+from .tabular_backends import get_backend
+from .rule_matcher import KeywordMatcher, PatternMatcher
+from .prediction_cache import PredictionCache
+from .mapped_model import MappedVectorizer, export_mapped_model, load_mapped_model, read_mapped_meta
+from .compact_model import (export_compact_model, load_compact_model, compare_models, directory_size,
+                            directory_digest, timed_load)
+from .features import (build_vectorizer, describe_vectorizer, HASH_N_FEATURES, DEFAULT_FEATURE_EXTRACTOR,
+                       STREAMING_FEATURE_EXTRACTORS)
 
 class InquiryClassifier:
-    def __init__(self, model_file='inquiry_classifier.joblib'):
+    STREAMING_N_FEATURES = HASH_N_FEATURES  # 스트리밍 학습용 해시 특성 공간 크기
+    STREAMING_CHUNK_SIZE = 5000
+    PREDICTION_CACHE_FILE = 'prediction_cache.sqlite3'
+    RECOMMENDATION_CHUNK_SIZE = 10000  # 확률 행렬 메모리를 제한하기 위한 청크 크기
+    CACHED_TOP_K = 5  # 예측 캐시에 분류와 함께 저장하는 추천 분류 개수
+
+    def __init__(self, model_file='inquiry_classifier.joblib', lazy=False, feature_extractor=DEFAULT_FEATURE_EXTRACTOR):
+        """lazy가 True이면 모델을 불러오지 않고 빈 모델로 시작합니다.
+        이 경우 호출한 쪽에서 load_or_initialize_model()을 (보통 백그라운드에서) 한 번 호출해야 합니다.
+        feature_extractor는 새 모델을 만들 때 쓰는 특성 추출 방식입니다 (features.FEATURE_EXTRACTORS).
+        저장된 모델을 불러오면 그 모델의 방식을 그대로 씁니다.
+        """
+        self.feature_extractor = feature_extractor
         self.model_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'resources', model_file)
+        self.mapped_model_dir = self.get_mapped_model_dir(self.model_file)
         
         # 모델과 벡터라이저를 None으로 초기화
         self.model = None
         self.vectorizer = None
+        self.model_digest = None  # 저장된 모델 파일의 해시 (예측 캐시 지문에 사용)
+        self.applied_updates = set()  # 마지막 전체 학습 이후 증분 학습에 반영한 (텍스트, 분류) 키
+        self.prediction_cache = PredictionCache(
+            os.path.join(os.path.dirname(self.model_file), self.PREDICTION_CACHE_FILE)
+        )
         
         # 버전 호환성 체크
         version_updated = VersionManager.check_version_compatibility()
         if version_updated:
             logging.info("Version updated, initializing new model")
             self.initialize_new_model()
+        elif lazy:
+            self.initialize_new_model()
         else:
             self.load_or_initialize_model()
         
-        # 분류 규칙 로드
+        # 분류 규칙 로드 및 컴파일
         self.rules = self.load_classification_rules()
+        self.compile_rules()
+
+    @staticmethod
+    def get_mapped_model_dir(model_file):
+        """joblib 모델 파일에 대응하는 메모리 매핑 모델 디렉터리 경로를 반환합니다."""
+        return os.path.splitext(model_file)[0] + '.mapped'
+
+    @staticmethod
+    def get_compact_model_dir(model_file):
+        """joblib 모델 파일에 대응하는 압축 모델 디렉터리 경로를 반환합니다."""
+        return os.path.splitext(model_file)[0] + '.compact'
+
+    @classmethod
+    def for_worker(cls, model_file, rules):
+        """버전 확인 없이 저장된 모델과 주어진 규칙만 불러오는 작업 프로세스용 인스턴스를 만듭니다."""
+        classifier = cls.__new__(cls)
+        classifier.model_file = model_file
+        classifier.mapped_model_dir = cls.get_mapped_model_dir(model_file)
+        classifier.model = None
+        classifier.vectorizer = None
+        classifier.model_digest = None
+        classifier.feature_extractor = DEFAULT_FEATURE_EXTRACTOR
+        classifier.prediction_cache = PredictionCache(
+            os.path.join(os.path.dirname(model_file), cls.PREDICTION_CACHE_FILE)
+        )
+        classifier.load_model(mapped=True)
+        classifier.set_rules(rules)
+        return classifier
 
     def initialize_new_model(self):
         """새로운 모델을 초기화합니다."""
-        self.vectorizer = TfidfVectorizer(max_features=1000)
+        self.vectorizer = build_vectorizer(self.feature_extractor)
         self.model = None  # 학습되기 전까지는 None
+        self.applied_updates = set()
+        self.mark_model_changed()
         logging.info("New model initialized")
         
+    def get_feature_extractor(self):
+        """현재 벡터라이저의 특성 추출 방식 이름을 반환합니다."""
+        return describe_vectorizer(self.vectorizer)
+
     def is_model_trained(self):
         """모델이 학습되었는지 확인합니다."""
         if self.model is None or self.vectorizer is None:
@@ -77,13 +141,99 @@ class InquiryClassifier:
             logging.error(f"Error saving model: {str(e)}")
             raise
 
-    def load_model(self):
-        """저장된 모델을 불러옵니다."""
+    def save_mapped_model(self):
+        """방금 저장한 모델을 메모리 매핑 형식으로도 저장합니다. 실패해도 joblib 모델은 그대로 사용됩니다."""
+        try:
+            stat = os.stat(self.model_file)
+            export_mapped_model(self.vectorizer, self.model, self.mapped_model_dir, source_info={
+                'model_digest': self.model_digest,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns
+            })
+        except Exception as e:
+            logging.warning(f"Could not export mapped model: {str(e)}")
+
+    def load_mapped_model(self):
+        """joblib 모델과 일치하는 메모리 매핑 모델이 있으면 불러옵니다. 성공 여부를 반환합니다."""
+        try:
+            meta = read_mapped_meta(self.mapped_model_dir)
+            if meta is None or not os.path.exists(self.model_file):
+                return False
+            stat = os.stat(self.model_file)
+            source = meta.get('source', {})
+            if source.get('size') != stat.st_size or source.get('mtime_ns') != stat.st_mtime_ns:
+                logging.info("Mapped model is stale, falling back to joblib model")
+                return False
+
+            self.vectorizer, self.model, _ = load_mapped_model(self.mapped_model_dir)
+            self.model_digest = source.get('model_digest')
+            self.refresh_cache_fingerprint()
+            logging.info(f"Mapped model loaded from {self.mapped_model_dir}")
+            return True
+        except Exception as e:
+            logging.warning(f"Error loading mapped model: {str(e)}")
+            return False
+
+    def export_compact_model(self, directory=None, holdout_texts=None, holdout_labels=None, tolerance=0.0):
+        """저장된 모델을 float32·특성 가지치기 압축 형식으로 내보내고 비교 결과를 반환합니다.
+
+        결과에는 파일 크기와 불러오기 시간(원본 joblib 대비), 남긴 특성 수가 들어가며,
+        holdout_texts(원문)가 주어지면 두 모델의 예측 일치율과 확률 차이도 함께 계산합니다.
+        tolerance가 0이면 예측에 영향이 없는 특성만 빼므로 예측은 float32 반올림 범위 안에서 같습니다.
+        """
+        if not os.path.exists(self.model_file):
+            raise ValueError("저장된 모델이 없습니다. 먼저 학습 후 저장해주세요.")
+        directory = directory or self.get_compact_model_dir(self.model_file)
+
+        original_load_seconds, saved_model = timed_load(joblib.load, self.model_file)
+        vectorizer, model = saved_model['vectorizer'], saved_model['model']
+        meta = export_compact_model(vectorizer, model, directory, tolerance)
+        compact_load_seconds, (compact_vectorizer, compact_model, _) = timed_load(load_compact_model, directory)
+
+        report = {
+            'original_bytes': os.path.getsize(self.model_file),
+            'compact_bytes': directory_size(directory),
+            'original_load_seconds': original_load_seconds,
+            'compact_load_seconds': compact_load_seconds,
+            'features': meta['n_features'],
+            'kept_features': meta['kept_features'],
+            'tolerance': tolerance
+        }
+        if holdout_texts is not None:
+            processed_texts = self.preprocess_texts(TextExtension.clean_texts(holdout_texts))
+            report.update(compare_models(
+                (vectorizer, model), (compact_vectorizer, compact_model), processed_texts, holdout_labels
+            ))
+        logging.info(f"Compact model report: {report}")
+        return report
+
+    def load_compact_model(self, directory=None):
+        """압축 모델을 불러옵니다. 예측 전용이며 학습하면 같은 설정의 새 벡터라이저로 다시 학습합니다."""
+        directory = directory or self.get_compact_model_dir(self.model_file)
+        self.vectorizer, self.model, _ = load_compact_model(directory)
+        self.model_digest = f'compact:{directory_digest(directory)}'
+        self.refresh_cache_fingerprint()
+        logging.info(f"Compact model loaded from {directory}")
+        return self.is_model_trained()
+
+    def load_model(self, mapped=False):
+        """저장된 모델을 불러옵니다.
+
+        mapped가 True이면 메모리 매핑 형식을 먼저 시도합니다. 이 형식은 예측 전용이라
+        증분 학습은 할 수 없지만, 모델 크기와 관계없이 거의 일정한 시간에 불러오고
+        여러 프로세스가 같은 배열을 공유합니다.
+        """
+        if mapped and self.load_mapped_model():
+            return self.is_model_trained()
+
         try:
             if os.path.exists(self.model_file):
                 saved_model = joblib.load(self.model_file)
                 self.vectorizer = saved_model['vectorizer']
                 self.model = saved_model['model']
+                self.applied_updates = set(saved_model.get('applied_updates', ()))
+                self.model_digest = self.compute_model_digest()
+                self.refresh_cache_fingerprint()
                 
                 # 모델이 실제로 학습되었는지 확인
                 if self.is_model_trained():
@@ -99,8 +249,70 @@ class InquiryClassifier:
             logging.error(f"Error loading model: {str(e)}")
             self.model = None
             self.vectorizer = None
+            self.mark_model_changed()
             return False
 
+    def compute_model_digest(self):
+        """저장된 모델 파일의 해시를 계산합니다."""
+        try:
+            digest = hashlib.sha1()
+            with open(self.model_file, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+            return digest.hexdigest()
+        except OSError as e:
+            logging.warning(f"Could not compute model digest: {str(e)}")
+            return None
+
+    def refresh_cache_fingerprint(self):
+        """모델·분류 규칙·전처리 규칙으로 예측 캐시 지문을 갱신합니다.
+
+        메모리의 모델이 저장된 파일과 다르면(학습 후 저장 전) 지문이 None이 되어 캐시를 쓰지 않습니다.
+        """
+        preprocessing_rules = ''
+        rules_path = ResourceManager.get_resource_path('preprocessing_rules.json')
+        if rules_path and os.path.exists(rules_path):
+            with open(rules_path, 'r', encoding='utf-8') as f:
+                preprocessing_rules = f.read()
+        self.prediction_cache.set_fingerprint(
+            self.model_digest,
+            json.dumps(getattr(self, 'rules', {}), sort_keys=True, ensure_ascii=False),
+            preprocessing_rules
+        )
+
+    def mark_model_changed(self):
+        """메모리의 모델이 바뀌었음을 표시합니다. 저장 전까지 예측 캐시를 사용하지 않습니다."""
+        self.model_digest = None
+        self.refresh_cache_fingerprint()
+
+    def get_cache_stats(self):
+        """예측 캐시 적중/미적중 횟수를 반환합니다."""
+        return self.prediction_cache.get_stats()
+
+    def compile_rules(self):
+        """현재 분류 규칙을 매처로 컴파일합니다. 규칙이 바뀔 때마다 한 번만 호출됩니다."""
+        rules = self.rules.get('rules', {})
+        self.keyword_matcher = KeywordMatcher(rules.get('keyword_based', {}))
+        self.pattern_matcher = PatternMatcher(rules.get('pattern_based', {}))
+        self.refresh_cache_fingerprint()
+
+    def reset_rule_hit_counts(self):
+        """규칙별 적중 횟수를 초기화합니다."""
+        self.keyword_matcher.reset_hit_counts()
+        self.pattern_matcher.reset_hit_counts()
+
+    def get_rule_hit_counts(self):
+        """규칙 종류별로 각 규칙의 적중 횟수를 반환합니다."""
+        return {
+            'keyword_based': self.keyword_matcher.get_hit_counts(),
+            'pattern_based': self.pattern_matcher.get_hit_counts()
+        }
+
+    def set_rules(self, rules):
+        """분류 규칙을 교체하고 다시 컴파일합니다."""
+        self.rules = rules
+        self.compile_rules()
+
     def load_classification_rules(self):
         try:
             rules_path = ResourceManager.get_resource_path('classification_rules.json')
@@ -119,9 +331,16 @@ class InquiryClassifier:
         try:
             joblib.dump({
                 'vectorizer': self.vectorizer,
-                'model': self.model
+                'model': self.model,
+                'applied_updates': self.applied_updates
             }, self.model_file)
             logging.info(f"Model saved to {self.model_file}")
+            
+            # 새 모델이 저장되면 이전 예측 캐시는 무효
+            self.prediction_cache.clear()
+            self.model_digest = self.compute_model_digest()
+            self.refresh_cache_fingerprint()
+            self.save_mapped_model()
         except Exception as e:
             logging.error(f"Error saving model: {str(e)}")
             raise
@@ -132,37 +351,288 @@ class InquiryClassifier:
             return text.lower().strip()
         return ""
 
+    def preprocess_texts(self, texts):
+        """여러 텍스트를 전처리합니다. 예측과 추천에 같이 쓸 때는 preprocessed=True로 넘겨 다시 처리하지 않습니다."""
+        preprocess = self.preprocess_text
+        return [preprocess(text) for text in texts]
+
     def train(self, texts, labels):
         """모델 학습"""
         try:
-            processed_texts = [self.preprocess_text(text) for text in texts]
+            processed_texts = self.preprocess_texts(texts)
+            if isinstance(self.vectorizer, MappedVectorizer):
+                # 읽기 전용 모델이면 같은 설정의 새 벡터라이저로 학습
+                self.vectorizer = self.vectorizer.new_vectorizer()
             X = self.vectorizer.fit_transform(processed_texts)
             self.model = MultinomialNB()
             self.model.fit(X, labels)
+            self.applied_updates = set()
+            self.mark_model_changed()
             logging.info("Model training completed")
         except Exception as e:
             logging.error(f"Error during training: {str(e)}")
             self.model = None  # 학습 실패 시 모델을 None으로 설정
             raise
 
+    def _iter_labeled_chunks(self, sources, columns, category_column, chunk_size):
+        """(파일 경로, 시트 이름) 목록에서 라벨이 있는 행만 columns 컬럼으로 청크 단위로 반환합니다.
+
+        columns에는 category_column이 포함되어야 합니다.
+        """
+        for file_path, sheet_name in sources:
+            logging.info(f"Streaming training data from {file_path} [{sheet_name or 'first sheet'}]")
+            for chunk in get_backend(file_path).iter_chunks(sheet_name, columns, chunk_size):
+                chunk = chunk[chunk[category_column].notna()]
+                if not chunk.empty:
+                    yield chunk
+
+    def train_streaming(self, sources, content_column, category_column, classes=None,
+                        chunk_size=None, progress_callback=None, feature_extractor=None):
+        """메모리에 다 올릴 수 없는 학습 데이터를 청크 단위로 읽어 학습합니다.
+
+        sources는 (파일 경로, 시트 이름) 튜플 목록이며 시트 이름이 None이면 첫 시트를 씁니다.
+        어휘 사전 없이 고정 크기 해시 특성 공간을 쓰고 MultinomialNB.partial_fit으로
+        청크마다 카운트를 누적하므로, 최대 메모리 사용량은 청크 크기와 특성 공간 크기로 정해집니다.
+        classes가 없으면 분류 컬럼만 한 번 먼저 읽어 분류 목록을 만듭니다.
+        결과는 기존과 같은 형식으로 save_model()로 저장할 수 있습니다.
+        feature_extractor는 해시 방식(word_hash, char_hash)만 가능하며, 없으면 분류기 설정이
+        해시 방식일 때 그 방식을, 아니면 word_hash를 씁니다.
+        """
+        if feature_extractor is None:
+            feature_extractor = (self.feature_extractor if self.feature_extractor in STREAMING_FEATURE_EXTRACTORS
+                                 else 'word_hash')
+        if feature_extractor not in STREAMING_FEATURE_EXTRACTORS:
+            raise ValueError(f"Streaming training needs a hashed feature extractor, got: {feature_extractor}")
+        chunk_size = chunk_size or self.STREAMING_CHUNK_SIZE
+        sources = [(source, None) if isinstance(source, str) else tuple(source) for source in sources]
+        try:
+            if classes is None:
+                labels = set()
+                # 분류 목록만 필요하므로 큰 내용 컬럼은 읽지 않음
+                for chunk in self._iter_labeled_chunks(sources, [category_column], category_column, chunk_size):
+                    labels.update(chunk[category_column].astype(str))
+                classes = sorted(labels)
+            classes = [str(category) for category in classes]
+            if not classes:
+                raise ValueError("No labeled rows found for streaming training")
+            known_classes = set(classes)
+
+            vectorizer = build_vectorizer(feature_extractor, self.STREAMING_N_FEATURES)
+            model = MultinomialNB()
+
+            trained_rows = 0
+            skipped_rows = 0
+            for chunk in self._iter_labeled_chunks(
+                sources, [content_column, category_column], category_column, chunk_size
+            ):
+                labels = chunk[category_column].astype(str)
+                known = labels.isin(known_classes)
+                skipped_rows += int((~known).sum())
+                if not known.any():
+                    continue
+
+                texts = TextExtension.clean_texts(chunk.loc[known, content_column])
+                X = vectorizer.transform(self.preprocess_texts(texts))
+                model.partial_fit(X, labels[known].tolist(), classes=classes)
+
+                trained_rows += int(known.sum())
+                if progress_callback:
+                    progress_callback(trained_rows)
+
+            if trained_rows == 0:
+                raise ValueError("No rows matched the given classes")
+
+            self.vectorizer = vectorizer
+            self.model = model
+            self.applied_updates = set()
+            self.mark_model_changed()
+            logging.info(
+                f"Streaming training completed: {trained_rows} rows, {len(classes)} classes, "
+                f"{skipped_rows} rows skipped (unknown class), features: {feature_extractor}"
+            )
+            return trained_rows
+        except Exception as e:
+            logging.error(f"Error during streaming training: {str(e)}")
+            raise
+
+    def can_update(self, labels):
+        """저장된 모델에 증분 학습을 적용할 수 있는지 확인합니다.
+
+        기존 어휘와 클래스 목록을 그대로 쓰므로, 처음 보는 분류가 있으면 전체 재학습이 필요합니다.
+        """
+        if not self.is_model_trained() or not hasattr(self.model, 'partial_fit'):
+            return False
+        return set(labels).issubset(set(self.model.classes_))
+
+    @staticmethod
+    def update_key(processed_text, label):
+        """증분 학습에 반영한 행을 구분하는 (텍스트, 분류) 키를 만듭니다."""
+        return hashlib.sha1(f"{label}\x00{processed_text}".encode('utf-8')).hexdigest()
+
+    def partial_train(self, texts, labels):
+        """새로 라벨링된 데이터의 카운트 통계만 기존 모델에 더합니다.
+
+        마지막 전체 학습 이후 이미 반영한 (텍스트, 분류) 행은 다시 더하지 않으므로,
+        같은 행을 여러 번 검수해도 카운트가 부풀지 않습니다. 실제로 반영한 행 수를 반환합니다.
+        """
+        try:
+            processed_texts = self.preprocess_texts(texts)
+            labels = list(labels)
+            keys = [self.update_key(text, label) for text, label in zip(processed_texts, labels)]
+            new_rows = [i for i, key in enumerate(keys) if key not in self.applied_updates]
+            if not new_rows:
+                logging.info("All reviewed rows were already applied, model unchanged")
+                return 0
+
+            X = self.vectorizer.transform([processed_texts[i] for i in new_rows])
+            self.model.partial_fit(X, [labels[i] for i in new_rows])
+            self.applied_updates.update(keys[i] for i in new_rows)
+            self.mark_model_changed()
+            logging.info(
+                f"Incremental training completed with {len(new_rows)} rows "
+                f"({len(processed_texts) - len(new_rows)} already applied)"
+            )
+            return len(new_rows)
+        except Exception as e:
+            logging.error(f"Error during incremental training: {str(e)}")
+            raise
+
     def predict(self, text):
         try:
-            processed_text = self.preprocess_text(text).lower()
-            
-            # 키워드 기반 체크
-            keyword_rules = self.rules.get('rules', {}).get('keyword_based', {})
-            for category, keywords in keyword_rules.items():
-                if any(keyword.lower() in processed_text for keyword in keywords):
-                    return category
-            
-            # ML 모델 사용
-            text_tfidf = self.vectorizer.transform([processed_text])
-            return self.model.predict(text_tfidf)[0]
-            
+            return self.predict_many([text])[0]
         except Exception as e:
             logging.error(f"Error during prediction: {str(e)}")
             return self.rules.get('rules', {}).get('default_category', '알수없음')
 
+    def predict_many(self, texts, categories=None, use_cache=True, preprocessed=False):
+        """여러 문의 내용을 한 번에 벡터화하여 분류합니다. 추천 분류가 없는 classify_many()입니다."""
+        return self.classify_many(texts, categories=categories, use_cache=use_cache, preprocessed=preprocessed)[0]
+
+    def classify_many(self, texts, categories=None, top_k=0, use_cache=True, preprocessed=False, counts=None):
+        """여러 문의 내용을 분류합니다. (예측 목록, 상위 top_k 추천 목록 또는 None)을 반환합니다.
+
+        키워드·패턴 규칙은 캐시와 관계없이 항상 모든 텍스트에 적용하므로 규칙별 적중 횟수가 정확하고,
+        규칙에 걸리지 않은 텍스트만 모델로 분류합니다. top_k가 0보다 크면 추천 분류는 모델 확률 기준이므로
+        규칙으로 분류된 텍스트도 모델 확률을 (캐시에 없을 때만) 계산합니다.
+        categories가 주어지면 목록에 없는 분류 결과는 '알수없음'으로 바꿉니다.
+        preprocessed가 True면 texts가 이미 preprocess_texts()를 거친 것으로 봅니다.
+        counts는 중복 제거한 텍스트를 분류할 때 텍스트별 원래 행 수로, 규칙 적중·캐시 통계를 행 단위로 셉니다.
+        """
+        processed_texts = list(texts) if preprocessed else self.preprocess_texts(texts)
+
+        predictions = self._match_rules(processed_texts, counts)
+        if top_k:
+            model_positions = list(range(len(processed_texts)))
+        else:
+            model_positions = [position for position, prediction in enumerate(predictions) if prediction is None]
+
+        recommendations = [] if top_k else None
+        if model_positions:
+            labels, model_recommendations = self._predict_model(
+                [processed_texts[i] for i in model_positions], top_k, use_cache,
+                counts=None if counts is None else [counts[i] for i in model_positions]
+            )
+            for position, label in zip(model_positions, labels):
+                if predictions[position] is None:
+                    predictions[position] = label
+            if top_k:
+                recommendations = model_recommendations
+
+        if categories is not None:
+            allowed = set(categories)
+            predictions = [p if p in allowed else '알수없음' for p in predictions]
+
+        return predictions, recommendations
+
+    def recommend_many(self, texts, top_k=5, preprocessed=False, use_cache=True):
+        """여러 문의 내용의 분류별 확률 중 상위 top_k개를 (분류, 확률%) 목록으로 반환합니다 (규칙은 적용하지 않음)."""
+        processed_texts = list(texts) if preprocessed else self.preprocess_texts(texts)
+        return self._predict_model(processed_texts, top_k, use_cache)[1]
+
+    def _match_rules(self, processed_texts, counts=None):
+        """키워드 규칙, 패턴 규칙 순으로 적용합니다. 어느 규칙에도 걸리지 않은 텍스트는 None입니다."""
+        # 키워드 기반 체크 (컴파일된 매처로 컬럼 전체를 한 번에 처리)
+        predictions = self.keyword_matcher.match_series(processed_texts, weights=counts).tolist()
+        remaining = [position for position, category in enumerate(predictions) if category is None]
+
+        # 패턴 기반 체크 (키워드 규칙에 걸리지 않은 텍스트만)
+        if remaining:
+            pattern_matches = self.pattern_matcher.match_series(
+                [processed_texts[i] for i in remaining],
+                weights=None if counts is None else [counts[i] for i in remaining]
+            )
+            for position, category in zip(remaining, pattern_matches):
+                if category is not None:
+                    predictions[position] = category
+        return predictions
+
+    def _predict_model(self, processed_texts, top_k=0, use_cache=True, counts=None):
+        """텍스트를 모델로 분류합니다. (예측 목록, 상위 top_k 추천 목록 또는 None)을 반환합니다.
+
+        예측 캐시에 있는 텍스트는 바로 결과를 쓰고, 나머지만 청크마다 transform과 predict_proba를 한 번씩
+        계산해 확률이 가장 높은 분류를 예측으로, 같은 확률 행렬의 상위 분류를 추천으로 씁니다.
+        캐시에는 추천 분류도 (최소 CACHED_TOP_K개) 함께 저장하므로 나중에 추천이 필요해도 다시 계산하지 않습니다.
+        """
+        count = len(processed_texts)
+        predictions = [None] * count
+        recommendations = [None] * count
+        n_classes = len(getattr(self.model, 'classes_', ()))
+
+        entries = self.prediction_cache.lookup(processed_texts, counts) if use_cache else [None] * count
+        score_positions = []
+        for position, entry in enumerate(entries):
+            if entry is not None:
+                label, cached_recommendations = entry
+                if not top_k:
+                    predictions[position] = label
+                    continue
+                if cached_recommendations is not None and (
+                        len(cached_recommendations) >= top_k or len(cached_recommendations) == n_classes):
+                    predictions[position] = label
+                    recommendations[position] = cached_recommendations[:top_k]
+                    continue
+            score_positions.append(position)
+
+        if score_positions:
+            score_texts = [processed_texts[i] for i in score_positions]
+            # 캐시에 저장할 때만 추천 목록을 만들어 둠 (추천이 필요 없고 캐시도 꺼져 있으면 분류만 계산)
+            store = use_cache and self.prediction_cache.active
+            store_k = max(top_k, self.CACHED_TOP_K) if store else top_k
+            try:
+                classes = self.model.classes_
+                k = min(store_k, len(classes))
+                scored_labels, scored_recommendations = [], []
+                for start in range(0, len(score_texts), self.RECOMMENDATION_CHUNK_SIZE):
+                    chunk = score_texts[start:start + self.RECOMMENDATION_CHUNK_SIZE]
+                    probabilities = self.model.predict_proba(self.vectorizer.transform(chunk))
+                    if not k:
+                        scored_labels.extend(classes[probabilities.argmax(axis=1)])
+                        continue
+                    # stable 정렬이라 확률이 같으면 predict()의 argmax와 같은 (앞쪽) 분류가 선택됨
+                    top_indices = np.argsort(-probabilities, axis=1, kind='stable')[:, :k]
+                    scored_labels.extend(classes[top_indices[:, 0]])
+                    for row, indices in enumerate(top_indices):
+                        scored_recommendations.append(
+                            [(classes[i], float(probabilities[row, i] * 100)) for i in indices]
+                        )
+            except Exception as e:
+                logging.error(f"Error during batch prediction: {str(e)}")
+                # 모델 오류로 기본값이 들어간 결과는 캐시하지 않음
+                default_category = self.rules.get('rules', {}).get('default_category', '알수없음')
+                for position in score_positions:
+                    predictions[position] = default_category
+                    recommendations[position] = [("알수없음", 100.0)]
+                return predictions, recommendations if top_k else None
+
+            for offset, position in enumerate(score_positions):
+                predictions[position] = scored_labels[offset]
+                if top_k:
+                    recommendations[position] = scored_recommendations[offset][:top_k]
+            if store:
+                self.prediction_cache.store(score_texts, scored_labels, scored_recommendations)
+
+        return predictions, recommendations if top_k else None
+
 def process_file(self, input_file, output_file, content_column, category_column, should_train=False, progress_callback=None):
     """파일 처리 - 사용자가 선택한 컬럼 사용"""
     try:
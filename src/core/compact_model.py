@@ -0,0 +1,167 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import logging
+import numpy as np
+from scipy import sparse
+from .mapped_model import MappedNaiveBayes, export_vectorizer, load_vectorizer, META_FILE
+
+FORMAT = 'compact'
+FORMAT_VERSION = 1
+
+class CompactNaiveBayes(MappedNaiveBayes):
+    """float32 파라미터와 분류에 영향을 주는 특성 열만 남긴 MultinomialNB 예측 전용 모델입니다.
+
+    MultinomialNB의 log P(특성|분류)는 log(카운트 + alpha) - log(분류별 합계)이므로,
+    점수를 (남긴 특성 × 카운트 가중치) - (행의 특성 합 × 분류별 합계) + 사전 확률로 나눠 계산합니다.
+    모든 분류에서 카운트 가중치가 같은 특성은 모든 분류 점수에 같은 값을 더할 뿐이라 빼도
+    argmax와 확률이 바뀌지 않습니다. 행의 특성 합은 뺀 특성까지 포함해 계산합니다.
+    """
+
+    def __init__(self, classes, kept_features, weights, class_bias, class_log_prior):
+        super().__init__(classes, None, class_log_prior)
+        self.kept_features = kept_features
+        self.weights = weights
+        self.class_bias = class_bias
+
+    def _joint_log_likelihood(self, X):
+        X = sparse.csr_matrix(X)
+        row_sums = np.asarray(X.sum(axis=1), dtype=np.float64)
+        jll = np.asarray(X[:, self.kept_features] @ self.weights.T, dtype=np.float64)
+        jll -= row_sums * self.class_bias
+        jll += self.class_log_prior_
+        return jll
+
+def compact_naive_bayes(model, tolerance=0.0):
+    """MultinomialNB를 (남긴 특성 번호, 카운트 가중치, 분류별 합계 항)으로 나눕니다.
+
+    tolerance는 분류 간 가중치 차이(로그 단위)가 이 값 이하인 특성도 뺄 때 씁니다.
+    0이면 예측이 바뀌지 않는 특성만 빼며, 0보다 크면 모델이 더 작아지는 대신 예측이 달라질 수 있습니다.
+    카운트 정보가 없어 나눌 수 없는 모델은 feature_log_prob_를 그대로 씁니다.
+    """
+    feature_log_prob = np.asarray(model.feature_log_prob_)
+    if hasattr(model, 'feature_count_'):
+        smoothed = model.feature_count_ + np.asarray(model.alpha)
+        weights = np.log(smoothed)
+        class_bias = np.log(smoothed.sum(axis=1))
+        if not np.allclose(weights - class_bias[:, None], feature_log_prob):
+            logging.warning("Model parameters could not be decomposed, keeping all features")
+            weights, class_bias = feature_log_prob, np.zeros(len(feature_log_prob))
+    else:
+        weights, class_bias = feature_log_prob, np.zeros(len(feature_log_prob))
+
+    spread = weights.max(axis=0) - weights.min(axis=0)
+    kept_features = np.flatnonzero(spread > tolerance).astype(np.int32)
+    return (
+        kept_features,
+        np.ascontiguousarray(weights[:, kept_features], dtype=np.float32),
+        class_bias.astype(np.float32),
+        np.asarray(model.class_log_prior_, dtype=np.float32)
+    )
+
+def export_compact_model(vectorizer, model, directory, tolerance=0.0):
+    """학습된 벡터라이저와 MultinomialNB를 압축 형식 디렉터리로 저장하고 meta를 반환합니다."""
+    temp_directory = directory + '.tmp'
+    shutil.rmtree(temp_directory, ignore_errors=True)
+    os.makedirs(temp_directory)
+
+    kept_features, weights, class_bias, class_log_prior = compact_naive_bayes(model, tolerance)
+    meta = {
+        'format': FORMAT,
+        'format_version': FORMAT_VERSION,
+        'classes': np.asarray(model.classes_).tolist(),
+        'n_features': int(np.asarray(model.feature_log_prob_).shape[1]),
+        'kept_features': int(len(kept_features)),
+        'tolerance': tolerance
+    }
+    export_vectorizer(vectorizer, temp_directory, meta, float_dtype=np.float32)
+
+    np.save(os.path.join(temp_directory, 'kept_features.npy'), kept_features)
+    np.save(os.path.join(temp_directory, 'weights.npy'), weights)
+    np.save(os.path.join(temp_directory, 'class_bias.npy'), class_bias)
+    np.save(os.path.join(temp_directory, 'class_log_prior.npy'), class_log_prior)
+    with open(os.path.join(temp_directory, META_FILE), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    if os.path.exists(directory):
+        shutil.rmtree(directory)
+    os.replace(temp_directory, directory)
+    logging.info(f"Compact model exported to {directory}: {meta['kept_features']}/{meta['n_features']} features kept")
+    return meta
+
+def load_compact_model(directory):
+    """압축 모델을 불러옵니다. (벡터라이저, 모델, meta) 튜플을 반환합니다."""
+    meta_path = os.path.join(directory, META_FILE)
+    if not os.path.exists(meta_path):
+        raise FileNotFoundError(f"No compact model found in {directory}")
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta.get('format') != FORMAT or meta.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported compact model format in {directory}")
+
+    def load_array(name):
+        path = os.path.join(directory, name)
+        return np.load(path) if os.path.exists(path) else None
+
+    vectorizer = load_vectorizer(directory, meta, load_array)
+    model = CompactNaiveBayes(
+        np.array(meta['classes'], dtype=object),
+        load_array('kept_features.npy'),
+        load_array('weights.npy'),
+        load_array('class_bias.npy'),
+        load_array('class_log_prior.npy')
+    )
+    return vectorizer, model, meta
+
+def directory_size(directory):
+    return sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+
+def directory_digest(directory):
+    """압축 모델 디렉터리 파일들의 해시를 계산합니다 (예측 캐시 지문용)."""
+    digest = hashlib.sha1()
+    for entry in sorted(os.scandir(directory), key=lambda entry: entry.name):
+        if entry.is_file():
+            digest.update(entry.name.encode('utf-8'))
+            with open(entry.path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+    return digest.hexdigest()
+
+def compare_models(original, compact, texts, labels=None, probability_tolerance=1e-4):
+    """같은 (전처리된) 텍스트에 대한 두 (벡터라이저, 모델) 쌍의 예측을 비교합니다.
+
+    예측 일치율, 최대 확률 차이, 확률 차이가 probability_tolerance 이하인 행 비율과
+    (labels가 있으면) 각 모델의 정확도를 반환합니다.
+    """
+    original_vectorizer, original_model = original
+    compact_vectorizer, compact_model = compact
+    original_proba = original_model.predict_proba(original_vectorizer.transform(texts))
+    compact_proba = compact_model.predict_proba(compact_vectorizer.transform(texts))
+    original_predictions = np.asarray(original_model.classes_)[original_proba.argmax(axis=1)]
+    compact_predictions = np.asarray(compact_model.classes_)[compact_proba.argmax(axis=1)]
+    difference = np.abs(original_proba - compact_proba).max(axis=1) if len(texts) else np.zeros(0)
+
+    report = {
+        'holdout_rows': len(texts),
+        'agreement': float(np.mean(original_predictions == compact_predictions)) if len(texts) else 1.0,
+        'max_probability_diff': float(difference.max()) if len(texts) else 0.0,
+        'within_tolerance': float(np.mean(difference <= probability_tolerance)) if len(texts) else 1.0,
+        'probability_tolerance': probability_tolerance
+    }
+    if labels is not None and len(texts):
+        labels = np.asarray(labels).astype(str)
+        report['original_accuracy'] = float(np.mean(original_predictions.astype(str) == labels))
+        report['compact_accuracy'] = float(np.mean(compact_predictions.astype(str) == labels))
+    return report
+
+def timed_load(load, *args, repeat=3):
+    """load(*args)를 repeat번 실행해 가장 짧은 소요 시간(초)과 마지막 결과를 반환합니다."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = load(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
@@ -1,12 +1,23 @@
+import zipfile
 import openpyxl
 from copy import copy
+from openpyxl.cell.cell import Cell
+from .workbook_patcher import cell_changes, patch_cells
+from .sheet_cache import SheetCache
 import pandas as pd
 import logging
 
 class ExcelHandler:
+    PROGRESS_ROWS = 1000  # 저장 중 진행 상황을 알리는 행 간격
+
     @staticmethod
     def read_excel(file_path, sheet_name):
         try:
+            # 같은 파일 버전을 다시 읽으면 변환해 둔 캐시에서 불러옴 (NA 처리 옵션이 달라 별도 항목)
+            cache = SheetCache.default()
+            df = cache.load(file_path, sheet_name, variant='keep_default_na=False')
+            if df is not None:
+                return df
             # 엔진을 명시적으로 지정하고 필요한 데이터만 로드
             df = pd.read_excel(
                 file_path, 
@@ -14,11 +25,63 @@ class ExcelHandler:
                 engine='openpyxl',
                 keep_default_na=False  # NA 처리 최적화
             )
+            cache.store(file_path, sheet_name, df, variant='keep_default_na=False')
             return df
         except Exception as e:
             logging.error(f"Error reading Excel file: {str(e)}")
             raise
 
+    @staticmethod
+    def read_categories(file_path, sheet_name, column_name):
+        """카테고리 시트의 컬럼에서 정렬된 고유 분류 목록을 읽습니다.
+
+        CSV·Parquet처럼 시트가 없는 형식이면 sheet_name은 무시하고 파일 전체를 카테고리 목록으로 씁니다.
+        """
+        from .tabular_backends import get_backend  # tabular_backends가 ExcelHandler를 불러오므로 지연 import
+        try:
+            backend = get_backend(file_path)
+            df = backend.read_sheet(sheet_name if backend.HAS_SHEETS else None, columns=[column_name])
+            categories = df[column_name].dropna().unique().tolist()
+            categories.sort()
+            return categories
+        except Exception as e:
+            logging.error(f"Error reading categories: {str(e)}")
+            raise
+
+    @staticmethod
+    def iter_excel_chunks(file_path, sheet_name=None, columns=None, chunk_size=5000):
+        """시트를 read-only 모드로 스트리밍하며 chunk_size 행씩 DataFrame으로 반환합니다.
+
+        전체 시트를 메모리에 올리지 않으므로 큰 워크북도 일정한 메모리로 읽을 수 있습니다.
+        sheet_name이 None이면 첫 번째 시트를 읽습니다.
+        """
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = wb[sheet_name] if sheet_name else wb.worksheets[0]
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            header = [str(name) if name is not None else '' for name in header]
+
+            if columns is None:
+                columns = header
+            missing = [column for column in columns if column not in header]
+            if missing:
+                raise ValueError(f"Columns not found in {file_path} [{sheet.title}]: {missing}")
+            positions = [header.index(column) for column in columns]
+
+            chunk = []
+            for row in rows:
+                chunk.append([row[i] if i < len(row) else None for i in positions])
+                if len(chunk) >= chunk_size:
+                    yield pd.DataFrame(chunk, columns=columns)
+                    chunk = []
+            if chunk:
+                yield pd.DataFrame(chunk, columns=columns)
+        finally:
+            wb.close()
+
     @staticmethod
     def _safe_copy_style(source_cell, target_cell):
         """셀 스타일을 안전하게 복사합니다."""
@@ -43,8 +106,78 @@ class ExcelHandler:
             logging.warning(f"Failed to copy cell style: {str(e)}")
 
     @staticmethod
-    def save_excel_with_style(input_file, output_file, sheet_name, data, is_update=False):
-        """스타일을 유지하면서 Excel 파일을 저장합니다."""
+    def _write_rows_with_copied_styles(original_sheet, new_sheet, data, progress_callback=None):
+        """셀마다 원본 셀의 스타일을 복사하며 헤더와 데이터를 씁니다."""
+        # 먼저 헤더(컬럼명) 쓰기
+        for col_idx, column_name in enumerate(data.columns, 1):
+            new_cell = new_sheet.cell(row=1, column=col_idx, value=str(column_name))
+            try:
+                original_cell = original_sheet.cell(row=1, column=col_idx)
+                ExcelHandler._safe_copy_style(original_cell, new_cell)
+            except Exception as e:
+                logging.warning(f"Failed to copy header style at column {col_idx}: {str(e)}")
+
+        # 데이터 쓰기 (2번째 행부터)
+        for row_idx, row in enumerate(data.values, 2):
+            for col_idx, value in enumerate(row, 1):
+                new_cell = new_sheet.cell(row=row_idx, column=col_idx, value=value)
+                try:
+                    original_cell = original_sheet.cell(row=row_idx, column=col_idx)
+                    ExcelHandler._safe_copy_style(original_cell, new_cell)
+                except Exception as e:
+                    logging.warning(f"Failed to copy style at row {row_idx}, col {col_idx}: {str(e)}")
+            if progress_callback and (row_idx - 1) % ExcelHandler.PROGRESS_ROWS == 0:
+                progress_callback(row_idx - 1)
+
+    @staticmethod
+    def _write_rows_with_shared_styles(original_sheet, new_sheet, data, progress_callback=None):
+        """원본 시트의 서로 다른 스타일마다 한 번만 새 워크북 스타일을 만들고 셀에는 스타일 번호만 지정합니다.
+
+        셀마다 글꼴·테두리 등을 복사하지 않으므로, 저장 시간은 행 수와 고유 스타일 수에 비례합니다.
+        """
+        source_cells = original_sheet._cells  # 없는 셀을 새로 만들지 않도록 직접 조회
+        style_map = {}  # 원본 StyleArray -> 새 워크북 StyleArray
+
+        def apply_style(row_idx, col_idx, new_cell):
+            original_cell = source_cells.get((row_idx, col_idx))
+            if original_cell is None or not original_cell.has_style:
+                return
+            key = tuple(original_cell._style)
+            target_style = style_map.get(key)
+            if target_style is None:
+                # 새 워크북에 스타일을 등록하기 위한 임시 셀
+                template = Cell(new_sheet)
+                ExcelHandler._safe_copy_style(original_cell, template)
+                target_style = style_map[key] = template._style
+            new_cell._style = copy(target_style)
+
+        # 먼저 헤더(컬럼명) 쓰기
+        for col_idx, column_name in enumerate(data.columns, 1):
+            new_cell = new_sheet.cell(row=1, column=col_idx, value=str(column_name))
+            apply_style(1, col_idx, new_cell)
+
+        # 데이터 쓰기 (2번째 행부터)
+        new_cells = new_sheet._cells
+        column_count = len(data.columns)
+        for row_idx, row in enumerate(data.values, 2):
+            new_sheet.append(list(row))
+            for col_idx in range(1, column_count + 1):
+                if (row_idx, col_idx) in source_cells:
+                    new_cell = new_cells.get((row_idx, col_idx)) or new_sheet.cell(row=row_idx, column=col_idx)
+                    apply_style(row_idx, col_idx, new_cell)
+            if progress_callback and (row_idx - 1) % ExcelHandler.PROGRESS_ROWS == 0:
+                progress_callback(row_idx - 1)
+
+        logging.info(f"Wrote {len(data)} rows with {len(style_map)} distinct styles")
+
+    @staticmethod
+    def save_excel_with_style(input_file, output_file, sheet_name, data, is_update=False, progress_callback=None,
+                              share_styles=True):
+        """스타일을 유지하면서 Excel 파일을 저장합니다.
+
+        progress_callback이 주어지면 PROGRESS_ROWS행마다 지금까지 쓴 데이터 행 수로 호출합니다.
+        share_styles가 True면 고유 스타일별로 한 번만 복사하고, False면 이전처럼 셀마다 스타일을 복사합니다.
+        """
         try:
             # 원본 파일 로드
             original_wb = openpyxl.load_workbook(input_file)
@@ -56,6 +189,8 @@ class ExcelHandler:
                 for row_idx, row in enumerate(data.values, 2):
                     for col_idx, value in enumerate(row, 1):
                         original_sheet.cell(row=row_idx, column=col_idx, value=value)
+                    if progress_callback and (row_idx - 1) % ExcelHandler.PROGRESS_ROWS == 0:
+                        progress_callback(row_idx - 1)
                 original_wb.save(input_file)
                 logging.info(f"Successfully updated original Excel file: {input_file}")
             else:
@@ -79,24 +214,11 @@ class ExcelHandler:
                 except Exception as e:
                     logging.warning(f"Failed to copy column dimensions: {str(e)}")
 
-                # 먼저 헤더(컬럼명) 쓰기
-                for col_idx, column_name in enumerate(data.columns, 1):
-                    new_cell = new_sheet.cell(row=1, column=col_idx, value=str(column_name))
-                    try:
-                        original_cell = original_sheet.cell(row=1, column=col_idx)
-                        ExcelHandler._safe_copy_style(original_cell, new_cell)
-                    except Exception as e:
-                        logging.warning(f"Failed to copy header style at column {col_idx}: {str(e)}")
-
-                # 데이터 쓰기 (2번째 행부터)
-                for row_idx, row in enumerate(data.values, 2):
-                    for col_idx, value in enumerate(row, 1):
-                        new_cell = new_sheet.cell(row=row_idx, column=col_idx, value=value)
-                        try:
-                            original_cell = original_sheet.cell(row=row_idx, column=col_idx)
-                            ExcelHandler._safe_copy_style(original_cell, new_cell)
-                        except Exception as e:
-                            logging.warning(f"Failed to copy style at row {row_idx}, col {col_idx}: {str(e)}")
+                # 헤더와 데이터 쓰기 (데이터는 2번째 행부터)
+                if share_styles:
+                    ExcelHandler._write_rows_with_shared_styles(original_sheet, new_sheet, data, progress_callback)
+                else:
+                    ExcelHandler._write_rows_with_copied_styles(original_sheet, new_sheet, data, progress_callback)
 
                 try:
                     # 병합된 셀 복사
@@ -123,6 +245,26 @@ class ExcelHandler:
             raise
 
 
+    @staticmethod
+    def update_changed_cells(file_path, sheet_name, before, after, progress_callback=None):
+        """원본 파일에서 before와 비교해 바뀐 셀만 after 값으로 고칩니다.
+
+        시트 XML의 바뀐 셀만 교체하고 다른 시트와 파일 내용은 그대로 두므로, 소요 시간이
+        전체 행 수가 아니라 바뀐 셀 수에 비례합니다. 부분 업데이트가 불가능한 경우
+        (행 수·컬럼 순서 변경, 지원하지 않는 형식)에는 is_update 저장으로 대신합니다.
+        """
+        changes = cell_changes(before, after)
+        if changes is not None:
+            try:
+                patch_cells(file_path, sheet_name, changes)
+                return len(changes)
+            except (ValueError, KeyError, zipfile.BadZipFile) as e:
+                logging.warning(f"Delta update not possible, rewriting sheet: {str(e)}")
+        ExcelHandler.save_excel_with_style(
+            file_path, file_path, sheet_name, after, is_update=True, progress_callback=progress_callback
+        )
+        return None
+
     @staticmethod
     def update_excel(file_path, sheet_name, data):
         try:
@@ -0,0 +1,45 @@
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
+
+# 특성 추출 방식 -> 설명
+FEATURE_EXTRACTORS = {
+    'tfidf': '단어 TF-IDF (상위 1000개 단어, 메모리 학습 전용)',
+    'word_hash': '단어 해시 특성 (어휘 사전 없음)',
+    'char_hash': '문자 n-gram 해시 특성 (어휘 사전 없음, 조사가 붙은 한국어에 유리)'
+}
+DEFAULT_FEATURE_EXTRACTOR = 'tfidf'
+STREAMING_FEATURE_EXTRACTORS = ('word_hash', 'char_hash')  # 청크 학습(partial_fit)에 쓸 수 있는 방식
+
+TFIDF_MAX_FEATURES = 1000
+HASH_N_FEATURES = 2 ** 17  # 해시 특성 공간 크기 (모델 크기 = 분류 수 × 이 값 × 8바이트)
+CHAR_NGRAM_RANGE = (1, 3)  # 한글은 음절 하나가 한 글자이므로 1~3음절 조각 사용
+
+def build_vectorizer(kind=DEFAULT_FEATURE_EXTRACTOR, n_features=HASH_N_FEATURES):
+    """특성 추출 방식에 맞는 학습 전 벡터라이저를 만듭니다.
+
+    해시 방식은 어휘 사전을 만들지 않고 고정 크기 공간에 바로 대응시키므로, 학습 시간과 메모리가
+    말뭉치 크기와 관계없이 예측 가능하고 fit 없이 청크마다 transform할 수 있습니다.
+    MultinomialNB는 음수 특성을 받지 않으므로 alternate_sign은 끕니다.
+    """
+    if kind == 'tfidf':
+        return TfidfVectorizer(max_features=TFIDF_MAX_FEATURES)
+    if kind == 'word_hash':
+        return HashingVectorizer(n_features=n_features, alternate_sign=False, norm='l2')
+    if kind == 'char_hash':
+        # char_wb는 단어 경계 안에서만 n-gram을 만들므로 '결제가', '결제를'이 '결제' 조각을 공유함
+        return HashingVectorizer(
+            analyzer='char_wb',
+            ngram_range=CHAR_NGRAM_RANGE,
+            n_features=n_features,
+            alternate_sign=False,
+            norm='l2'
+        )
+    raise ValueError(f"Unknown feature extractor: {kind} (choose from {', '.join(FEATURE_EXTRACTORS)})")
+
+def describe_vectorizer(vectorizer):
+    """학습된(또는 불러온) 벡터라이저의 특성 추출 방식 이름을 반환합니다."""
+    base = getattr(vectorizer, 'base_vectorizer', vectorizer)  # 메모리 매핑 모델
+    if isinstance(base, TfidfVectorizer):
+        return 'tfidf'
+    if isinstance(base, HashingVectorizer):
+        return 'char_hash' if base.analyzer in ('char', 'char_wb') else 'word_hash'
+    return type(base).__name__
@@ -0,0 +1,196 @@
+import os
+import json
+import shutil
+import logging
+import numpy as np
+import joblib
+from scipy import sparse
+from sklearn.base import clone
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
+from sklearn.preprocessing import normalize
+
+FORMAT_VERSION = 1
+META_FILE = 'meta.json'
+VECTORIZER_FILE = 'vectorizer.joblib'  # 학습되지 않은 벡터라이저 설정 (토크나이저 재구성용)
+
+class MappedVectorizer:
+    """메모리 매핑된 어휘/IDF 배열로 TfidfVectorizer.transform과 같은 결과를 만드는 벡터라이저입니다.
+
+    어휘는 정렬된 문자열 배열로 저장되어 있어 np.searchsorted로 토큰을 한 번에 찾습니다.
+    해시 벡터라이저는 상태가 없으므로 설정만 불러와 그대로 사용합니다.
+    """
+
+    def __init__(self, meta, base_vectorizer, terms=None, term_indices=None, idf=None):
+        self.meta = meta
+        self.base_vectorizer = base_vectorizer
+        self.terms = terms
+        self.term_indices = term_indices
+        self.idf = idf
+        self.n_features = meta['n_features']
+        self._analyzer = base_vectorizer.build_analyzer()
+
+    def new_vectorizer(self):
+        """같은 설정의 학습되지 않은 sklearn 벡터라이저를 반환합니다 (재학습용)."""
+        return clone(self.base_vectorizer)
+
+    def transform(self, texts):
+        if self.meta['vectorizer_type'] == 'hashing':
+            return self.base_vectorizer.transform(texts)
+
+        rows, tokens = [], []
+        row_count = 0
+        for row, text in enumerate(texts):
+            text_tokens = self._analyzer(text)
+            tokens.extend(text_tokens)
+            rows.extend([row] * len(text_tokens))
+            row_count = row + 1
+
+        X = sparse.csr_matrix((row_count, self.n_features), dtype=np.float64)
+        if tokens and len(self.terms):
+            tokens = np.array(tokens)
+            positions = np.searchsorted(self.terms, tokens)
+            positions[positions >= len(self.terms)] = 0
+            found = self.terms[positions] == tokens
+            columns = self.term_indices[positions[found]]
+            X = sparse.csr_matrix(
+                (np.ones(len(columns), dtype=np.float64), (np.asarray(rows)[found], columns)),
+                shape=(row_count, self.n_features)
+            )
+            X.sum_duplicates()
+
+        if self.meta.get('binary'):
+            X.data[:] = 1
+        if self.meta.get('sublinear_tf'):
+            np.log(X.data, X.data)
+            X.data += 1
+        if self.idf is not None:
+            X.data *= self.idf[X.indices]
+        if self.meta.get('norm'):
+            X = normalize(X, norm=self.meta['norm'], copy=False)
+        return X
+
+class MappedNaiveBayes:
+    """메모리 매핑된 MultinomialNB 파라미터로 예측만 수행하는 읽기 전용 모델입니다."""
+
+    def __init__(self, classes, feature_log_prob, class_log_prior):
+        self.classes_ = classes
+        self.feature_log_prob_ = feature_log_prob
+        self.class_log_prior_ = class_log_prior
+
+    def _joint_log_likelihood(self, X):
+        return np.asarray(X @ self.feature_log_prob_.T) + self.class_log_prior_
+
+    def predict(self, X):
+        return self.classes_[np.argmax(self._joint_log_likelihood(X), axis=1)]
+
+    def predict_proba(self, X):
+        jll = self._joint_log_likelihood(X)
+        jll -= jll.max(axis=1, keepdims=True)
+        probabilities = np.exp(jll)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        return probabilities
+
+def export_vectorizer(vectorizer, directory, meta, float_dtype=np.float64):
+    """벡터라이저를 directory에 저장하고 meta에 설정을 기록합니다.
+
+    TF-IDF 어휘는 정렬된 문자열 배열과 열 번호 배열로, IDF는 float_dtype 배열로 저장합니다.
+    해시 벡터라이저는 상태가 없으므로 설정만 저장합니다.
+    """
+    if not isinstance(vectorizer, (TfidfVectorizer, HashingVectorizer)):
+        raise ValueError(f"Unsupported vectorizer for mapped export: {type(vectorizer).__name__}")
+
+    if isinstance(vectorizer, TfidfVectorizer):
+        vocabulary = vectorizer.vocabulary_
+        terms = np.array(sorted(vocabulary), dtype=str)
+        term_indices = np.array([vocabulary[term] for term in terms], dtype=np.int32)
+        np.save(os.path.join(directory, 'vocabulary_terms.npy'), terms)
+        np.save(os.path.join(directory, 'vocabulary_indices.npy'), term_indices)
+        if vectorizer.use_idf:
+            np.save(os.path.join(directory, 'idf.npy'), np.asarray(vectorizer.idf_, dtype=float_dtype))
+        meta.update({
+            'vectorizer_type': 'tfidf',
+            'binary': bool(vectorizer.binary),
+            'sublinear_tf': bool(vectorizer.sublinear_tf),
+            'norm': vectorizer.norm,
+            'use_idf': bool(vectorizer.use_idf)
+        })
+        joblib.dump(clone(vectorizer), os.path.join(directory, VECTORIZER_FILE))
+    else:
+        meta['vectorizer_type'] = 'hashing'
+        joblib.dump(vectorizer, os.path.join(directory, VECTORIZER_FILE))
+
+def load_vectorizer(directory, meta, load_array):
+    """export_vectorizer로 저장한 벡터라이저를 MappedVectorizer로 불러옵니다."""
+    base_vectorizer = joblib.load(os.path.join(directory, VECTORIZER_FILE))
+    return MappedVectorizer(
+        meta,
+        base_vectorizer,
+        terms=load_array('vocabulary_terms.npy'),
+        term_indices=load_array('vocabulary_indices.npy'),
+        idf=load_array('idf.npy')
+    )
+
+def export_mapped_model(vectorizer, model, directory, source_info=None):
+    """학습된 벡터라이저와 MultinomialNB를 메모리 매핑 가능한 디렉터리 형식으로 저장합니다.
+
+    숫자 파라미터는 .npy 원시 배열로, 어휘는 정렬된 문자열 배열과 열 번호 배열로 저장합니다.
+    source_info는 원본 joblib 파일과의 일치 여부 확인에 쓰이는 정보로 meta.json에 함께 기록됩니다.
+    """
+    if not isinstance(vectorizer, (TfidfVectorizer, HashingVectorizer)):
+        raise ValueError(f"Unsupported vectorizer for mapped export: {type(vectorizer).__name__}")
+
+    temp_directory = directory + '.tmp'
+    shutil.rmtree(temp_directory, ignore_errors=True)
+    os.makedirs(temp_directory)
+
+    feature_log_prob = np.ascontiguousarray(model.feature_log_prob_)
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'classes': np.asarray(model.classes_).tolist(),
+        'n_features': int(feature_log_prob.shape[1]),
+        'source': source_info or {}
+    }
+
+    export_vectorizer(vectorizer, temp_directory, meta)
+
+    np.save(os.path.join(temp_directory, 'feature_log_prob.npy'), feature_log_prob)
+    np.save(os.path.join(temp_directory, 'class_log_prior.npy'), np.asarray(model.class_log_prior_))
+    with open(os.path.join(temp_directory, META_FILE), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    if os.path.exists(directory):
+        shutil.rmtree(directory)
+    os.replace(temp_directory, directory)
+    logging.info(f"Mapped model exported to {directory}")
+
+def read_mapped_meta(directory):
+    """저장된 메모리 매핑 모델의 meta.json을 읽습니다. 없으면 None을 반환합니다."""
+    meta_path = os.path.join(directory, META_FILE)
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta.get('format_version') != FORMAT_VERSION:
+        return None
+    return meta
+
+def load_mapped_model(directory):
+    """메모리 매핑 모델을 불러옵니다. 배열은 읽기 전용으로 매핑되어 프로세스 간에 페이지가 공유됩니다.
+
+    (벡터라이저, 모델, meta) 튜플을 반환합니다.
+    """
+    meta = read_mapped_meta(directory)
+    if meta is None:
+        raise FileNotFoundError(f"No mapped model found in {directory}")
+
+    def load_array(name):
+        path = os.path.join(directory, name)
+        return np.load(path, mmap_mode='r') if os.path.exists(path) else None
+
+    vectorizer = load_vectorizer(directory, meta, load_array)
+    model = MappedNaiveBayes(
+        np.array(meta['classes'], dtype=object),
+        load_array('feature_log_prob.npy'),
+        load_array('class_log_prior.npy')
+    )
+    return vectorizer, model, meta
@@ -0,0 +1,20 @@
+# src/core/model_loader_thread.py
+import logging
+from PyQt6.QtCore import QThread, pyqtSignal
+
+class ModelLoaderThread(QThread):
+    """저장된 모델을 백그라운드에서 한 번만 불러오는 스레드"""
+    model_loaded = pyqtSignal(bool)  # 학습된 모델이 있는지 여부
+
+    def __init__(self, classifier):
+        super().__init__()
+        self.classifier = classifier
+
+    def run(self):
+        try:
+            logging.info("Loading model in background")
+            self.classifier.load_or_initialize_model()
+            self.model_loaded.emit(self.classifier.is_model_trained())
+        except Exception as e:
+            logging.error(f"Error loading model in background: {str(e)}", exc_info=True)
+            self.model_loaded.emit(False)
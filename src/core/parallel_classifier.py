@@ -0,0 +1,143 @@
+import os
+import math
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from utils.text_extension import TextExtension
+
+# 작업 프로세스마다 한 번만 불러오는 분류기
+_worker_classifier = None
+
+def _init_worker(model_file, rules, model_digest):
+    """작업 프로세스가 시작될 때 저장된 모델을 한 번만 불러옵니다.
+
+    불러온 모델이 부모 프로세스의 모델(model_digest)과 다르면 다른 모델로 분류하지 않도록 오류를 냅니다.
+    """
+    global _worker_classifier
+    from .classifier import InquiryClassifier
+    _worker_classifier = InquiryClassifier.for_worker(model_file, rules)
+    if _worker_classifier.model_digest != model_digest:
+        raise RuntimeError(f"Worker loaded a different model from {model_file}")
+
+def _classify_shard(shard):
+    """샤드 하나를 (필요하면 전처리 후) 분류합니다. 예측 결과, 추천 목록, 규칙 적중·캐시 통계를 반환합니다."""
+    texts, counts, top_k, cleaned = shard
+    _worker_classifier.reset_rule_hit_counts()
+    _worker_classifier.prediction_cache.reset_stats()
+    cleaned_texts = texts if cleaned else TextExtension.clean_texts(texts)
+    # 예측과 추천을 같은 확률 계산에서 함께 구함
+    predictions, recommendations = _worker_classifier.classify_many(cleaned_texts, top_k=top_k, counts=counts)
+    return predictions, recommendations, {
+        'keyword_hits': _worker_classifier.keyword_matcher.hit_counts,
+        'pattern_hits': _worker_classifier.pattern_matcher.hit_counts,
+        'cache': _worker_classifier.get_cache_stats()
+    }
+
+class ParallelClassifier:
+    """미분류 행을 샤드로 나눠 여러 프로세스에서 전처리·벡터화·분류합니다.
+
+    작업 프로세스는 모델을 파일에서 다시 불러오므로, 메모리의 모델이 저장된 모델 파일과 같다고 확인될 때만
+    병렬로 처리합니다(학습 후 저장 전, 저장 실패, 압축 모델 사용 등은 현재 프로세스에서 처리).
+    행 수가 적을 때도 현재 프로세스에서 그대로 처리합니다. 작업 프로세스도 같은 예측 캐시 파일을 함께 사용합니다.
+    GUI의 작업 스레드에서 fork하지 않도록 작업 프로세스는 spawn 방식으로 띄웁니다.
+    """
+    PARALLEL_MIN_ROWS = 20000  # 이보다 적으면 프로세스 기동 비용이 더 큼
+    MIN_SHARD_SIZE = 2000
+    SHARDS_PER_WORKER = 4  # 작업량 편차를 줄이기 위해 워커당 여러 샤드로 나눔
+    CHUNK_SIZE = 5000  # 현재 프로세스에서 처리할 때 진행 상황을 알리는 단위
+
+    def __init__(self, classifier, n_jobs=None):
+        self.classifier = classifier
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+
+    def model_matches_file(self):
+        """메모리의 모델이 저장된 모델 파일과 같은지 확인합니다 (작업 프로세스가 같은 모델을 쓰는 조건)."""
+        model_digest = self.classifier.model_digest
+        if model_digest is None or not os.path.exists(self.classifier.model_file):
+            return False
+        return model_digest == self.classifier.compute_model_digest()
+
+    def should_parallelize(self, row_count):
+        """병렬 처리를 사용할지 판단합니다."""
+        return (
+            self.n_jobs > 1
+            and row_count >= self.PARALLEL_MIN_ROWS
+            and self.model_matches_file()
+        )
+
+    def classify(self, texts, categories=None, top_k=0, cleaned=False, progress_callback=None, counts=None):
+        """텍스트 목록을 분류하여 입력과 같은 순서로 반환합니다. cleaned가 False면 먼저 전처리합니다.
+
+        top_k가 0보다 크면 (예측 목록, 상위 top_k 추천 목록)을, 아니면 (예측 목록, None)을 반환합니다.
+        progress_callback이 주어지면 청크(또는 샤드)가 끝날 때마다 지금까지 분류한 행 수로 호출합니다.
+        counts는 중복 제거한 텍스트별 원래 행 수로, 주어지면 규칙 적중·캐시 통계를 행 단위로 셉니다.
+        """
+        texts = list(texts)
+        counts = None if counts is None else list(counts)
+        if self.should_parallelize(len(texts)):
+            try:
+                predictions, recommendations = self._classify_parallel(texts, top_k, cleaned, progress_callback, counts)
+                if categories is not None:
+                    allowed = set(categories)
+                    predictions = [p if p in allowed else '알수없음' for p in predictions]
+                return predictions, recommendations
+            except BrokenProcessPool as e:
+                logging.warning(f"Parallel classification failed, classifying in this process: {str(e)}")
+        return self._classify_local(texts, categories, top_k, cleaned, progress_callback, counts)
+
+    def _classify_local(self, texts, categories, top_k, cleaned, progress_callback, counts):
+        """현재 프로세스에서 청크 단위로 분류합니다."""
+        predictions = []
+        recommendations = [] if top_k else None
+        for start in range(0, len(texts), self.CHUNK_SIZE):
+            chunk = texts[start:start + self.CHUNK_SIZE]
+            if not cleaned:
+                chunk = TextExtension.clean_texts(chunk)
+            chunk_predictions, chunk_recommendations = self.classifier.classify_many(
+                chunk,
+                categories=categories,
+                top_k=top_k,
+                counts=None if counts is None else counts[start:start + self.CHUNK_SIZE]
+            )
+            predictions.extend(chunk_predictions)
+            if top_k:
+                recommendations.extend(chunk_recommendations)
+            if progress_callback:
+                progress_callback(len(predictions))
+        return predictions, recommendations
+
+    def _classify_parallel(self, texts, top_k, cleaned, progress_callback, counts):
+        """샤드를 작업 프로세스들에 나눠 분류합니다. 통계는 모든 샤드가 끝난 뒤에 반영합니다."""
+        shard_size = max(self.MIN_SHARD_SIZE, math.ceil(len(texts) / (self.n_jobs * self.SHARDS_PER_WORKER)))
+        shards = [
+            (texts[start:start + shard_size], None if counts is None else counts[start:start + shard_size], top_k, cleaned)
+            for start in range(0, len(texts), shard_size)
+        ]
+        workers = min(self.n_jobs, len(shards))
+        logging.info(f"Classifying {len(texts)} rows in {len(shards)} shards with {workers} processes")
+
+        predictions = []
+        recommendations = [] if top_k else None
+        shard_stats = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(self.classifier.model_file, self.classifier.rules, self.classifier.model_digest)
+        ) as executor:
+            # map은 샤드 순서대로 결과를 돌려주므로 원래 행 순서가 유지됨
+            for shard_predictions, shard_recommendations, stats in executor.map(_classify_shard, shards):
+                predictions.extend(shard_predictions)
+                if top_k:
+                    recommendations.extend(shard_recommendations)
+                shard_stats.append(stats)
+                if progress_callback:
+                    progress_callback(len(predictions))
+
+        for stats in shard_stats:
+            self.classifier.keyword_matcher.hit_counts += stats['keyword_hits']
+            self.classifier.pattern_matcher.hit_counts += stats['pattern_hits']
+            self.classifier.prediction_cache.hits += stats['cache']['hits']
+            self.classifier.prediction_cache.misses += stats['cache']['misses']
+        return predictions, recommendations
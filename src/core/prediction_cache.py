@@ -0,0 +1,160 @@
+import os
+import time
+import sqlite3
+import json
+import hashlib
+import logging
+
+class PredictionCache:
+    """정제된 문의 텍스트별 모델 예측 결과를 저장하는 디스크 캐시입니다 (규칙으로 분류된 텍스트는 저장하지 않음).
+
+    키는 모델·분류 규칙·전처리 규칙의 지문과 텍스트를 합친 해시이므로, 어느 하나라도 바뀌면
+    이전 결과는 자동으로 적중하지 않습니다. 항목 수가 max_entries를 넘으면 가장 오래 사용되지 않은
+    항목부터 제거합니다. 여러 프로세스가 같은 파일을 함께 사용할 수 있습니다(SQLite WAL).
+    각 항목에는 분류와 함께 같은 확률 행렬에서 구한 상위 추천 분류 목록을 저장할 수 있습니다.
+    """
+    DEFAULT_MAX_ENTRIES = 200000
+    BATCH_SIZE = 500  # SQLite 바인딩 변수 개수 제한 대응
+    SCHEMA_VERSION = 2  # 테이블 구성이 바뀌면 올림 (이전 파일은 비우고 다시 만듦)
+
+    def __init__(self, cache_file, max_entries=DEFAULT_MAX_ENTRIES):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.fingerprint = None  # None이면 캐시를 사용하지 않음 (저장되지 않은 모델 등)
+        self.hits = 0
+        self.misses = 0
+        self.enabled = self._initialize()
+
+    def _connect(self):
+        return sqlite3.connect(self.cache_file, timeout=30)
+
+    def _initialize(self):
+        """캐시 파일과 테이블을 준비합니다. 실패하면 캐시 없이 동작합니다."""
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                if conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+                    conn.execute("DROP TABLE IF EXISTS predictions")
+                    conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS predictions ("
+                    "key TEXT PRIMARY KEY, label TEXT NOT NULL, recommendations TEXT, last_used INTEGER NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_predictions_last_used ON predictions(last_used)")
+            return True
+        except sqlite3.Error as e:
+            logging.warning(f"Prediction cache disabled: {str(e)}")
+            return False
+
+    @property
+    def active(self):
+        return self.enabled and self.fingerprint is not None
+
+    def set_fingerprint(self, *parts):
+        """모델·규칙 등의 구성 요소로 캐시 지문을 설정합니다. None이 있으면 캐시를 끕니다."""
+        if any(part is None for part in parts):
+            self.fingerprint = None
+            return
+        digest = hashlib.sha1()
+        for part in parts:
+            digest.update(part.encode('utf-8') if isinstance(part, str) else part)
+            digest.update(b'\0')
+        self.fingerprint = digest.hexdigest()
+
+    def make_key(self, text):
+        return hashlib.sha1(f"{self.fingerprint}\0{text}".encode('utf-8')).hexdigest()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def lookup(self, texts, counts=None):
+        """텍스트 목록의 캐시 항목을 같은 순서로 반환합니다.
+
+        항목은 (분류, [(분류, 확률%), ...] 또는 None) 튜플이며, 없는 텍스트는 None입니다.
+        counts는 적중/미적중 통계에 텍스트별로 더할 값(중복 제거 전 행 수)이며, 없으면 텍스트마다 1입니다.
+        """
+        if not self.active:
+            return [None] * len(texts)
+
+        keys = [self.make_key(text) for text in texts]
+        found = {}
+        try:
+            with self._connect() as conn:
+                unique_keys = list(dict.fromkeys(keys))
+                for start in range(0, len(unique_keys), self.BATCH_SIZE):
+                    batch = unique_keys[start:start + self.BATCH_SIZE]
+                    placeholders = ','.join('?' * len(batch))
+                    for key, label, recommendations in conn.execute(
+                        f"SELECT key, label, recommendations FROM predictions WHERE key IN ({placeholders})", batch
+                    ):
+                        found[key] = (
+                            label,
+                            [tuple(item) for item in json.loads(recommendations)] if recommendations else None
+                        )
+                if found:
+                    now = time.time_ns()
+                    conn.executemany(
+                        "UPDATE predictions SET last_used = ? WHERE key = ?",
+                        [(now, key) for key in found]
+                    )
+        except sqlite3.Error as e:
+            logging.warning(f"Prediction cache lookup failed: {str(e)}")
+            found = {}
+
+        entries = [found.get(key) for key in keys]
+        if counts is None:
+            counts = [1] * len(entries)
+        hit_count = sum(int(count) for entry, count in zip(entries, counts) if entry is not None)
+        self.hits += hit_count
+        self.misses += sum(int(count) for count in counts) - hit_count
+        return entries
+
+    def store(self, texts, labels, recommendations=None):
+        """예측 결과(와 추천 분류 목록)를 저장하고 최대 크기를 넘은 오래된 항목을 제거합니다."""
+        if not self.active or not texts:
+            return
+        if recommendations is None:
+            recommendations = [None] * len(texts)
+        now = time.time_ns()
+        try:
+            rows = [
+                (
+                    self.make_key(text),
+                    str(label),
+                    json.dumps([[str(category), score] for category, score in recs], ensure_ascii=False)
+                    if recs is not None else None,
+                    now
+                )
+                for text, label, recs in zip(texts, labels, recommendations)
+            ]
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO predictions (key, label, recommendations, last_used) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                count = conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
+                if count > self.max_entries:
+                    conn.execute(
+                        "DELETE FROM predictions WHERE key IN "
+                        "(SELECT key FROM predictions ORDER BY last_used ASC LIMIT ?)",
+                        (count - self.max_entries,)
+                    )
+                    logging.info(f"Evicted {count - self.max_entries} prediction cache entries")
+        except sqlite3.Error as e:
+            logging.warning(f"Prediction cache store failed: {str(e)}")
+
+    def clear(self):
+        """캐시의 모든 항목을 삭제합니다."""
+        if not self.enabled:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM predictions")
+            logging.info("Prediction cache cleared")
+        except sqlite3.Error as e:
+            logging.warning(f"Prediction cache clear failed: {str(e)}")
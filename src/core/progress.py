@@ -0,0 +1,134 @@
+import time
+
+class ProgressEvent:
+    """진행 상황 한 건입니다. percent는 전체 작업 기준 0~100 값입니다."""
+
+    def __init__(self, stage, label, percent, rows_done=None, rows_total=None, rows_per_sec=None, eta_seconds=None):
+        self.stage = stage
+        self.label = label
+        self.percent = percent
+        self.rows_done = rows_done
+        self.rows_total = rows_total
+        self.rows_per_sec = rows_per_sec
+        self.eta_seconds = eta_seconds
+
+    def describe(self):
+        """화면과 로그에 표시할 한 줄 설명을 반환합니다."""
+        parts = [self.label]
+        if self.rows_total:
+            parts.append(f'{self.rows_done:,}/{self.rows_total:,}행')
+        if self.rows_per_sec:
+            parts.append(f'{self.rows_per_sec:,.0f}행/초')
+        if self.eta_seconds is not None:
+            parts.append(f'남은 시간 약 {ProgressTracker.format_seconds(self.eta_seconds)}')
+        return ' · '.join(parts)
+
+class ProgressTracker:
+    """작업 단계(읽기·전처리·학습·분류·저장 등)별 실제 진행 상황을 전체 진행률로 환산합니다.
+
+    stages는 (단계 이름, 표시 이름, 가중치) 목록이며, 가중치는 전체 소요 시간 중 대략의 비중입니다.
+    단계 안의 청크 루프에서 advance(처리한 행 수)를 호출하면 처리 속도와 남은 시간을 함께 계산합니다.
+    콜백은 ProgressEvent 하나를 받으며, 단계 경계가 아니면 MIN_INTERVAL초에 한 번만 호출됩니다.
+    """
+    MIN_INTERVAL = 0.2  # 초
+
+    def __init__(self, stages, callback=None):
+        self.stages = [(name, label, weight) for name, label, weight in stages if weight > 0]
+        total_weight = sum(weight for _, _, weight in self.stages) or 1
+        self.labels = {name: label for name, label, _ in self.stages}
+        self.weights = {name: weight / total_weight * 100 for name, _, weight in self.stages}
+        self.callback = callback
+        self.completed_percent = 0.0
+        self.stage = None
+        self.stage_label = None
+        self.stage_total = None
+        self.stage_done = 0
+        self.stage_start = None
+        self.stage_finished = False
+        self.last_emit = 0.0
+        self.last_percent = 0
+
+    @staticmethod
+    def format_seconds(seconds):
+        seconds = int(round(seconds))
+        if seconds < 60:
+            return f'{seconds}초'
+        minutes, seconds = divmod(seconds, 60)
+        if minutes < 60:
+            return f'{minutes}분 {seconds}초'
+        hours, minutes = divmod(minutes, 60)
+        return f'{hours}시간 {minutes}분'
+
+    def start_stage(self, stage, total_rows=None, label=None):
+        """새 단계를 시작합니다. 이전 단계가 끝나지 않았으면 완료 처리합니다.
+
+        label을 주면 이 단계 동안 기본 표시 이름 대신 사용합니다 (처리 대상 요약 등).
+        """
+        if self.stage is not None:
+            self.finish_stage()
+        self.stage = stage
+        self.stage_label = label
+        self.stage_total = total_rows
+        self.stage_done = 0
+        self.stage_start = time.perf_counter()
+        self.stage_finished = False
+        self._emit(force=True)
+
+    def advance(self, rows_done):
+        """현재 단계에서 지금까지 처리한 행 수를 알립니다."""
+        self.stage_done = rows_done
+        self._emit()
+
+    def finish_stage(self):
+        if self.stage is None:
+            return
+        if self.stage_total:
+            self.stage_done = self.stage_total
+        self.completed_percent += self.weights.get(self.stage, 0)
+        self.stage_finished = True
+        self._emit(force=True)
+        self.stage = None
+
+    def finish(self):
+        """모든 단계를 완료 처리하고 100%를 알립니다."""
+        if self.stage is not None:
+            self.finish_stage()
+        self.completed_percent = 100.0
+        if self.callback:
+            self.callback(ProgressEvent('done', '완료', 100))
+
+    def _emit(self, force=False):
+        if not self.callback or self.stage is None:
+            return
+        now = time.perf_counter()
+        if not force and now - self.last_emit < self.MIN_INTERVAL:
+            return
+        self.last_emit = now
+
+        fraction = 0.0
+        rows_per_sec = None
+        eta_seconds = None
+        elapsed = now - self.stage_start
+        if self.stage_total:
+            fraction = min(1.0, self.stage_done / self.stage_total)
+            if self.stage_done and elapsed > 0:
+                rows_per_sec = self.stage_done / elapsed
+                eta_seconds = (self.stage_total - self.stage_done) / rows_per_sec
+
+        # 단계 완료 이벤트에서는 단계 가중치가 이미 completed_percent에 반영되어 있음
+        percent = self.completed_percent
+        if not self.stage_finished:
+            percent += self.weights.get(self.stage, 0) * fraction
+        # 진행률은 뒤로 가지 않으며, 완료 전에는 100%를 표시하지 않음
+        percent = max(self.last_percent, min(99, int(percent + 1e-6)))
+        self.last_percent = percent
+
+        self.callback(ProgressEvent(
+            self.stage,
+            self.stage_label or self.labels.get(self.stage, self.stage),
+            percent,
+            rows_done=self.stage_done if self.stage_total else None,
+            rows_total=self.stage_total,
+            rows_per_sec=rows_per_sec,
+            eta_seconds=eta_seconds
+        ))
@@ -1,77 +1,93 @@
 # src/core/training_thread.py
 import logging
-import pandas as pd
-import time
 from PyQt6.QtCore import QThread, pyqtSignal
 from utils.text_extension import TextExtension
+from .progress import ProgressTracker
 
 class RetrainingThread(QThread):
     """재학습을 위한 스레드"""
     progress_updated = pyqtSignal(int)
+    progress_detail = pyqtSignal(str)  # 현재 단계, 처리 속도, 남은 시간
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, classifier, training_data, content_column, category_column):
+    CLEAN_CHUNK_SIZE = 5000  # 전처리 진행 상황을 알리는 단위
+    # (단계, 표시 이름, 전체 소요 시간 중 대략의 비중)
+    STAGES = [
+        ('clean', '전처리', 20),
+        ('train', '학습', 60),
+        ('save', '모델 저장', 20)
+    ]
+
+    def __init__(self, classifier, training_data, content_column, category_column, update_data=None):
         super().__init__()
         self.classifier = classifier
         self.training_data = training_data
+        self.update_data = update_data  # 증분 학습에 사용할 검수(수정·확인)된 행 (None이면 전체 재학습)
         self.content_column = content_column
         self.category_column = category_column
-        self.start_time = None
-        self.is_processing_done = False
-        
-    def update_progress(self):
-        """진행률을 업데이트합니다."""
-        MAX_TIME = 97  # 1분 37초
-        FINAL_PROGRESS_TIME = 3  # 3초
-        
-        while not self.is_processing_done:
-            elapsed_time = time.time() - self.start_time
-            if elapsed_time < MAX_TIME:
-                progress = min(97, int((elapsed_time / MAX_TIME) * 100))
-                self.progress_updated.emit(progress)
-            time.sleep(1)
-            
-        # 처리가 완료되면 3초에 걸쳐 100%까지 증가
-        current_progress = min(97, int((time.time() - self.start_time) / MAX_TIME * 100))
-        steps_remaining = 100 - current_progress
-        sleep_time = FINAL_PROGRESS_TIME / steps_remaining
-        
-        for progress in range(current_progress + 1, 101):
-            self.progress_updated.emit(progress)
-            time.sleep(sleep_time)
+        self.used_incremental = False
+        self.model_unchanged = False  # 새로 반영할 행이 없어 학습·저장을 건너뛰었는지
+
+    def report_progress(self, event):
+        """단계별 진행 상황을 시그널로 전달합니다."""
+        self.progress_updated.emit(event.percent)
+        self.progress_detail.emit(event.describe())
+
+    def clean_texts(self, texts, tracker):
+        """텍스트 목록을 청크 단위로 전처리하며 진행 상황을 알립니다."""
+        texts = texts.tolist()
+        tracker.start_stage('clean', len(texts))
+        cleaned = []
+        for start in range(0, len(texts), self.CLEAN_CHUNK_SIZE):
+            cleaned.extend(TextExtension.clean_texts(texts[start:start + self.CLEAN_CHUNK_SIZE]))
+            tracker.advance(len(cleaned))
+        return cleaned
+
+    def finish_unchanged(self, tracker):
+        """모델을 바꾸지 않고 끝냅니다."""
+        self.model_unchanged = True
+        tracker.finish()
+        self.finished.emit()
 
     def run(self):
         try:
-            self.start_time = time.time()
-            self.is_processing_done = False
-            
-            # 진행률 업데이트를 위한 새 스레드 시작
-            progress_thread = QThread()
-            progress_thread.run = self.update_progress
-            progress_thread.start()
-            
+            tracker = ProgressTracker(self.STAGES, self.report_progress)
             logging.info("Starting retraining process")
             
-            # 텍스트 전처리
-            preprocessed_data = self.training_data.copy()
-            preprocessed_data[self.content_column] = preprocessed_data[self.content_column].apply(TextExtension.clean_text)
+            if self.update_data is not None and self.update_data.empty and self.classifier.is_model_trained():
+                # 검수한 행이 없으면 모델에 더할 내용이 없음
+                logging.info("No reviewed rows for incremental update, model unchanged")
+                self.finish_unchanged(tracker)
+                return
+
+            if self.update_data is not None and self.classifier.can_update(self.update_data[self.category_column]):
+                # 수정/신규 라벨 행만 기존 모델에 반영
+                update_texts = self.clean_texts(self.update_data[self.content_column], tracker)
+                tracker.start_stage('train')
+                applied = self.classifier.partial_train(update_texts, self.update_data[self.category_column])
+                if applied == 0:
+                    # 검수한 행이 모두 이전 재학습에서 이미 반영됨
+                    self.finish_unchanged(tracker)
+                    return
+                self.used_incremental = True
+            else:
+                if self.update_data is not None:
+                    logging.info("Incremental update not possible, falling back to full retraining")
+                
+                # 텍스트 전처리 후 재학습 수행
+                training_texts = self.clean_texts(self.training_data[self.content_column], tracker)
+                tracker.start_stage('train')
+                self.classifier.train(training_texts, self.training_data[self.category_column])
+                self.used_incremental = False
             
-            # 재학습 수행
-            self.classifier.train(
-                preprocessed_data[self.content_column].fillna(''),
-                preprocessed_data[self.category_column]
-            )
+            tracker.start_stage('save')
             self.classifier.save_model()
+            tracker.finish()
             logging.info("Model retrained and saved")
-            
-            # 처리 완료 표시
-            self.is_processing_done = True
-            progress_thread.wait()
 
             self.finished.emit()
             
         except Exception as e:
             logging.error(f"Error during retraining: {str(e)}", exc_info=True)
             self.error.emit(str(e))
-            self.is_processing_done = True
\ No newline at end of file
@@ -0,0 +1,149 @@
+import re
+import logging
+import numpy as np
+import pandas as pd
+from utils.regex_utils import can_combine
+
+class RuleMatcher:
+    """여러 정규식 규칙을 하나의 정규식으로 컴파일한 매처입니다.
+
+    규칙마다 이름 있는 그룹을 만들고 우선순위 순서대로 전방탐색(lookahead) 안에 나열합니다.
+    텍스트를 한 번 훑으면서 각 위치에서 가장 우선순위가 높은 규칙을 찾으므로,
+    규칙이 겹치더라도 '먼저 정의된 카테고리'가 선택됩니다.
+    이름 있는 그룹, 역참조, 중간의 전역 플래그((?i) 등)처럼 합치면 뜻이 바뀌거나 컴파일되지 않는 규칙은
+    따로 컴파일해 하나씩 검사합니다.
+    """
+
+    def __init__(self, rules, flags=0):
+        """rules는 (카테고리, 규칙 이름, 정규식 소스) 튜플을 우선순위 순서로 담은 목록입니다."""
+        self.categories = []
+        self.rule_names = []
+        self.rule_priorities = []
+        self.separate_rules = []  # 합치지 않고 따로 검사하는 (규칙 인덱스, 컴파일된 정규식), 우선순위 순
+        alternatives = []
+        category_index = {}
+
+        for category, rule_name, source in rules:
+            try:
+                compiled = re.compile(source, flags)
+            except re.error as e:
+                logging.warning(f"Skipping invalid rule '{rule_name}' for {category}: {str(e)}")
+                continue
+            if category not in category_index:
+                category_index[category] = len(self.categories)
+                self.categories.append(category)
+            rule = len(self.rule_names)
+            self.rule_names.append(rule_name)
+            self.rule_priorities.append(category_index[category])
+            if self._can_combine(source, compiled, flags):
+                alternatives.append((rule, source))
+            else:
+                logging.info(f"Rule '{rule_name}' for {category} is checked separately")
+                self.separate_rules.append((rule, compiled))
+
+        self.pattern = None
+        if alternatives:
+            try:
+                self.pattern = re.compile(
+                    f"(?=(?:{'|'.join(f'(?P<_r{rule}>{source})' for rule, source in alternatives)}))", flags
+                )
+            except re.error as e:
+                # 합칠 수 없는 경우에도 규칙을 버리지 않고 모두 따로 검사
+                logging.warning(f"Error compiling combined rules, checking rules separately: {str(e)}")
+                self.separate_rules.extend((rule, re.compile(source, flags)) for rule, source in alternatives)
+        self.separate_rules.sort(key=lambda item: (self.rule_priorities[item[0]], item[0]))
+
+        self.reset_hit_counts()
+        logging.info(f"{type(self).__name__} compiled with {len(self.rule_names)} rules")
+
+    @staticmethod
+    def _can_combine(source, compiled, flags):
+        """규칙을 합친 정규식에 넣어도 뜻이 같은지 확인합니다."""
+        return can_combine(source, compiled, flags)
+
+    def reset_hit_counts(self):
+        """규칙별 적중 횟수를 초기화합니다."""
+        self.hit_counts = np.zeros(len(self.rule_names), dtype=np.int64)
+
+    def get_hit_counts(self):
+        """규칙 이름별 적중 횟수(해당 규칙으로 분류가 결정된 행 수)를 반환합니다."""
+        return {name: int(count) for name, count in zip(self.rule_names, self.hit_counts)}
+
+    def _match_rule(self, processed_text):
+        """분류를 결정한 규칙의 인덱스를 반환합니다. 없으면 -1을 반환합니다."""
+        if not isinstance(processed_text, str):
+            return -1
+
+        best_rule = -1
+        if self.pattern is not None:
+            for match in self.pattern.finditer(processed_text):
+                rule = int(match.lastgroup[2:])
+                if best_rule < 0 or self.rule_priorities[rule] < self.rule_priorities[best_rule]:
+                    best_rule = rule
+                    if self.rule_priorities[best_rule] == 0:
+                        break
+        # 따로 검사하는 규칙은 우선순위 순이므로 처음 적중한 규칙만 비교
+        for rule, compiled in self.separate_rules:
+            if best_rule >= 0 and self.rule_priorities[rule] >= self.rule_priorities[best_rule]:
+                break
+            if compiled.search(processed_text):
+                best_rule = rule
+                break
+        return best_rule
+
+    def match(self, processed_text):
+        """전처리(소문자화)된 텍스트에 해당하는 분류를 반환합니다. 없으면 None을 반환합니다."""
+        rule = self._match_rule(processed_text)
+        if rule < 0:
+            return None
+        self.hit_counts[rule] += 1
+        return self.categories[self.rule_priorities[rule]]
+
+    def match_series(self, texts, weights=None):
+        """Series 전체에 규칙을 적용합니다. 같은 텍스트는 한 번만 검사합니다.
+
+        weights는 텍스트별로 적중 횟수에 더할 값(중복 제거 전 행 수)이며, 없으면 텍스트마다 1입니다.
+        """
+        texts = pd.Series(texts, dtype=object)
+        if not self.rule_names or texts.empty:
+            return pd.Series([None] * len(texts), index=texts.index, dtype=object)
+
+        codes, uniques = pd.factorize(texts)
+        # factorize는 결측값에 -1을 주므로 마지막 항목(-1, 미적중)으로 매핑됩니다
+        unique_rules = np.array([self._match_rule(text) for text in uniques] + [-1], dtype=np.int64)
+        row_rules = unique_rules[codes]
+
+        matched = row_rules >= 0
+        row_weights = None if weights is None else np.asarray(weights, dtype=np.float64)[matched]
+        self.hit_counts += np.bincount(
+            row_rules[matched], weights=row_weights, minlength=len(self.rule_names)
+        ).astype(np.int64)
+
+        rule_categories = np.array(
+            [self.categories[priority] for priority in self.rule_priorities] + [None], dtype=object
+        )
+        return pd.Series(rule_categories[row_rules], index=texts.index, dtype=object)
+
+class KeywordMatcher(RuleMatcher):
+    """keyword_based 규칙({카테고리: [키워드, ...]})을 컴파일한 매처입니다."""
+
+    def __init__(self, keyword_rules):
+        rules = []
+        for category, keywords in (keyword_rules or {}).items():
+            for keyword in dict.fromkeys(str(keyword).lower() for keyword in keywords):
+                rules.append((category, f"{category}: {keyword}", re.escape(keyword)))
+        super().__init__(rules)
+
+class PatternMatcher(RuleMatcher):
+    """pattern_based 규칙({카테고리: [정규식, ...]})을 컴파일한 매처입니다.
+
+    전처리된 텍스트는 소문자이므로 대소문자를 구분하지 않고 검사합니다.
+    역참조(\\1 등)나 이름 있는 그룹을 쓰는 패턴은 합치지 않고 따로 검사하므로 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, pattern_rules):
+        rules = []
+        for category, patterns in (pattern_rules or {}).items():
+            for pattern in dict.fromkeys(patterns):
+                rules.append((category, f"{category}: {pattern}", str(pattern)))
+        super().__init__(rules, flags=re.IGNORECASE)
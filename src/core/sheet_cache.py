@@ -0,0 +1,169 @@
+import os
+import hashlib
+import logging
+import threading
+import pandas as pd
+
+class SheetCache:
+    """엑셀 시트를 처음 읽을 때 열 기반 바이너리(Feather)로 변환해 두는 디스크 캐시입니다.
+
+    항목은 (파일 경로, 크기, 수정 시각, 시트 이름, 읽기 옵션)으로 식별되므로 원본 파일이 바뀌면
+    이전 변환본은 적중하지 않으며, 같은 파일의 새 버전을 저장할 때 함께 지워집니다.
+    pyarrow가 없거나 Feather로 저장할 수 없는 데이터(여러 타입이 섞인 컬럼 등)는 pickle로 저장합니다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 제거합니다.
+    """
+    DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+    CACHE_DIR = 'sheet_cache'
+    EXTENSIONS = ('.feather', '.pkl')
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self.enabled = True
+        except OSError as e:
+            logging.warning(f"Sheet cache disabled: {str(e)}")
+            self.enabled = False
+
+    @classmethod
+    def default(cls):
+        """모델 파일과 같은 resources 폴더를 쓰는 공용 캐시를 반환합니다."""
+        with cls._default_lock:
+            if cls._default is None:
+                resources_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'resources')
+                cls._default = cls(os.path.join(resources_dir, cls.CACHE_DIR))
+            return cls._default
+
+    @staticmethod
+    def _digest(*parts):
+        return hashlib.sha1('\0'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+    def _entry_prefix(self, file_path, sheet_name, variant):
+        """파일 버전과 관계없이 같은 시트·옵션이면 같은 접두어를 씁니다 (이전 버전 정리용)."""
+        return self._digest(os.path.abspath(file_path), sheet_name, variant)[:20]
+
+    def _entry_name(self, file_path, sheet_name, variant):
+        stat = os.stat(file_path)
+        version = self._digest(stat.st_size, stat.st_mtime_ns)[:12]
+        return f'{self._entry_prefix(file_path, sheet_name, variant)}-{version}'
+
+    def load(self, file_path, sheet_name, variant=''):
+        """캐시된 시트를 DataFrame으로 반환합니다. 없거나 읽을 수 없으면 None입니다."""
+        if not self.enabled:
+            return None
+        try:
+            name = self._entry_name(file_path, sheet_name, variant)
+        except OSError:
+            return None
+
+        for extension in self.EXTENSIONS:
+            path = os.path.join(self.cache_dir, name + extension)
+            if not os.path.exists(path):
+                continue
+            try:
+                df = pd.read_feather(path) if extension == '.feather' else pd.read_pickle(path)
+                os.utime(path)  # 최근 사용 시각 갱신 (제거 순서 기준)
+                self.hits += 1
+                logging.info(f"Sheet cache hit: {file_path} [{sheet_name}]")
+                return df
+            except Exception as e:
+                logging.warning(f"Removing unreadable sheet cache entry {path}: {str(e)}")
+                self._remove(path)
+        self.misses += 1
+        return None
+
+    def store(self, file_path, sheet_name, df, variant=''):
+        """시트 DataFrame을 캐시에 저장합니다. 실패해도 예외를 발생시키지 않습니다."""
+        if not self.enabled:
+            return
+        try:
+            name = self._entry_name(file_path, sheet_name, variant)
+            with self._lock:
+                path = self._write(name, df)
+                self._remove_old_versions(name)
+                self._evict(keep=path)
+            logging.info(f"Sheet cached: {file_path} [{sheet_name}] -> {os.path.basename(path)}")
+        except Exception as e:
+            logging.warning(f"Failed to cache sheet {file_path} [{sheet_name}]: {str(e)}")
+
+    def _write(self, name, df):
+        """Feather로 저장하고, 안 되면 pickle로 저장합니다. 임시 파일에 쓴 뒤 교체합니다."""
+        frame = df.reset_index(drop=True)
+        path = os.path.join(self.cache_dir, name + '.feather')
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            if all(isinstance(column, str) for column in frame.columns):
+                frame.to_feather(temp_path)
+                os.replace(temp_path, path)
+                return path
+        except Exception as e:
+            logging.debug(f"Feather not possible, using pickle: {str(e)}")
+        finally:
+            self._remove(temp_path)
+
+        path = os.path.join(self.cache_dir, name + '.pkl')
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            frame.to_pickle(temp_path)
+            os.replace(temp_path, path)
+        finally:
+            self._remove(temp_path)
+        return path
+
+    def _entries(self):
+        """캐시 파일 목록을 (경로, 크기, 최근 사용 시각)으로 반환합니다."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(self.EXTENSIONS):
+                stat = entry.stat()
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _remove_old_versions(self, name):
+        prefix = name.split('-')[0] + '-'
+        for path, _, _ in self._entries():
+            file_name = os.path.basename(path)
+            if file_name.startswith(prefix) and os.path.splitext(file_name)[0] != name:
+                self._remove(path)
+
+    def _evict(self, keep=None):
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 파일부터 지웁니다."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            self._remove(path)
+            total -= size
+            logging.info(f"Evicted sheet cache entry: {os.path.basename(path)}")
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """캐시 파일을 모두 지웁니다."""
+        with self._lock:
+            for path, _, _ in self._entries():
+                self._remove(path)
+
+    def get_stats(self):
+        entries = self._entries() if self.enabled else []
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries)
+        }
@@ -0,0 +1,206 @@
+import os
+import logging
+import pandas as pd
+from .excel_handler import ExcelHandler
+from .sheet_cache import SheetCache
+from .workbook_probe import WorkbookProbe, SheetInfo
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow가 없으면 Parquet 형식은 목록에서 빠짐
+    pq = None
+
+class TabularBackend:
+    """표 형식 파일 하나를 시트 단위로 읽고 쓰는 백엔드의 공통 인터페이스입니다.
+
+    CSV와 Parquet처럼 시트가 없는 형식은 파일 이름(확장자 제외)을 하나뿐인 시트 이름으로 씁니다.
+    """
+    NAME = ''
+    EXTENSIONS = ()
+    HAS_SHEETS = False  # 파일 하나에 시트가 여러 개 있을 수 있는 형식인지
+    SAMPLE_ROWS = WorkbookProbe.SAMPLE_ROWS
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+    @property
+    def single_sheet_name(self):
+        return os.path.splitext(os.path.basename(self.file_path))[0]
+
+    def _check_sheet(self, sheet_name):
+        if sheet_name not in (None, self.single_sheet_name):
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+
+    def sheet_names(self):
+        return [self.single_sheet_name]
+
+    def sheet_info(self, sheet_name):
+        """헤더, 대략의 행 수, 샘플 행을 빠르게 구합니다. 구할 수 없으면 None을 반환합니다."""
+        return None
+
+    def read_sheet(self, sheet_name, columns=None):
+        """시트 전체(또는 columns에 지정한 컬럼만)를 DataFrame으로 읽습니다."""
+        raise NotImplementedError
+
+    def iter_chunks(self, sheet_name=None, columns=None, chunk_size=5000):
+        """시트를 chunk_size 행씩 DataFrame으로 반환합니다 (스트리밍 학습용)."""
+        raise NotImplementedError
+
+    def write(self, source_file, sheet_name, data, progress_callback=None):
+        """data를 이 백엔드의 파일로 저장합니다. source_file은 서식을 가져올 원본 파일입니다."""
+        raise NotImplementedError
+
+    def update(self, sheet_name, before, after, progress_callback=None):
+        """원본 파일을 after 내용으로 갱신합니다. 기본 구현은 파일 전체를 다시 씁니다."""
+        self.write(self.file_path, sheet_name, after, progress_callback)
+
+class ExcelBackend(TabularBackend):
+    """서식을 유지하는 기존 엑셀 경로입니다 (ExcelHandler, WorkbookProbe, SheetCache 사용).
+
+    저장과 스트리밍 읽기가 openpyxl과 xlsx 압축 구조에 의존하므로 예전 .xls 형식은 지원하지 않습니다.
+    """
+    NAME = 'Excel'
+    EXTENSIONS = ('.xlsx', '.xlsm')
+    HAS_SHEETS = True
+
+    def __init__(self, file_path):
+        super().__init__(file_path)
+        self._probe = None
+        self._probe_failed = False
+
+    @property
+    def probe(self):
+        """xlsx 메타데이터 조회기를 반환합니다. 조회할 수 없는 파일이면 None입니다."""
+        if self._probe is None and not self._probe_failed:
+            try:
+                self._probe = WorkbookProbe(self.file_path)
+            except ValueError as e:
+                logging.info(f"Workbook probe unavailable, falling back to pandas: {str(e)}")
+                self._probe_failed = True
+        return self._probe
+
+    def sheet_names(self):
+        if self.probe is not None:
+            try:
+                sheet_names = self.probe.sheet_names
+                if sheet_names:
+                    return sheet_names
+            except Exception as e:
+                logging.warning(f"Failed to probe sheet names: {str(e)}")
+        with pd.ExcelFile(self.file_path) as xls:
+            return list(xls.sheet_names)
+
+    def sheet_info(self, sheet_name):
+        if self.probe is None:
+            return None
+        return self.probe.sheet_info(sheet_name, self.SAMPLE_ROWS)
+
+    def read_sheet(self, sheet_name, columns=None):
+        """시트를 읽습니다. 한 번 읽은 시트는 SheetCache에서 열 기반 파일로 바로 불러옵니다.
+
+        sheet_name이 None이면 iter_chunks와 같이 첫 번째 시트를 읽습니다.
+        """
+        if sheet_name is None:
+            sheet_name = self.sheet_names()[0]
+        cache = SheetCache.default()
+        df = cache.load(self.file_path, sheet_name)
+        if df is None:
+            df = pd.read_excel(self.file_path, sheet_name=sheet_name)
+            cache.store(self.file_path, sheet_name, df)
+        return df[columns] if columns is not None else df
+
+    def iter_chunks(self, sheet_name=None, columns=None, chunk_size=5000):
+        return ExcelHandler.iter_excel_chunks(self.file_path, sheet_name, columns, chunk_size)
+
+    def write(self, source_file, sheet_name, data, progress_callback=None):
+        if isinstance(get_backend(source_file), ExcelBackend):
+            ExcelHandler.save_excel_with_style(
+                source_file, self.file_path, sheet_name, data, progress_callback=progress_callback
+            )
+        else:
+            # 다른 형식에서 변환하는 경우 가져올 서식이 없음
+            data.to_excel(self.file_path, sheet_name=sheet_name, index=False)
+
+    def update(self, sheet_name, before, after, progress_callback=None):
+        ExcelHandler.update_changed_cells(self.file_path, sheet_name, before, after, progress_callback)
+
+class CsvBackend(TabularBackend):
+    """CSV 파일 백엔드입니다. 엑셀에서 한글이 깨지지 않도록 BOM이 있는 UTF-8로 씁니다."""
+    NAME = 'CSV'
+    EXTENSIONS = ('.csv',)
+    ENCODING = 'utf-8-sig'
+
+    def sheet_info(self, sheet_name):
+        self._check_sheet(sheet_name)
+        sample = pd.read_csv(self.file_path, encoding=self.ENCODING, nrows=self.SAMPLE_ROWS)
+        sample = sample.astype(object).where(sample.notna(), None)
+        return SheetInfo(self.single_sheet_name, sample.columns.tolist(), None, sample.values.tolist())
+
+    def read_sheet(self, sheet_name, columns=None):
+        self._check_sheet(sheet_name)
+        return pd.read_csv(self.file_path, encoding=self.ENCODING, usecols=columns)
+
+    def iter_chunks(self, sheet_name=None, columns=None, chunk_size=5000):
+        self._check_sheet(sheet_name)
+        yield from pd.read_csv(self.file_path, encoding=self.ENCODING, usecols=columns, chunksize=chunk_size)
+
+    def write(self, source_file, sheet_name, data, progress_callback=None):
+        data.to_csv(self.file_path, index=False, encoding=self.ENCODING)
+
+class ParquetBackend(TabularBackend):
+    """Parquet 파일 백엔드입니다. pyarrow가 설치된 경우에만 사용할 수 있습니다."""
+    NAME = 'Parquet'
+    EXTENSIONS = ('.parquet',)
+
+    def sheet_info(self, sheet_name):
+        self._check_sheet(sheet_name)
+        parquet_file = pq.ParquetFile(self.file_path)
+        sample = next(parquet_file.iter_batches(batch_size=self.SAMPLE_ROWS), None)
+        sample_rows = [list(row.values()) for row in sample.to_pylist()] if sample is not None else []
+        return SheetInfo(
+            self.single_sheet_name,
+            parquet_file.schema_arrow.names,
+            parquet_file.metadata.num_rows,
+            sample_rows
+        )
+
+    def read_sheet(self, sheet_name, columns=None):
+        self._check_sheet(sheet_name)
+        return pd.read_parquet(self.file_path, columns=columns)
+
+    def iter_chunks(self, sheet_name=None, columns=None, chunk_size=5000):
+        self._check_sheet(sheet_name)
+        for batch in pq.ParquetFile(self.file_path).iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+
+    def write(self, source_file, sheet_name, data, progress_callback=None):
+        data.to_parquet(self.file_path, index=False)
+
+BACKENDS = [ExcelBackend, CsvBackend] + ([ParquetBackend] if pq is not None else [])
+
+def get_backend(file_path):
+    """파일 확장자에 맞는 백엔드를 반환합니다. 지원하지 않는 형식이면 ValueError를 발생시킵니다."""
+    extension = os.path.splitext(file_path)[1].lower()
+    for backend in BACKENDS:
+        if extension in backend.EXTENSIONS:
+            return backend(file_path)
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {extension or file_path}")
+
+def file_dialog_filter(for_output=False):
+    """파일 선택 대화상자용 필터 문자열을 반환합니다."""
+    filters = [
+        f"{backend.NAME} Files ({' '.join('*' + extension for extension in backend.EXTENSIONS)})"
+        for backend in BACKENDS if backend is not ExcelBackend
+    ]
+    if for_output:
+        # 저장은 서식을 유지할 수 있는 xlsx를 기본으로 함
+        return ';;'.join(['Excel Files (*.xlsx)'] + filters)
+    extensions = ' '.join('*' + extension for backend in BACKENDS for extension in backend.EXTENSIONS)
+    return ';;'.join([f'Data Files ({extensions})', 'Excel Files (*.xlsx *.xlsm)'] + filters)
+
+def output_file_name(file_name):
+    """저장할 파일 이름에 지원하는 확장자가 없으면 .xlsx를 붙입니다."""
+    extension = os.path.splitext(file_name)[1].lower()
+    if any(extension in backend.EXTENSIONS for backend in BACKENDS):
+        return file_name
+    return file_name + '.xlsx'
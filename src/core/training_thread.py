@@ -1,18 +1,17 @@
 # src/core/training_thread.py
 import logging
-import pandas as pd
-import time
 from PyQt6.QtCore import QThread, pyqtSignal
-from .excel_handler import ExcelHandler
-from utils.text_extension import TextExtension
+from .classification_pipeline import ClassificationPipeline
 
 class TrainingThread(QThread):
     progress_updated = pyqtSignal(int)
+    progress_detail = pyqtSignal(str)  # 현재 단계, 처리 속도, 남은 시간
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
     def __init__(self, classifier, input_file, output_file, should_train, selected_sheet, 
-                content_column, category_column, categories):
+                content_column, category_column, categories, n_jobs=None,
+                write_recommendations=False, session=None):
         super().__init__()
         self.classifier = classifier
         self.input_file = input_file
@@ -22,82 +21,45 @@ class TrainingThread(QThread):
         self.content_column = content_column
         self.category_column = category_column
         self.categories = categories
-        self.start_time = None
-        self.is_processing_done = False
-        
-    def update_progress(self):
-        MAX_TIME = 97  # 1분 37초
-        FINAL_PROGRESS_TIME = 3  # 3초
-        
-        while not self.is_processing_done:
-            elapsed_time = time.time() - self.start_time
-            if elapsed_time < MAX_TIME:
-                progress = min(97, int((elapsed_time / MAX_TIME) * 100))
-                self.progress_updated.emit(progress)
-            time.sleep(1)
-            
-        # 처리가 완료되면 3초에 걸쳐 100%까지 증가
-        current_progress = min(97, int((time.time() - self.start_time) / MAX_TIME * 100))
-        steps_remaining = 100 - current_progress
-        sleep_time = FINAL_PROGRESS_TIME / steps_remaining
-        
-        for progress in range(current_progress + 1, 101):
-            self.progress_updated.emit(progress)
-            time.sleep(sleep_time)
+        self.n_jobs = n_jobs  # 분류에 사용할 프로세스 수 (None이면 CPU 코어 수)
+        self.write_recommendations = write_recommendations  # 추천 분류/확률 컬럼을 출력에 추가할지 여부
+        self.session = session  # 입력 파일의 WorkbookSession (시트를 다시 읽지 않기 위해 공유)
+        self.result_df = None  # 분류 결과가 반영된 데이터 시트
+        self.recommendations = {}  # 행 인덱스 -> [(분류, 확률%), ...]
+        self.rule_hit_counts = {}
+        self.cache_stats = {}
+        self.dedup_stats = {}
+
+    def report_progress(self, event):
+        """파이프라인 단계별 진행 상황을 시그널로 전달합니다."""
+        self.progress_updated.emit(event.percent)
+        self.progress_detail.emit(event.describe())
 
     def run(self):
         try:
-            self.start_time = time.time()
-            self.is_processing_done = False
-            
-            # 진행률 업데이트를 위한 새 스레드 시작
-            progress_thread = QThread()
-            progress_thread.run = self.update_progress
-            progress_thread.start()
-            
-            logging.info(f"Processing started - Input: {self.input_file}, Sheet: {self.selected_sheet}")
-            df = pd.read_excel(self.input_file, sheet_name=self.selected_sheet)
-            train_df = df.copy()
-            
-            # 텍스트 전처리
-            logging.info("Cleaning text data")
-            train_df[self.content_column] = train_df[self.content_column].apply(TextExtension.clean_text)
-            
-            if self.should_train:
-                train_data = train_df[train_df[self.category_column].notna()]
-                self.classifier.train(
-                    train_data[self.content_column], 
-                    train_data[self.category_column]
-                )
-                self.classifier.save_model()
-                logging.info("Model trained and saved")
-
-            mask = df[self.category_column].isna()
-            unclassified = df[mask]
-            
-            for idx, row in enumerate(unclassified.iterrows()):
-                # 텍스트 전처리 후 예측
-                cleaned_text = TextExtension.clean_text(row[1][self.content_column])
-                prediction = self.classifier.predict(cleaned_text)
-                if prediction not in self.categories:
-                    prediction = '알수없음'
-                df.loc[row[0], self.category_column] = prediction
-
-            excel_handler = ExcelHandler()
-            excel_handler.save_excel_with_style(
-                self.input_file, 
-                self.output_file, 
-                self.selected_sheet, 
-                df
+            pipeline = ClassificationPipeline(
+                classifier=self.classifier,
+                input_file=self.input_file,
+                output_file=self.output_file,
+                selected_sheet=self.selected_sheet,
+                content_column=self.content_column,
+                category_column=self.category_column,
+                categories=self.categories,
+                should_train=self.should_train,
+                n_jobs=self.n_jobs,
+                write_recommendations=self.write_recommendations,
+                progress_callback=self.report_progress,
+                session=self.session
             )
-            
-            # 처리 완료 표시
-            self.is_processing_done = True
-            progress_thread.wait()
+            self.result_df = pipeline.run()
+            self.session = pipeline.session
+            self.recommendations = pipeline.recommendations
+            self.rule_hit_counts = pipeline.rule_hit_counts
+            self.cache_stats = pipeline.cache_stats
+            self.dedup_stats = pipeline.dedup_stats
 
             self.finished.emit()
             
         except Exception as e:
             logging.error(f"Error during processing: {str(e)}", exc_info=True)
             self.error.emit(str(e))
-            self.is_processing_done = True
\ No newline at end of file
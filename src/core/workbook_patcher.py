@@ -0,0 +1,210 @@
+import os
+import re
+import shutil
+import zipfile
+import logging
+import datetime
+import numpy as np
+import pandas as pd
+from xml.sax.saxutils import escape
+from openpyxl.utils import get_column_letter
+from .workbook_probe import WorkbookProbe, column_index
+
+ROW_PATTERN = re.compile(r'<row\b[^>]*?\sr="(\d+)"[^>]*?(/?)>')
+ROW_TAG_PATTERN = re.compile(r'<row\b')
+CELL_PATTERN = re.compile(r'<c\b([^>]*?)(/>|>.*?</c>)', re.DOTALL)
+CELL_REF_PATTERN = re.compile(r'\sr="([A-Z]+)\d+"')
+STYLE_PATTERN = re.compile(r'\ss="(\d+)"')
+FORMULA_PATTERN = re.compile(r'<f[\s/>]')
+SPANS_PATTERN = re.compile(r'\sspans="[^"]*"')
+DIMENSION_PATTERN = re.compile(r'<dimension\s+ref="([A-Z]*)(\d*)(?::([A-Z]+)(\d+))?"\s*/>')
+ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+DATE1904_PATTERN = re.compile(rb'\sdate1904="(?:1|true)"')
+EXCEL_EPOCH = datetime.datetime(1899, 12, 30)  # 1900 날짜 체계의 0번 날짜 (1900-03-01 이후 날짜에 유효)
+EXCEL_LEAP_BUG_END = datetime.datetime(1900, 3, 1)
+DATETIME_TYPES = (datetime.date, np.datetime64)
+
+def cell_changes(before, after, header_row=1):
+    """두 DataFrame을 비교해 바뀐 셀을 {(엑셀 행, 엑셀 열): 값} 형태로 반환합니다.
+
+    after는 before와 같은 컬럼 뒤에 새 컬럼이 붙은 형태까지만 허용하며(새 컬럼은 헤더와 값 전체를 기록),
+    행 수나 컬럼 순서가 다르면 부분 업데이트를 할 수 없으므로 None을 반환합니다.
+    """
+    before_columns = list(before.columns)
+    after_columns = list(after.columns)
+    if len(before) != len(after) or after_columns[:len(before_columns)] != before_columns:
+        return None
+
+    changes = {}
+    for col_idx, column in enumerate(after_columns, 1):
+        after_values = after[column]
+        if column in before_columns:
+            before_values = before[column]
+            changed = (before_values.values != after_values.values) & ~(before_values.isna().values & after_values.isna().values)
+            positions = np.flatnonzero(changed)
+        else:
+            changes[(header_row, col_idx)] = str(column)
+            positions = range(len(after))
+        for position in positions:
+            changes[(header_row + 1 + position, col_idx)] = after_values.iat[position]
+    return changes
+
+def _excel_serial(value):
+    """날짜·시각을 엑셀 일련번호(1900 날짜 체계)로 바꿉니다. 바꿀 수 없으면 ValueError를 발생시킵니다."""
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        raise ValueError("Timezone-aware dates cannot be patched in place")
+    timestamp = timestamp.to_pydatetime()
+    if timestamp < EXCEL_LEAP_BUG_END:
+        raise ValueError("Dates before 1900-03-01 cannot be patched in place")
+    return (timestamp - EXCEL_EPOCH) / datetime.timedelta(days=1)
+
+def _cell_xml(ref, value, style):
+    """값 하나를 셀 XML로 만듭니다. 문자열은 공유 문자열 표를 건드리지 않도록 inlineStr로 씁니다.
+
+    날짜는 엑셀 일련번호로 쓰고 표시 형식은 기존 셀의 스타일을 그대로 씁니다. 스타일이 없는 셀(새 셀 등)에는
+    날짜 형식을 지정할 수 없으므로 ValueError를 발생시켜 전체 저장으로 대신하게 합니다.
+    NaN은 빈 셀로 쓰고, 엑셀에 쓸 수 없는 무한대 값도 ValueError를 발생시킵니다.
+    """
+    style_attr = f' s="{style}"' if style else ''
+    if value is None or value is pd.NaT or value is pd.NA:
+        return f'<c r="{ref}"{style_attr}/>'
+    if isinstance(value, DATETIME_TYPES):
+        if pd.isna(value):
+            return f'<c r="{ref}"{style_attr}/>'
+        if not style or style == '0':
+            raise ValueError(f"Cannot write a date to unformatted cell {ref} in place")
+        return f'<c r="{ref}"{style_attr}><v>{repr(_excel_serial(value))}</v></c>'
+    if isinstance(value, (bool, np.bool_)):
+        return f'<c r="{ref}"{style_attr} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (float, np.floating)):
+        if np.isnan(value):
+            return f'<c r="{ref}"{style_attr}/>'
+        if not np.isfinite(value):
+            raise ValueError(f"Cannot write non-finite number to cell {ref} in place")
+        return f'<c r="{ref}"{style_attr}><v>{repr(float(value))}</v></c>'
+    if isinstance(value, (int, np.integer)):
+        return f'<c r="{ref}"{style_attr}><v>{int(value)}</v></c>'
+    text = escape(ILLEGAL_XML_CHARS.sub('', str(value)))
+    return f'<c r="{ref}"{style_attr} t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+def _patch_row(row_xml_body, row_number, row_changes):
+    """한 행의 <c> 목록에서 바뀐 셀만 교체하고, 없는 셀은 열 순서에 맞게 끼워 넣습니다."""
+    pending = dict(row_changes)  # 열 번호(0부터) -> 값
+    pieces = []
+    position = 0
+    for match in CELL_PATTERN.finditer(row_xml_body):
+        ref_match = CELL_REF_PATTERN.search(match.group(1))
+        if ref_match is None:
+            raise ValueError("Cell without reference, cannot patch in place")
+        column = column_index(ref_match.group(1))
+
+        # 이 셀보다 앞 열에 새로 들어갈 셀
+        for new_column in sorted(c for c in pending if c < column):
+            pieces.append(row_xml_body[position:match.start()])
+            pieces.append(_cell_xml(f'{get_column_letter(new_column + 1)}{row_number}', pending.pop(new_column), None))
+            position = match.start()
+
+        if column in pending:
+            # 수식 셀을 값으로 바꾸면 calcChain.xml이 수식이 아닌 셀을 가리키게 되므로 전체 저장으로 대신
+            if FORMULA_PATTERN.search(match.group(2)):
+                raise ValueError(f"Cannot overwrite formula cell {ref_match.group(1)}{row_number} in place")
+            style_match = STYLE_PATTERN.search(match.group(1))
+            pieces.append(row_xml_body[position:match.start()])
+            pieces.append(_cell_xml(
+                f'{get_column_letter(column + 1)}{row_number}',
+                pending.pop(column),
+                style_match.group(1) if style_match else None
+            ))
+            position = match.end()
+
+    pieces.append(row_xml_body[position:])
+    for new_column in sorted(pending):
+        pieces.append(_cell_xml(f'{get_column_letter(new_column + 1)}{row_number}', pending[new_column], None))
+    return ''.join(pieces)
+
+def _patch_sheet_xml(xml, changes):
+    """시트 XML 문자열에서 바뀐 행만 수정한 새 XML을 반환합니다."""
+    if '<sheetData' not in xml:
+        raise ValueError("Unsupported sheet XML (namespace prefix or missing sheetData)")
+    # r 속성은 선택 사항이므로, 번호 없는 행이 있으면 행 위치를 알 수 없어 부분 수정 불가
+    if len(ROW_TAG_PATTERN.findall(xml)) != len(ROW_PATTERN.findall(xml)):
+        raise ValueError("Rows without reference, cannot patch in place")
+
+    rows = {}
+    for (row, column), value in changes.items():
+        rows.setdefault(row, {})[column - 1] = value
+
+    pieces = []
+    position = 0
+    row_iter = ROW_PATTERN.finditer(xml)
+    current = next(row_iter, None)
+    max_row = 0
+    max_column = 0
+    for row_number in sorted(rows):
+        max_row = max(max_row, row_number)
+        max_column = max(max_column, max(rows[row_number]) + 1)
+        while current is not None and int(current.group(1)) < row_number:
+            current = next(row_iter, None)
+
+        if current is not None and int(current.group(1)) == row_number:
+            # 새 열이 생길 수 있으므로 열 범위 힌트(spans)는 제거
+            open_tag = SPANS_PATTERN.sub('', current.group(0))
+            if current.group(2):  # <row .../> 빈 행
+                body, end = '', current.end()
+                open_tag = open_tag[:-2].rstrip() + '>'
+            else:
+                end = xml.index('</row>', current.end())
+                body = xml[current.end():end]
+                end += len('</row>')
+            pieces.append(xml[position:current.start()])
+            pieces.append(open_tag + _patch_row(body, row_number, rows[row_number]) + '</row>')
+            position = end
+            current = next(row_iter, None)
+        else:
+            # 시트에 없는 행은 다음 행 앞(또는 sheetData 끝)에 새로 만듦
+            insert_at = current.start() if current is not None else xml.index('</sheetData>')
+            pieces.append(xml[position:insert_at])
+            pieces.append(f'<row r="{row_number}">{_patch_row("", row_number, rows[row_number])}</row>')
+            position = insert_at
+
+    pieces.append(xml[position:])
+    patched = ''.join(pieces)
+
+    # 시트 범위 밖에 쓴 경우 dimension 갱신
+    dimension = DIMENSION_PATTERN.search(patched)
+    if dimension and dimension.group(4):
+        last_column = max(column_index(dimension.group(3)) + 1, max_column)
+        last_row = max(int(dimension.group(4)), max_row)
+        first = f'{dimension.group(1)}{dimension.group(2)}'
+        patched = (patched[:dimension.start()] + f'<dimension ref="{first}:{get_column_letter(last_column)}{last_row}"/>'
+                   + patched[dimension.end():])
+    return patched
+
+def patch_cells(file_path, sheet_name, changes):
+    """xlsx 파일에서 지정한 셀만 바꿉니다. 다른 zip 항목은 내용을 바꾸지 않고 그대로 복사합니다.
+
+    changes는 {(엑셀 행, 엑셀 열): 값}이며 행과 열은 1부터 시작합니다.
+    시트 XML을 패치할 수 없는 형식이면 ValueError를 발생시킵니다.
+    """
+    if not changes:
+        return
+    sheet_path = WorkbookProbe(file_path).sheet_path(sheet_name)
+    temp_file = f'{file_path}.patching'
+    try:
+        with zipfile.ZipFile(file_path) as source, zipfile.ZipFile(temp_file, 'w') as target:
+            if (any(isinstance(value, DATETIME_TYPES) for value in changes.values())
+                    and DATE1904_PATTERN.search(source.read('xl/workbook.xml'))):
+                raise ValueError("Workbooks using the 1904 date system cannot be patched in place")
+            for info in source.infolist():
+                if info.filename == sheet_path:
+                    data = _patch_sheet_xml(source.read(info.filename).decode('utf-8'), changes).encode('utf-8')
+                    target.writestr(info, data, compress_type=info.compress_type)
+                else:
+                    target.writestr(info, source.read(info), compress_type=info.compress_type)
+        shutil.copymode(file_path, temp_file)
+        os.replace(temp_file, file_path)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+    logging.info(f"Patched {len(changes)} cells in {file_path} [{sheet_name}]")
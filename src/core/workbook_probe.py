@@ -0,0 +1,178 @@
+import re
+import zipfile
+import logging
+import posixpath
+import xml.etree.ElementTree as ET
+
+NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+NS_PACKAGE_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+CELL_REF_PATTERN = re.compile(r'([A-Z]+)(\d+)')
+
+def column_index(letters):
+    """열 문자(A, B, ..., AA)를 0부터 시작하는 열 번호로 바꿉니다."""
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - 64
+    return index - 1
+
+class SheetInfo:
+    """시트 하나의 요약 정보입니다. approx_rows는 헤더를 뺀 대략의 데이터 행 수입니다 (모르면 None)."""
+
+    def __init__(self, name, header, approx_rows, sample_rows):
+        self.name = name
+        self.header = header
+        self.approx_rows = approx_rows
+        self.sample_rows = sample_rows
+
+class WorkbookProbe:
+    """xlsx 파일에서 필요한 XML 부분만 읽어 시트 목록, 헤더, 대략의 행 수, 샘플 행을 빠르게 구합니다.
+
+    시트 전체를 파싱하지 않고 workbook.xml과 시트 XML의 앞부분만 읽으며,
+    공유 문자열(sharedStrings.xml)은 필요한 번호까지만 순차적으로 읽습니다.
+    xlsx(zip) 형식이 아니면 ValueError를 발생시키므로 호출한 쪽에서 pandas로 대신 읽어야 합니다.
+    """
+    SAMPLE_ROWS = 5
+
+    def __init__(self, file_path):
+        if not zipfile.is_zipfile(file_path):
+            raise ValueError(f"Not an xlsx workbook: {file_path}")
+        self.file_path = file_path
+        self._sheet_paths = None  # 시트 이름 -> zip 내부 경로
+        self._shared_strings = []
+        self._shared_strings_iter = None
+        self._sheet_info = {}  # 시트 이름 -> (요청한 샘플 행 수, SheetInfo)
+
+    def _read_sheet_paths(self, archive):
+        workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+        relations = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+        targets = {rel.get('Id'): rel.get('Target') for rel in relations.iter(f'{NS_PACKAGE_REL}Relationship')}
+
+        sheet_paths = {}
+        for sheet in workbook.iter(f'{NS_MAIN}sheet'):
+            target = targets.get(sheet.get(f'{NS_REL}id'))
+            if target is None:
+                continue
+            # 대상 경로는 xl/ 기준 상대 경로이거나 /로 시작하는 패키지 절대 경로
+            path = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('xl', target))
+            sheet_paths[sheet.get('name')] = path
+        return sheet_paths
+
+    @property
+    def sheet_names(self):
+        if self._sheet_paths is None:
+            with zipfile.ZipFile(self.file_path) as archive:
+                self._sheet_paths = self._read_sheet_paths(archive)
+        return list(self._sheet_paths)
+
+    def sheet_path(self, sheet_name):
+        """시트 XML의 zip 내부 경로를 반환합니다."""
+        if self._sheet_paths is None:
+            self.sheet_names
+        if sheet_name not in self._sheet_paths:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        return self._sheet_paths[sheet_name]
+
+    @staticmethod
+    def _iter_shared_strings(archive, skip):
+        """공유 문자열을 순서대로 반환합니다. 앞의 skip개는 이미 읽은 것이므로 건너뜁니다."""
+        position = 0
+        with archive.open('xl/sharedStrings.xml') as shared_strings_xml:
+            for _, element in ET.iterparse(shared_strings_xml, events=('end',)):
+                if element.tag != f'{NS_MAIN}si':
+                    continue
+                if position >= skip:
+                    # 서식이 섞인 문자열(<r><t>)도 텍스트만 이어 붙임
+                    yield ''.join(text.text or '' for text in element.iter(f'{NS_MAIN}t'))
+                position += 1
+                element.clear()
+
+    def _shared_string(self, archive, index):
+        """공유 문자열을 index번까지만 읽어 반환합니다. 이미 읽은 부분은 다시 읽지 않습니다."""
+        if index >= len(self._shared_strings) and self._shared_strings_iter is None:
+            if 'xl/sharedStrings.xml' not in archive.namelist():
+                return ''
+            self._shared_strings_iter = self._iter_shared_strings(archive, len(self._shared_strings))
+        while index >= len(self._shared_strings):
+            text = next(self._shared_strings_iter, None)
+            if text is None:
+                return ''
+            self._shared_strings.append(text)
+        return self._shared_strings[index]
+
+    def _cell_value(self, archive, cell):
+        cell_type = cell.get('t', 'n')
+        if cell_type == 'inlineStr':
+            return ''.join(text.text or '' for text in cell.iter(f'{NS_MAIN}t'))
+        value = cell.find(f'{NS_MAIN}v')
+        if value is None or value.text is None:
+            return None
+        if cell_type == 's':
+            return self._shared_string(archive, int(value.text))
+        if cell_type == 'b':
+            return value.text == '1'
+        if cell_type == 'n':
+            number = float(value.text)
+            return int(number) if number.is_integer() else number
+        return value.text
+
+    @staticmethod
+    def _pandas_columns(header):
+        """pandas.read_excel과 같은 규칙으로 컬럼 이름을 만듭니다 (빈 이름, 중복 이름 처리)."""
+        columns = []
+        seen = {}
+        for position, name in enumerate(header):
+            if name is None or name == '':
+                name = f'Unnamed: {position}'
+            base = name
+            while name in seen:
+                seen[base] += 1
+                name = f'{base}.{seen[base]}'
+            seen.setdefault(name, 0)
+            columns.append(name)
+        return columns
+
+    def sheet_info(self, sheet_name, sample_rows=SAMPLE_ROWS):
+        """시트의 헤더, 대략의 행 수, 앞쪽 샘플 행을 반환합니다. 시트 XML은 앞부분만 읽습니다."""
+        cached = self._sheet_info.get(sheet_name)
+        if cached is not None and cached[0] >= sample_rows:
+            return cached[1]
+
+        with zipfile.ZipFile(self.file_path) as archive:
+            if self._sheet_paths is None:
+                self._sheet_paths = self._read_sheet_paths(archive)
+            if sheet_name not in self._sheet_paths:
+                raise KeyError(f"Worksheet {sheet_name} does not exist.")
+
+            last_row = None
+            rows = []
+            with archive.open(self._sheet_paths[sheet_name]) as sheet_xml:
+                for _, element in ET.iterparse(sheet_xml, events=('end',)):
+                    if element.tag == f'{NS_MAIN}dimension':
+                        match = CELL_REF_PATTERN.search(element.get('ref', '').split(':')[-1])
+                        if match:
+                            last_row = int(match.group(2))
+                    elif element.tag == f'{NS_MAIN}row':
+                        values = {}
+                        for position, cell in enumerate(element.iter(f'{NS_MAIN}c')):
+                            match = CELL_REF_PATTERN.match(cell.get('r', ''))
+                            values[column_index(match.group(1)) if match else position] = self._cell_value(archive, cell)
+                        element.clear()
+                        if rows or any(value is not None for value in values.values()):
+                            rows.append(values)
+                        if len(rows) > sample_rows:
+                            break
+
+            if self._shared_strings_iter is not None:
+                # zip 파일을 닫으므로 다음 요청에서는 읽은 위치부터 다시 이어 읽음
+                self._shared_strings_iter.close()
+                self._shared_strings_iter = None
+
+        width = max((max(row) + 1 for row in rows if row), default=0)
+        table = [[row.get(column) for column in range(width)] for row in rows]
+        header = self._pandas_columns(table[0]) if table else []
+        approx_rows = last_row - 1 if last_row and last_row > 1 else None
+        info = SheetInfo(sheet_name, header, approx_rows, table[1:])
+        self._sheet_info[sheet_name] = (sample_rows, info)
+        logging.debug(f"Probed sheet '{sheet_name}': {len(header)} columns, ~{approx_rows} rows")
+        return info
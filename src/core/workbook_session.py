@@ -0,0 +1,122 @@
+import os
+import logging
+import threading
+from collections import OrderedDict
+from .tabular_backends import get_backend
+
+class WorkbookSession:
+    """한 워크북 파일의 시트를 작업 동안 한 번씩만 읽도록 보관하는 세션입니다.
+
+    세션은 (경로, 수정 시각, 크기)로 식별되며, 파일이 바뀌면 open()이 새 세션을 만듭니다.
+    파일 형식별 읽기는 tabular_backends의 백엔드가 담당하며(엑셀, CSV, Parquet),
+    시트 목록과 헤더는 가능하면 시트 전체를 읽지 않고 구합니다.
+    이미 읽은 시트는 처음 읽은 시점의 내용 그대로 남으므로, 원본을 덮어쓴 뒤에도
+    검수 단계에서 원래 데이터를 비교할 수 있습니다.
+    """
+    MAX_SESSIONS = 4  # 동시에 보관하는 워크북 수 (가장 오래 사용하지 않은 것부터 제거)
+
+    _sessions = OrderedDict()
+    _sessions_lock = threading.Lock()
+
+    def __init__(self, file_path):
+        self.file_path = os.path.abspath(file_path)
+        stat = os.stat(self.file_path)
+        self.key = (self.file_path, stat.st_mtime_ns, stat.st_size)
+        self.backend = get_backend(self.file_path)  # 지원하지 않는 형식이면 ValueError
+        self._sheet_names = None
+        self._sheets = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, file_path):
+        """파일의 현재 버전에 해당하는 세션을 반환합니다. 없거나 파일이 바뀌었으면 새로 만듭니다."""
+        path = os.path.abspath(file_path)
+        with cls._sessions_lock:
+            session = cls._sessions.get(path)
+            if session is None or session.is_stale():
+                session = cls(path)
+                cls._sessions[path] = session
+                logging.info(f"Workbook session opened: {path}")
+            cls._sessions.move_to_end(path)
+            while len(cls._sessions) > cls.MAX_SESSIONS:
+                cls._sessions.popitem(last=False)
+            return session
+
+    @classmethod
+    def invalidate(cls, file_path):
+        """파일의 세션을 버립니다. 이미 세션을 가진 쪽은 기존 내용을 계속 사용할 수 있습니다."""
+        with cls._sessions_lock:
+            cls._sessions.pop(os.path.abspath(file_path), None)
+
+    def is_stale(self):
+        """세션을 만든 뒤 파일이 바뀌었거나 삭제되었는지 확인합니다."""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return True
+        return (self.file_path, stat.st_mtime_ns, stat.st_size) != self.key
+
+    @property
+    def sheet_names(self):
+        with self._lock:
+            if self._sheet_names is None:
+                self._sheet_names = self.backend.sheet_names()
+            return list(self._sheet_names)
+
+    def sheet_info(self, sheet_name):
+        """시트의 헤더, 대략의 행 수, 샘플 행(SheetInfo)을 반환합니다. 구할 수 없으면 None입니다."""
+        try:
+            with self._lock:
+                return self.backend.sheet_info(sheet_name)
+        except Exception as e:
+            logging.warning(f"Failed to probe sheet '{sheet_name}': {str(e)}")
+            return None
+
+    def describe_sheet(self, sheet_name):
+        """시트 선택 목록에 표시할 이름을 반환합니다 (대략의 행 수 포함)."""
+        info = self.sheet_info(sheet_name)
+        if info is None or info.approx_rows is None:
+            return sheet_name
+        return f'{sheet_name} (약 {info.approx_rows:,}행)'
+
+    def get_samples(self, sheet_name, column_name):
+        """시트 앞쪽 샘플 행에서 컬럼 값 목록을 반환합니다."""
+        info = self.sheet_info(sheet_name)
+        if info is not None and column_name in info.header:
+            position = info.header.index(column_name)
+            return [row[position] for row in info.sample_rows if row[position] is not None]
+        if sheet_name in self._sheets:
+            df = self._sheets[sheet_name]
+            if column_name in df.columns:
+                return df[column_name].dropna().head(self.backend.SAMPLE_ROWS).tolist()
+        return []
+
+    def read_sheet(self, sheet_name, copy=True):
+        """시트를 DataFrame으로 반환합니다. 처음 요청할 때만 파일에서 읽습니다.
+
+        copy가 True면 호출한 쪽이 수정해도 세션의 원본이 바뀌지 않도록 복사본을 반환합니다.
+        """
+        with self._lock:
+            df = self._sheets.get(sheet_name)
+            if df is None:
+                logging.info(f"Reading sheet '{sheet_name}' from {self.file_path}")
+                df = self.backend.read_sheet(sheet_name)
+                self._sheets[sheet_name] = df
+        return df.copy() if copy else df
+
+    def get_columns(self, sheet_name):
+        """시트의 컬럼 이름 목록을 반환합니다. 아직 읽지 않은 시트는 헤더 행만 확인합니다."""
+        if sheet_name not in self._sheets:
+            info = self.sheet_info(sheet_name)
+            if info is not None and info.header:
+                return list(info.header)
+        return self.read_sheet(sheet_name, copy=False).columns.tolist()
+
+    def get_unique_values(self, sheet_name, column_name):
+        """시트 컬럼의 정렬된 고유값 목록을 반환합니다 (카테고리 목록용)."""
+        df = self.read_sheet(sheet_name, copy=False)
+        if column_name not in df.columns:
+            return None
+        values = df[column_name].dropna().unique().tolist()
+        values.sort()
+        return values
@@ -1,9 +1,13 @@
 import sys
-from PyQt6.QtWidgets import QApplication
-from ui.main_window import MainWindow
+import multiprocessing
 from utils.logging_config import setup_logging
+import cli
 
 def main():
+    # GUI 실행 시에만 PyQt6를 불러옴
+    from PyQt6.QtWidgets import QApplication
+    from ui.main_window import MainWindow
+
     setup_logging()
     app = QApplication(sys.argv)
     window = MainWindow()
@@ -11,4 +15,9 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    # 패키징된 실행 파일에서 분류 작업 프로세스를 띄우기 위해 필요
+    multiprocessing.freeze_support()
+    # 명령어가 주어지면 GUI 없이 실행 (예: main.py classify --input ...)
+    if len(sys.argv) > 1 and sys.argv[1] in cli.COMMANDS:
+        sys.exit(cli.main(sys.argv[1:]))
+    main()
@@ -3,19 +3,24 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QComboBox,
                         QMessageBox, QTableWidget, QTextEdit,
                         QTableWidgetItem, QWidget, QHBoxLayout, QPushButton,
                         QGroupBox, QFormLayout, QListWidget, QListWidgetItem,  # QListWidgetItem 추가
-                        QLineEdit, QScrollArea, QFrame, QCheckBox) 
-from PyQt6.QtCore import QTimer, Qt
+                        QLineEdit, QScrollArea, QFrame, QCheckBox, QTabWidget) 
+from PyQt6.QtCore import Qt
 from utils.resource_manager import ResourceManager
 from utils.version_manager import VersionManager
-import pandas as pd
+from utils.text_preprocessor import TextPreprocessor
+from core.workbook_session import WorkbookSession
+from core.tabular_backends import file_dialog_filter, output_file_name
 import logging
 import json
+import copy
 import os
+import re
 
 class SheetSelectionDialog(QDialog):
-    def __init__(self, file_name, parent=None):
+    def __init__(self, file_name, parent=None, session=None):
         super().__init__(parent)
         self.file_name = file_name
+        self.session = session
         self.selected_sheet = None
         self.setupUI()
         
@@ -24,9 +29,11 @@ class SheetSelectionDialog(QDialog):
         layout = QVBoxLayout()
         
         try:
-            xls = pd.ExcelFile(self.file_name)
+            if self.session is None:
+                self.session = WorkbookSession.open(self.file_name)
             self.combo = QComboBox()
-            self.combo.addItems(xls.sheet_names)
+            for sheet_name in self.session.sheet_names:
+                self.combo.addItem(self.session.describe_sheet(sheet_name), sheet_name)
             
             layout.addWidget(QLabel('분석할 시트를 선택하세요:'))
             layout.addWidget(self.combo)
@@ -46,7 +53,7 @@ class SheetSelectionDialog(QDialog):
             self.reject()
             
     def get_selected_sheet(self):
-        return self.combo.currentText()
+        return self.combo.currentData()
 
 class OutputSelectionDialog(QDialog):
     def __init__(self, parent=None):
@@ -82,12 +89,10 @@ class OutputSelectionDialog(QDialog):
                 self,
                 "출력 파일 선택",
                 "",
-                "Excel Files (*.xlsx)"
+                file_dialog_filter(for_output=True)
             )
             if file_name:
-                if not file_name.endswith('.xlsx'):
-                    file_name += '.xlsx'
-                self.output_file = file_name
+                self.output_file = output_file_name(file_name)
                 self.update_original = False
                 self.accept()
         else:
@@ -148,10 +153,29 @@ class ClassificationRulesDialog(QDialog):
         keyword_tab.setLayout(keyword_layout)
         tabs.addTab(keyword_tab, "키워드 기반 규칙")
         
-        # 패턴 기반 규칙 탭 (향후 확장)
+        # 패턴 기반 규칙 탭
         pattern_tab = QWidget()
         pattern_layout = QVBoxLayout()
-        pattern_layout.addWidget(QLabel('패턴 기반 규칙은 향후 지원 예정입니다.'))
+        pattern_layout.addWidget(QLabel('정규식은 소문자로 변환된 내용에 대소문자 구분 없이 적용되며, 키워드 규칙 다음으로 검사됩니다.'))
+        
+        # 패턴 규칙 테이블 (한 행에 정규식 하나)
+        self.pattern_table = QTableWidget()
+        self.pattern_table.setColumnCount(2)
+        self.pattern_table.setHorizontalHeaderLabels(['분류', '정규식'])
+        self.updatePatternTable()
+        pattern_layout.addWidget(self.pattern_table)
+        
+        # 패턴 규칙 버튼
+        pattern_btn_layout = QHBoxLayout()
+        add_pattern_btn = QPushButton('추가')
+        add_pattern_btn.clicked.connect(self.addPatternRule)
+        remove_pattern_btn = QPushButton('삭제')
+        remove_pattern_btn.clicked.connect(self.removePatternRule)
+        
+        pattern_btn_layout.addWidget(add_pattern_btn)
+        pattern_btn_layout.addWidget(remove_pattern_btn)
+        pattern_layout.addLayout(pattern_btn_layout)
+        
         pattern_tab.setLayout(pattern_layout)
         tabs.addTab(pattern_tab, "패턴 기반 규칙")
         
@@ -198,6 +222,7 @@ class ClassificationRulesDialog(QDialog):
                     new_rules = json.load(f)
                 self.rules = new_rules
                 self.updateKeywordTable()
+                self.updatePatternTable()
                 QMessageBox.information(self, '성공', '규칙을 성공적으로 불러왔습니다.')
             except Exception as e:
                 QMessageBox.critical(self, '에러', f'규칙 불러오기 실패:\n{str(e)}')
@@ -217,6 +242,22 @@ class ClassificationRulesDialog(QDialog):
         if current_row >= 0:
             self.keyword_table.removeRow(current_row)
     
+    def updatePatternTable(self):
+        pattern_rules = self.rules.get('rules', {}).get('pattern_based', {})
+        rows = [(category, pattern) for category, patterns in pattern_rules.items() for pattern in patterns]
+        self.pattern_table.setRowCount(len(rows))
+        for i, (category, pattern) in enumerate(rows):
+            self.pattern_table.setItem(i, 0, QTableWidgetItem(category))
+            self.pattern_table.setItem(i, 1, QTableWidgetItem(pattern))
+    
+    def addPatternRule(self):
+        self.pattern_table.setRowCount(self.pattern_table.rowCount() + 1)
+    
+    def removePatternRule(self):
+        current_row = self.pattern_table.currentRow()
+        if current_row >= 0:
+            self.pattern_table.removeRow(current_row)
+    
     def saveRules(self):
         try:
             # 키워드 규칙 수집
@@ -230,8 +271,23 @@ class ClassificationRulesDialog(QDialog):
                         if k.strip()
                     ]
             
+            # 패턴 규칙 수집 및 검증
+            pattern_rules = {}
+            for i in range(self.pattern_table.rowCount()):
+                category = self.pattern_table.item(i, 0)
+                pattern = self.pattern_table.item(i, 1)
+                if category and pattern and category.text().strip() and pattern.text().strip():
+                    try:
+                        re.compile(pattern.text().strip())
+                    except re.error as e:
+                        QMessageBox.warning(self, '경고', f'{i + 1}번째 패턴이 올바른 정규식이 아닙니다:\n{str(e)}')
+                        return
+                    pattern_rules.setdefault(category.text().strip(), []).append(pattern.text().strip())
+            
             # 전체 규칙 구조 업데이트
+            self.rules.setdefault('rules', {})
             self.rules['rules']['keyword_based'] = keyword_rules
+            self.rules['rules']['pattern_based'] = pattern_rules
             
             # 파일 저장
             rules_path = ResourceManager.get_resource_path('classification_rules.json')
@@ -244,9 +300,10 @@ class ClassificationRulesDialog(QDialog):
             QMessageBox.critical(self, '에러', f'규칙 저장 중 오류 발생:\n{str(e)}')
 
 class ColumnSelectionDialog(QDialog):
-    def __init__(self, file_path, sheet_name, parent=None):
+    def __init__(self, file_path, sheet_name, parent=None, session=None):
         super().__init__(parent)
         self.file_path = file_path
+        self.session = session or WorkbookSession.open(file_path)  # 시트별로 한 번만 읽음
         self.data_sheet = sheet_name
         self.columns = None
         self.categories = []
@@ -267,8 +324,7 @@ class ColumnSelectionDialog(QDialog):
             data_layout = QFormLayout()
             
             # 데이터 시트의 컬럼 로드
-            df = pd.read_excel(self.file_path, sheet_name=self.data_sheet)
-            self.columns = df.columns.tolist()
+            self.columns = self.session.get_columns(self.data_sheet)
             logging.info(f"Found columns: {self.columns}")
             
             self.content_combo = QComboBox()
@@ -283,6 +339,16 @@ class ColumnSelectionDialog(QDialog):
                 
             data_layout.addRow('분류할 내용 컬럼:', self.content_combo)
             data_layout.addRow('분류 결과 컬럼:', self.category_result_combo)
+
+            # 시트 전체를 읽지 않고 확인한 행 수와 내용 샘플
+            info = self.session.sheet_info(self.data_sheet)
+            if info is not None and info.approx_rows is not None:
+                data_layout.addRow('데이터 행 수:', QLabel(f'약 {info.approx_rows:,}행'))
+            self.sample_label = QLabel('')
+            self.sample_label.setWordWrap(True)
+            data_layout.addRow('내용 샘플:', self.sample_label)
+            self.content_combo.currentTextChanged.connect(self.update_content_samples)
+            self.update_content_samples()
             data_group.setLayout(data_layout)
             main_layout.addWidget(data_group)
             
@@ -290,8 +356,7 @@ class ColumnSelectionDialog(QDialog):
             category_group = QGroupBox("카테고리 설정")
             category_layout = QFormLayout()
             
-            xls = pd.ExcelFile(self.file_path)
-            sheets = xls.sheet_names
+            sheets = self.session.sheet_names
             logging.info(f"Available sheets: {sheets}")
             
             self.category_sheet_combo = QComboBox()
@@ -334,49 +399,13 @@ class ColumnSelectionDialog(QDialog):
             self.category_sheet_combo.currentTextChanged.connect(self.update_category_columns)
             self.category_column_combo.currentTextChanged.connect(self.update_preview)
             
-            # 초기 데이터 로드 - 약간의 지연을 주어 UI가 완전히 준비된 후 실행
-            QTimer.singleShot(100, self.update_category_columns)
-            
         except Exception as e:
             logging.error(f"Error in setupUI: {str(e)}", exc_info=True)
             QMessageBox.critical(self, '오류', f'UI 초기화 중 오류가 발생했습니다:\n{str(e)}')
         
     def initializeData(self):
-        """데이터를 로드하고 UI를 초기화합니다."""
+        """카테고리 컬럼 목록과 미리보기를 처음 채웁니다. 시트는 세션에서 한 번만 읽습니다."""
         try:
-            # 데이터 시트의 컬럼 로드
-            logging.info(f"Loading data sheet: {self.data_sheet}")
-            df = pd.read_excel(self.file_path, sheet_name=self.data_sheet)
-            self.columns = df.columns.tolist()
-            logging.info(f"Found columns: {self.columns}")
-            
-            # 컬럼 콤보박스 초기화
-            self.content_combo.addItems(self.columns)
-            self.category_result_combo.addItems(self.columns)
-            
-            # 기본값 설정
-            if "질문내용" in self.columns:
-                self.content_combo.setCurrentText("질문내용")
-            if "분류" in self.columns:
-                self.category_result_combo.setCurrentText("분류")
-            
-            # 시트 목록 로드
-            xls = pd.ExcelFile(self.file_path)
-            sheets = xls.sheet_names
-            logging.info(f"Available sheets: {sheets}")
-            self.category_sheet_combo.addItems(sheets)
-            
-            # Category 시트가 있으면 선택
-            if "Category" in sheets:
-                self.category_sheet_combo.setCurrentText("Category")
-                logging.info("Selected 'Category' sheet")
-            
-            # 시그널 연결
-            logging.info("Connecting signals")
-            self.category_sheet_combo.currentTextChanged.connect(self.update_category_columns)
-            self.category_column_combo.currentTextChanged.connect(self.update_preview)
-            
-            # 초기 카테고리 컬럼 목록 로드
             logging.info("Initial update of category columns")
             self.update_category_columns()
             
@@ -385,14 +414,19 @@ class ColumnSelectionDialog(QDialog):
             QMessageBox.critical(self, '오류', f'데이터 초기화 중 오류가 발생했습니다:\n{str(e)}')
             
             
+    def update_content_samples(self):
+        """선택한 내용 컬럼의 앞쪽 샘플 값을 보여줍니다."""
+        samples = self.session.get_samples(self.data_sheet, self.content_combo.currentText())
+        lines = [str(sample).replace('\n', ' ')[:60] for sample in samples[:3]]
+        self.sample_label.setText('\n'.join(lines) if lines else '(샘플 없음)')
+
     def update_category_columns(self):
         """선택된 카테고리 시트의 컬럼 목록을 업데이트합니다."""
         try:
             sheet_name = self.category_sheet_combo.currentText()
             logging.info(f"Loading columns from sheet: {sheet_name}")
             
-            df = pd.read_excel(self.file_path, sheet_name=sheet_name)
-            columns = df.columns.tolist()
+            columns = self.session.get_columns(sheet_name)
             
             current_text = self.category_column_combo.currentText()
             self.category_column_combo.clear()
@@ -420,10 +454,9 @@ class ColumnSelectionDialog(QDialog):
             logging.info(f"Updating preview for sheet: {sheet_name}, column: {column_name}")
             
             if sheet_name and column_name:
-                df = pd.read_excel(self.file_path, sheet_name=sheet_name)
-                if column_name in df.columns:
-                    self.categories = df[column_name].dropna().unique().tolist()
-                    self.categories.sort()  # 카테고리 정렬
+                categories = self.session.get_unique_values(sheet_name, column_name)
+                if categories is not None:
+                    self.categories = categories  # 정렬된 고유 카테고리
                     logging.info(f"Found {len(self.categories)} unique categories")
                     
                     self.preview_list.clear()
@@ -464,14 +497,18 @@ class ColumnSelectionDialog(QDialog):
         }
 
 class ReviewDialog(QDialog):
-    def __init__(self, df, content_column, category_column, categories, classifier, parent=None):
+    def __init__(self, df, content_column, category_column, categories, classifier, parent=None,
+                 recommendations=None, original_df=None):
         super().__init__(parent)
         self.df = df.copy()
         self.content_column = content_column
         self.category_column = category_column
         self.categories = categories
         self.classifier = classifier  # classifier 저장
+        self.recommendations = recommendations or {}  # 분류 시 미리 계산된 행별 추천 분류
+        self.original_df = original_df  # 분류 전 원본 데이터 시트 (없으면 입력 파일에서 읽음)
         self.modified_rows = {}
+        self.confirmed_rows = set()  # 검수 체크로 자동 분류 결과를 확인한 행 (원본 인덱스)
         
         # 원본 데이터와 신규 분류 데이터를 구분
         self.new_classifications = None
@@ -483,7 +520,10 @@ class ReviewDialog(QDialog):
         """신규 분류된 항목만 필터링합니다."""
         try:
             # 기존 분류가 있던 행은 제외
-            original_df = pd.read_excel(self.parent().input_file, sheet_name=self.parent().selected_sheet)
+            original_df = self.original_df
+            if original_df is None:
+                session = WorkbookSession.open(self.parent().input_file)
+                original_df = session.read_sheet(self.parent().selected_sheet, copy=False)
             original_classifications = original_df[self.category_column].notna()
             original_indices = set(original_df[original_classifications].index)
             
@@ -572,10 +612,15 @@ class ReviewDialog(QDialog):
         retrain_button = QPushButton('저장 및 재학습')
         retrain_button.clicked.connect(self.save_and_retrain)
         
+        self.incremental_checkbox = QCheckBox('변경분만 반영 (빠른 재학습)')
+        self.incremental_checkbox.setChecked(True)
+        self.incremental_checkbox.setToolTip('검수 체크하거나 수정한 행만 기존 모델에 더합니다. 새로운 분류가 있으면 전체 재학습합니다.')
+        
         cancel_button = QPushButton('취소')
         cancel_button.clicked.connect(self.reject)
         
         button_layout.addWidget(save_button)
+        button_layout.addWidget(self.incremental_checkbox)
         button_layout.addWidget(retrain_button)
         button_layout.addWidget(cancel_button)
         layout.addLayout(button_layout)
@@ -636,6 +681,10 @@ class ReviewDialog(QDialog):
         """체크박스 상태 변경 시 처리"""
         checkbox = self.sender()
         row = checkbox.property('row_index')
+        if state == Qt.CheckState.Checked.value:
+            self.confirmed_rows.add(checkbox.property('original_idx'))
+        else:
+            self.confirmed_rows.discard(checkbox.property('original_idx'))
         # 수정 버튼 활성화/비활성화
         button_widget = self.table.cellWidget(row, 3)
         edit_button = button_widget.layout().itemAt(0).widget()
@@ -670,8 +719,8 @@ class ReviewDialog(QDialog):
         content_text.setMinimumHeight(100)
         layout.addWidget(content_text)
         
-        # 추천 카테고리 표시
-        recommendations = self.get_category_recommendations(content)
+        # 추천 카테고리 표시 (분류 단계에서 계산해 둔 결과가 없을 때만 모델 사용)
+        recommendations = self.recommendations.get(original_idx) or self.get_category_recommendations(content)
         rec_label = QLabel("추천 카테고리:")
         layout.addWidget(rec_label)
         
@@ -715,28 +764,15 @@ class ReviewDialog(QDialog):
             self.updateStats()
     
     def get_category_recommendations(self, content):
-        """내용을 바탕으로 카테고리 추천"""
+        """내용을 바탕으로 카테고리 추천 (분류 시 계산해 두지 않은 행만, 예측 캐시에 있으면 재사용)"""
         try:
             if not hasattr(self, 'classifier') or self.classifier is None:
                 logging.error("Classifier not available")
                 return [("알수없음", 100.0)]
 
-            # 벡터화
-            content_vector = self.classifier.vectorizer.transform([content])
-            
-            # 각 카테고리별 확률 계산
-            probabilities = self.classifier.model.predict_proba(content_vector)[0]
-            categories = self.classifier.model.classes_
-            
-            # 확률이 높은 순으로 정렬
-            recommendations = sorted(
-                [(cat, prob * 100) for cat, prob in zip(categories, probabilities)],
-                key=lambda x: x[1],
-                reverse=True
-            )
-            
-            # 상위 5개만 반환
-            return recommendations[:5]
+            # 분류할 때와 같은 전처리 후 상위 5개 추천
+            cleaned = TextPreprocessor.default().clean(content)
+            return self.classifier.recommend_many([cleaned], top_k=5)[0]
             
         except Exception as e:
             logging.error(f"Error getting recommendations: {str(e)}")
@@ -787,6 +823,18 @@ class ReviewDialog(QDialog):
                 
             self.retrain_requested = True
             self.training_data = train_data  # 재학습에 사용될 데이터 저장
+            
+            # 증분 재학습: 사용자가 수정했거나 검수 체크로 확인한 행만 사용
+            # (검수하지 않은 자동 분류 결과를 학습하면 모델이 자기 추측을 다시 배움)
+            self.update_data = None
+            if self.incremental_checkbox.isChecked():
+                reviewed = [
+                    idx for idx in self.new_classifications.index
+                    if idx in self.modified_rows or idx in self.confirmed_rows
+                ]
+                reviewed_rows = modified_df.loc[reviewed]
+                self.update_data = reviewed_rows[reviewed_rows[self.category_column].notna()]
+                logging.info(f"Incremental update rows: {len(self.update_data)}")
             self.accept()
             
         except Exception as e:
@@ -937,8 +985,9 @@ class PreprocessingRulesDialog(QDialog):
         self.test_output.setPlainText(processed_text)
     
     def get_current_rules(self):
-        """현재 테이블의 내용을 규칙으로 변환합니다."""
-        rules = {"text_preprocessing": {"cut_after_strings": []}}
+        """현재 테이블의 내용을 규칙으로 변환합니다. 표에 없는 설정(정규화, 바꾸기 규칙 등)은 그대로 둡니다."""
+        rules = copy.deepcopy(self.rules)
+        rules.setdefault("text_preprocessing", {})["cut_after_strings"] = []
         
         for row in range(self.table.rowCount()):
             pattern = self.table.item(row, 0).text()
@@ -957,55 +1006,15 @@ class PreprocessingRulesDialog(QDialog):
         return rules
     
     def apply_rules(self, text, rules):
-        """규칙을 텍스트에 적용합니다."""
-        if not isinstance(text, str):
-            return str(text)
-            
-        result = text
-        for rule in rules["text_preprocessing"]["cut_after_strings"]:
-            if rule["enabled"]:
-                pattern = rule["pattern"]
-                if not rule["case_sensitive"]:
-                    idx = result.lower().find(pattern.lower())
-                    if idx >= 0:
-                        result = result[:idx]
-                else:
-                    idx = result.find(pattern)
-                    if idx >= 0:
-                        result = result[:idx]
-        
-        return result.strip()
+        """규칙을 텍스트에 적용합니다 (분류에 쓰는 전처리와 같은 엔진 사용)."""
+        try:
+            return TextPreprocessor(rules).clean(text)
+        except (ValueError, re.error) as e:
+            return f'규칙 오류: {str(e)}'
     
     def load_rules(self):
         """규칙 파일을 로드합니다."""
-        try:
-            rules_path = ResourceManager.get_resource_path('preprocessing_rules.json')
-            if rules_path and os.path.exists(rules_path):
-                with open(rules_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                logging.warning("Preprocessing rules file not found, using default rules")
-                return {
-                    "text_preprocessing": {
-                        "cut_after_strings": [
-                            {
-                                "pattern": "os:",
-                                "case_sensitive": False,
-                                "enabled": True,
-                                "description": "OS 정보 이후 텍스트 제거"
-                            },
-                            {
-                                "pattern": "문의경로:",
-                                "case_sensitive": True,
-                                "enabled": True,
-                                "description": "문의경로 정보 이후 텍스트 제거"
-                            }
-                        ]
-                    }
-                }
-        except Exception as e:
-            logging.error(f"Error loading preprocessing rules: {str(e)}")
-            return {"text_preprocessing": {"cut_after_strings": []}}
+        return copy.deepcopy(TextPreprocessor.load_rules())
     
     def save_rules(self):
         """현재 규칙을 파일로 저장합니다."""
@@ -1016,8 +1025,10 @@ class PreprocessingRulesDialog(QDialog):
             if not rules_path:
                 raise ValueError("Cannot resolve rules file path")
                 
+            TextPreprocessor(rules)  # 저장하기 전에 규칙이 컴파일되는지 확인
             with open(rules_path, 'w', encoding='utf-8') as f:
                 json.dump(rules, f, ensure_ascii=False, indent=2)
+            TextPreprocessor.reload()
             
             self.accept()
             
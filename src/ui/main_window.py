@@ -1,6 +1,6 @@
+import joblib
 import logging
 import os
-import pandas as pd
 import sys
 
 from PyQt6.QtCore import Qt
@@ -8,9 +8,11 @@ from PyQt6.QtGui import QIcon, QAction
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QTextEdit, QProgressBar,
                              QDialog, QDialogButtonBox, QComboBox, QFileDialog,
-                             QMessageBox, QFrame)
+                             QMessageBox, QFrame, QCheckBox)
 
-from core import InquiryClassifier, TrainingThread, ExcelHandler, RetrainingThread
+from core import (InquiryClassifier, TrainingThread, RetrainingThread, ModelLoaderThread,
+                  WorkbookSession)
+from core.tabular_backends import get_backend, file_dialog_filter, output_file_name
 from utils.resource_manager import ResourceManager
 from utils.version_manager import VersionManager
 from .dialogs import (ClassificationRulesDialog, ColumnSelectionDialog,
@@ -22,19 +24,28 @@ class MainWindow(QMainWindow):
         # GUI 렌더링 최적화 설정 추가
         self.setAttribute(Qt.WidgetAttribute.WA_NativeWindow)
         self.setAttribute(Qt.WidgetAttribute.WA_DontCreateNativeAncestors)
-        self.classifier = InquiryClassifier()
+        # 모델은 창을 먼저 띄운 뒤 백그라운드에서 불러옴
+        self.classifier = InquiryClassifier(lazy=True)
+        self.model_loading = True
         self.selected_sheet = None
         self.categories = []
         self.update_original = False
         self.input_file = None
         self.output_file = None
+        self.workbook_session = None  # 입력 파일의 시트를 한 번만 읽도록 공유하는 세션
         self.initUI()
         
-        # UI 초기화 후 모델 상태 확인
-        has_model = self.classifier.load_model()
+        # UI 초기화 후 모델을 한 번만 백그라운드에서 로드
+        self.model_loader = ModelLoaderThread(self.classifier)
+        self.model_loader.model_loaded.connect(self.on_model_loaded)
+        self.model_loader.start()
+    
+    def on_model_loaded(self, has_model):
+        """백그라운드 모델 로딩이 끝나면 호출됩니다."""
+        self.model_loading = False
         if has_model:
             logging.info("Existing model loaded successfully")
-            self.updateModelStatus()
+        self.updateModelStatus()
     
     def initUI(self):
         self.setWindowTitle('문의 분류 프로그램')
@@ -65,27 +76,30 @@ class MainWindow(QMainWindow):
         settings_menu = menubar.addMenu('설정')
         
         # 분류 규칙 관리
-        rules_action = QAction('분류 규칙 관리', self)
-        rules_action.triggered.connect(self.showClassificationRulesDialog)
-        settings_menu.addAction(rules_action)
+        self.rules_action = QAction('분류 규칙 관리', self)
+        self.rules_action.triggered.connect(self.showClassificationRulesDialog)
+        settings_menu.addAction(self.rules_action)
         
         # 전처리 규칙 관리
-        preprocess_action = QAction('전처리 규칙 관리', self)
-        preprocess_action.triggered.connect(self.showPreprocessingRulesDialog)
-        settings_menu.addAction(preprocess_action)
+        self.preprocess_action = QAction('전처리 규칙 관리', self)
+        self.preprocess_action.triggered.connect(self.showPreprocessingRulesDialog)
+        settings_menu.addAction(self.preprocess_action)
         
         # 모델 관리 메뉴
         model_menu = menubar.addMenu('모델')
         self.export_model_action = QAction('모델 내보내기', self)
-        import_model_action = QAction('모델 불러오기', self)
+        self.import_model_action = QAction('모델 불러오기', self)
         self.export_model_action.triggered.connect(self.exportModel)
-        import_model_action.triggered.connect(self.importModel)
+        self.import_model_action.triggered.connect(self.importModel)
         
         self.export_model_action.setEnabled(hasattr(self.classifier, 'model') and self.classifier.model is not None)
         self.export_model_action.setStatusTip('학습된 모델이 있을 때만 내보내기가 가능합니다')
         
         model_menu.addAction(self.export_model_action)
-        model_menu.addAction(import_model_action)
+        model_menu.addAction(self.import_model_action)
+        
+        # 백그라운드 로딩 중에는 분류기를 바꾸는 메뉴를 막음 (로딩이 끝나면 updateModelStatus에서 다시 켬)
+        self.model_actions = [self.rules_action, self.preprocess_action, self.import_model_action]
         
         # 도움말 메뉴
         help_menu = menubar.addMenu('도움말')
@@ -103,7 +117,9 @@ class MainWindow(QMainWindow):
     def showPreprocessingRulesDialog(self):
         """전처리 규칙 관리 다이얼로그를 표시합니다."""
         dialog = PreprocessingRulesDialog(self)
-        dialog.exec()
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            # 바뀐 전처리 규칙으로 만든 예측 캐시 항목만 적중하도록 지문 갱신
+            self.classifier.refresh_cache_fingerprint()
     
     def exportModel(self):
         if not hasattr(self.classifier, 'model') or self.classifier.model is None:
@@ -122,7 +138,8 @@ class MainWindow(QMainWindow):
             try:
                 current_model = {
                     'vectorizer': self.classifier.vectorizer,
-                    'model': self.classifier.model
+                    'model': self.classifier.model,
+                    'applied_updates': self.classifier.applied_updates
                 }
                 joblib.dump(current_model, file_path)
                 self.log_text.append(f'모델을 성공적으로 내보냈습니다: {file_path}')
@@ -142,10 +159,12 @@ class MainWindow(QMainWindow):
                 saved_model = joblib.load(file_path)
                 self.classifier.vectorizer = saved_model['vectorizer']
                 self.classifier.model = saved_model['model']
+                self.classifier.applied_updates = set(saved_model.get('applied_updates', ()))
+                # 저장에 실패해도 이전 모델 파일의 지문(캐시·병렬 처리)이 새 모델에 쓰이지 않도록 표시
+                self.classifier.mark_model_changed()
                 
-                # 모델 파일 복사
-                model_path = self.classifier.model_file
-                joblib.dump(saved_model, model_path)
+                # 모델 파일 복사 (예측 캐시도 함께 초기화됨)
+                self.classifier.save_model()
                 
                 self.log_text.append(f'모델을 성공적으로 불러왔습니다: {file_path}')
                 
@@ -158,7 +177,7 @@ class MainWindow(QMainWindow):
     def showClassificationRulesDialog(self):
         dialog = ClassificationRulesDialog(self.classifier.rules, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.classifier.rules = dialog.rules
+            self.classifier.set_rules(dialog.rules)
     
     def setupMainLayout(self):
         main_widget = QWidget()
@@ -200,6 +219,21 @@ class MainWindow(QMainWindow):
         """모델 상태 정보를 업데이트합니다."""
         try:
             version_info = VersionManager.load_version_info()
+            
+            if self.model_loading:
+                self.model_status_label.setText("… 모델을 불러오는 중입니다")
+                self.model_status_label.setStyleSheet("color: gray;")
+                self.model_version_label.setText("잠시만 기다려주세요")
+                self.train_btn.setEnabled(False)
+                self.classify_btn.setEnabled(False)
+                self.export_model_action.setEnabled(False)
+                for action in self.model_actions:
+                    action.setEnabled(False)
+                return
+            
+            for action in self.model_actions:
+                action.setEnabled(True)
+            self.train_btn.setEnabled(True)
             model_trained = self.classifier.is_model_trained()
             
             logging.info(f"Updating model status - Model trained: {model_trained}")
@@ -267,6 +301,10 @@ class MainWindow(QMainWindow):
         
         self.progress_bar = QProgressBar()
         layout.addWidget(self.progress_bar)
+
+        # 현재 단계, 처리 속도, 남은 시간 표시
+        self.progress_detail_label = QLabel('')
+        layout.addWidget(self.progress_detail_label)
         
     def setupLogSection(self, layout):
         log_label = QLabel('처리 로그:')
@@ -287,6 +325,10 @@ class MainWindow(QMainWindow):
         self.classify_btn.clicked.connect(lambda: self.process_data(False))
         button_layout.addWidget(self.classify_btn)
         
+        self.recommendation_columns_checkbox = QCheckBox('추천 분류/확률 컬럼 추가')
+        self.recommendation_columns_checkbox.setToolTip('신규 분류 행에 상위 3개 추천 분류와 확률을 함께 저장합니다.')
+        
+        layout.addWidget(self.recommendation_columns_checkbox)
         layout.addLayout(button_layout)
         
     def select_input_file(self):
@@ -294,11 +336,11 @@ class MainWindow(QMainWindow):
             self,
             "입력 파일 선택",
             "",
-            "Excel Files (*.xlsx *.xls)"
+            file_dialog_filter()
         )
         if file_name:
             try:
-                xls = pd.ExcelFile(file_name)
+                session = WorkbookSession.open(file_name)
                 
                 # 데이터 시트 선택 다이얼로그
                 sheet_dialog = QDialog(self)
@@ -306,7 +348,8 @@ class MainWindow(QMainWindow):
                 layout = QVBoxLayout()
                 
                 sheet_combo = QComboBox()
-                sheet_combo.addItems(xls.sheet_names)
+                for sheet_name in session.sheet_names:
+                    sheet_combo.addItem(session.describe_sheet(sheet_name), sheet_name)
                 layout.addWidget(QLabel('분석할 데이터 시트를 선택하세요:'))
                 layout.addWidget(sheet_combo)
                 
@@ -320,10 +363,10 @@ class MainWindow(QMainWindow):
                 sheet_dialog.setLayout(layout)
                 
                 if sheet_dialog.exec() == QDialog.DialogCode.Accepted:
-                    self.selected_sheet = sheet_combo.currentText()
+                    self.selected_sheet = sheet_combo.currentData()
                     
                     # 컬럼 선택 다이얼로그 표시
-                    column_dialog = ColumnSelectionDialog(file_name, self.selected_sheet, self)
+                    column_dialog = ColumnSelectionDialog(file_name, self.selected_sheet, self, session=session)
                     if column_dialog.exec() == QDialog.DialogCode.Accepted:
                         selections = column_dialog.get_selections()
                         
@@ -333,6 +376,7 @@ class MainWindow(QMainWindow):
                         self.categories = selections['categories']
                         
                         self.input_file = file_name
+                        self.workbook_session = session
                         self.input_label.setText(
                             f'입력 파일: {file_name}\n'
                             f'데이터 시트: {self.selected_sheet}\n'
@@ -361,6 +405,7 @@ class MainWindow(QMainWindow):
     def reset_input_selection(self):
         """입력 파일 선택 관련 변수들을 초기화합니다."""
         self.input_file = None
+        self.workbook_session = None
         self.selected_sheet = None
         self.content_column = None
         self.category_column = None
@@ -384,11 +429,10 @@ class MainWindow(QMainWindow):
                 self,
                 "출력 파일 선택",
                 "",
-                "Excel Files (*.xlsx)"
+                file_dialog_filter(for_output=True)
             )
-            if file_name and not file_name.endswith('.xlsx'):
-                file_name += '.xlsx'
             if file_name:
+                file_name = output_file_name(file_name)
                 self.output_file = file_name
                 self.update_original = False
                 self.output_label.setText(f'출력 파일: {file_name}')
@@ -434,9 +478,12 @@ class MainWindow(QMainWindow):
                 selected_sheet=self.selected_sheet,
                 content_column=self.content_column,
                 category_column=self.category_column,
-                categories=self.categories
+                categories=self.categories,
+                write_recommendations=self.recommendation_columns_checkbox.isChecked(),
+                session=self.workbook_session
             )
             self.thread.progress_updated.connect(self.update_progress)
+            self.thread.progress_detail.connect(self.progress_detail_label.setText)
             self.thread.finished.connect(self.process_finished)
             self.thread.error.connect(self.process_error)
             self.thread.start()
@@ -449,10 +496,22 @@ class MainWindow(QMainWindow):
     def process_finished(self):
         """분류 작업이 완료된 후의 처리"""
         self.log_text.append('자동 분류가 완료되었습니다.')
+        self.log_rule_hit_counts(self.thread.rule_hit_counts)
+        if self.thread.cache_stats:
+            self.log_text.append(
+                f"예측 캐시: 적중 {self.thread.cache_stats['hits']:,}건, "
+                f"미적중 {self.thread.cache_stats['misses']:,}건"
+            )
+        if self.thread.dedup_stats.get('rows'):
+            self.log_text.append(
+                f"중복 제거: {self.thread.dedup_stats['rows']:,}행 중 고유 문장 "
+                f"{self.thread.dedup_stats['unique']:,}건만 분류 ({self.thread.dedup_stats['ratio']:.1%} 중복)"
+            )
         
         try:
-            # 결과 데이터 로드
-            df = pd.read_excel(self.output_file, sheet_name=self.selected_sheet)
+            # 분류 결과는 출력 파일을 다시 읽지 않고 작업 스레드에서 그대로 받음
+            df = self.thread.result_df
+            self.workbook_session = self.thread.session
             
             # 검수 다이얼로그 표시
             review_dialog = ReviewDialog(
@@ -461,22 +520,21 @@ class MainWindow(QMainWindow):
                 category_column=self.category_column,
                 categories=self.categories,
                 classifier=self.classifier,  # classifier 추가
-                parent=self
+                parent=self,
+                recommendations=self.thread.recommendations,
+                original_df=self.workbook_session.read_sheet(self.selected_sheet, copy=False)
             )
             
             if review_dialog.exec() == QDialog.DialogCode.Accepted:
                 # 수정된 데이터 저장
                 modified_df = review_dialog.get_modified_data()
                 
-                # ExcelHandler를 사용하여 저장
-                excel_handler = ExcelHandler()
-                excel_handler.save_excel_with_style(
-                    input_file=self.input_file,
-                    output_file=self.output_file,
-                    sheet_name=self.selected_sheet,
-                    data=modified_df,
-                    is_update=(self.output_file == self.input_file)
-                )
+                # 파일 형식에 맞는 백엔드로 저장
+                if self.output_file == self.input_file:
+                    # 원본 업데이트: 분류 결과와 비교해 검수에서 바뀐 셀만 반영
+                    get_backend(self.input_file).update(self.selected_sheet, df, modified_df)
+                else:
+                    get_backend(self.output_file).write(self.input_file, self.selected_sheet, modified_df)
                 
                 self.log_text.append('검수 결과가 저장되었습니다.')
                 
@@ -495,9 +553,11 @@ class MainWindow(QMainWindow):
                             self.classifier,
                             review_dialog.training_data,
                             self.content_column,
-                            self.category_column
+                            self.category_column,
+                            update_data=getattr(review_dialog, 'update_data', None)
                         )
                         self.retrain_thread.progress_updated.connect(self.update_progress)
+                        self.retrain_thread.progress_detail.connect(self.progress_detail_label.setText)
                         self.retrain_thread.finished.connect(self.retrain_finished)
                         self.retrain_thread.error.connect(self.process_error)
                         self.retrain_thread.start()
@@ -513,9 +573,27 @@ class MainWindow(QMainWindow):
         
         self.finish_processing()
         
+    def log_rule_hit_counts(self, rule_hit_counts):
+        """규칙별 적중 횟수를 로그에 표시합니다."""
+        labels = {'keyword_based': '키워드 규칙', 'pattern_based': '패턴 규칙'}
+        for rule_type, hit_counts in rule_hit_counts.items():
+            if not hit_counts:
+                continue
+            lines = [f'  - {rule}: {count:,}건' for rule, count in hit_counts.items()]
+            self.log_text.append(f'{labels.get(rule_type, rule_type)} 적중 현황:\n' + '\n'.join(lines))
+        
     def retrain_finished(self):
         """재학습이 완료된 후의 처리"""
-        self.log_text.append('재학습이 완료되었습니다.')
+        if self.retrain_thread.model_unchanged:
+            self.log_text.append('새로 검수한 변경 사항이 없어 모델을 그대로 유지했습니다.')
+            self.updateModelStatus()
+            self.finish_processing()
+            QMessageBox.information(self, '완료', '새로 반영할 변경 사항이 없어 재학습하지 않았습니다.')
+            return
+        if self.retrain_thread.used_incremental:
+            self.log_text.append('변경분만 반영하여 재학습이 완료되었습니다.')
+        else:
+            self.log_text.append('재학습이 완료되었습니다.')
         self.updateModelStatus()
         self.finish_processing()
         QMessageBox.information(self, '완료', '재학습이 완료되었습니다.')
@@ -523,6 +601,7 @@ class MainWindow(QMainWindow):
     def finish_processing(self):
         """처리 완료 시의 공통 작업"""
         self.progress_bar.setValue(100)
+        self.progress_detail_label.setText('')
         self.train_btn.setEnabled(True)
         self.classify_btn.setEnabled(True)
         self.export_model_action.setEnabled(True)
@@ -535,6 +614,7 @@ class MainWindow(QMainWindow):
         """에러 처리"""
         self.log_text.append(f'오류가 발생했습니다: {error_msg}')
         self.progress_bar.setValue(0)
+        self.progress_detail_label.setText('')
         self.train_btn.setEnabled(True)
         self.classify_btn.setEnabled(True)
         QMessageBox.critical(self, '오류', f'처리 중 오류가 발생했습니다:\n{error_msg}')
@@ -542,6 +622,7 @@ class MainWindow(QMainWindow):
         
     def process_error(self, error_msg):
         self.log_text.append(f'에러가 발생했습니다: {error_msg}')
+        self.progress_detail_label.setText('')
         
         self.train_btn.setEnabled(True)
         self.classify_btn.setEnabled(True)
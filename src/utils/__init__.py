@@ -3,5 +3,6 @@ from .logging_config import setup_logging, get_logger
 from .resource_manager import ResourceManager
 from .version_manager import VersionManager
 from .text_extension import TextExtension
+from .text_preprocessor import TextPreprocessor
 
-__all__ = ['setup_logging', 'get_logger', 'ResourceManager', 'VersionManager', 'TextExtension']
\ No newline at end of file
+__all__ = ['setup_logging', 'get_logger', 'ResourceManager', 'VersionManager', 'TextExtension', 'TextPreprocessor']
\ No newline at end of file
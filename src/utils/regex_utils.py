@@ -0,0 +1,16 @@
+import re
+
+# 번호 역참조(\1, \g<1>), 이름 역참조((?P=이름)), 조건부 그룹((?(1)...))
+BACKREFERENCE_PATTERN = re.compile(r'\\(?:[1-9]|g<)|\(\?P=|\(\?\(')
+
+def can_combine(source, compiled, flags=0):
+    """정규식을 다른 정규식과 '|'로 합쳐 이름 있는 그룹으로 감싸도 뜻이 같은지 확인합니다."""
+    if compiled.groupindex:
+        return False  # 이름 있는 그룹은 다른 규칙과 이름이 겹칠 수 있음
+    if compiled.groups and BACKREFERENCE_PATTERN.search(source.replace('\\\\', '')):
+        return False  # 합치면 그룹 번호가 바뀌어 역참조가 다른 그룹을 가리킴
+    try:
+        re.compile(f"(?:{source})", flags)  # 중간에 오는 전역 플래그 등
+    except re.error:
+        return False
+    return True
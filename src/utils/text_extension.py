@@ -1,17 +1,12 @@
+from .text_preprocessor import TextPreprocessor
+
 class TextExtension:
     @staticmethod
     def clean_text(text):
-        """텍스트에서 특정 문자열 이후의 내용을 제거합니다."""
-        if not isinstance(text, str):
-            return str(text)
-            
-        # "os:" 이후 텍스트 제거
-        if "os:" in text.lower():
-            text = text.split("os:", 1)[0]
-            
-        # "문의경로:" 이후 텍스트 제거
-        if "문의경로:" in text:
-            text = text.split("문의경로:", 1)[0]
-            
-        # 결과 텍스트 정리
-        return text.strip()
\ No newline at end of file
+        """preprocessing_rules.json의 규칙(정규화, 특정 문자열 이후 제거, 바꾸기)을 텍스트에 적용합니다."""
+        return TextPreprocessor.default().clean(text)
+
+    @staticmethod
+    def clean_texts(texts):
+        """여러 텍스트를 한 번에 전처리해 리스트로 반환합니다 (컬럼 단위 처리용)."""
+        return TextPreprocessor.default().clean_many(texts)
\ No newline at end of file
@@ -0,0 +1,172 @@
+import os
+import re
+import json
+import logging
+import threading
+import unicodedata
+from .resource_manager import ResourceManager
+from .regex_utils import can_combine
+
+class TextPreprocessor:
+    """preprocessing_rules.json의 전처리 규칙을 한 번 컴파일해 두고 텍스트에 적용합니다.
+
+    적용 순서는 유니코드 정규화 → 자르기(cut_after_strings) → 바꾸기(replace_patterns) → 앞뒤 공백 제거입니다.
+    활성화된 자르기 규칙은 하나의 정규식으로 합쳐 가장 앞에서 일치하는 위치에서 한 번에 자르고,
+    바꾸기 규칙도 연속된 규칙끼리 하나의 정규식으로 합쳐 한 번에 훑습니다(같은 위치에서는 앞 규칙이 우선).
+    역참조, 이름 있는 그룹, 중간의 전역 플래그((?i) 등)처럼 합칠 수 없는 규칙은 원래 순서 그대로 따로 적용합니다.
+    바꾸기 규칙의 pattern은 regex가 true일 때만 정규식으로 해석하며, replacement는 그대로의 문자열입니다.
+    unicode_normalization(NFC 등)은 기본적으로 꺼져 있습니다. 켜거나 바꾸면 같은 문장에서 만들어지는
+    특성이 학습 때와 달라질 수 있으므로 모델을 다시 학습해야 합니다.
+    """
+    RULES_FILE = 'preprocessing_rules.json'
+    NORMALIZATION_FORMS = ('NFC', 'NFKC', 'NFD', 'NFKD')
+    DEFAULT_RULES = {
+        "text_preprocessing": {
+            "cut_after_strings": [
+                {
+                    "pattern": "os:",
+                    "case_sensitive": False,
+                    "enabled": True,
+                    "description": "OS 정보 이후 텍스트 제거"
+                },
+                {
+                    "pattern": "문의경로:",
+                    "case_sensitive": True,
+                    "enabled": True,
+                    "description": "문의경로 정보 이후 텍스트 제거"
+                }
+            ],
+            "replace_patterns": []
+        }
+    }
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, rules):
+        preprocessing = (rules or {}).get("text_preprocessing", {})
+
+        self.normalization = preprocessing.get("unicode_normalization") or None
+        if self.normalization is not None and self.normalization not in self.NORMALIZATION_FORMS:
+            raise ValueError(f"Unsupported unicode normalization form: {self.normalization}")
+
+        cut_patterns = [
+            self._wrap(re.escape(rule["pattern"]), rule.get("case_sensitive", True))
+            for rule in preprocessing.get("cut_after_strings", [])
+            if rule.get("enabled", True) and rule.get("pattern")
+        ]
+        self.cut_regex = re.compile('|'.join(cut_patterns)) if cut_patterns else None
+
+        self.replacements = {}
+        self.replace_steps = []  # (정규식, 바꿀 값을 돌려주는 함수)를 적용 순서대로
+        combined = []  # 아직 적용 단계로 넘기지 않은, 합쳐서 적용할 연속된 규칙의 그룹 소스
+        combined_regex = None
+        for index, rule in enumerate(preprocessing.get("replace_patterns", [])):
+            if not rule.get("enabled", True) or not rule.get("pattern"):
+                continue
+            pattern = rule["pattern"] if rule.get("regex", False) else re.escape(rule["pattern"])
+            case_sensitive = rule.get("case_sensitive", True)
+            replacement = rule.get("replacement", "")
+            try:
+                compiled = re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"Invalid replace pattern #{index + 1} '{rule['pattern']}': {str(e)}") from e
+
+            group = f'_r{index}'
+            if can_combine(pattern, compiled, 0):
+                candidate = combined + [f'(?P<{group}>{self._wrap(pattern, case_sensitive)})']
+                try:
+                    candidate_regex = re.compile('|'.join(candidate))
+                except re.error as e:
+                    logging.warning(f"Replace pattern #{index + 1} cannot be combined, applying it separately: {str(e)}")
+                else:
+                    combined, combined_regex = candidate, candidate_regex
+                    self.replacements[group] = replacement
+                    continue
+
+            if combined_regex is not None:
+                self.replace_steps.append((combined_regex, self._replace))
+                combined, combined_regex = [], None
+            self.replace_steps.append((compiled, lambda match, value=replacement: value))
+        if combined_regex is not None:
+            self.replace_steps.append((combined_regex, self._replace))
+
+    @staticmethod
+    def _wrap(pattern, case_sensitive):
+        return pattern if case_sensitive else f'(?i:{pattern})'
+
+    @classmethod
+    def load_rules(cls):
+        """규칙 파일을 읽습니다. 없거나 읽을 수 없으면 기본 규칙을 반환합니다."""
+        try:
+            rules_path = ResourceManager.get_resource_path(cls.RULES_FILE)
+            if rules_path and os.path.exists(rules_path):
+                with open(rules_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            logging.warning("Preprocessing rules file not found, using default rules")
+        except Exception as e:
+            logging.error(f"Error loading preprocessing rules: {str(e)}")
+        return cls.DEFAULT_RULES
+
+    @classmethod
+    def default(cls):
+        """규칙 파일로 컴파일한 공용 인스턴스를 반환합니다 (처음 한 번만 컴파일)."""
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    try:
+                        cls._default = cls(cls.load_rules())
+                    except (ValueError, re.error) as e:
+                        logging.error(f"Invalid preprocessing rules, using default rules: {str(e)}")
+                        cls._default = cls(cls.DEFAULT_RULES)
+        return cls._default
+
+    @classmethod
+    def reload(cls):
+        """규칙 파일이 바뀐 뒤 호출하면 다음 사용 때 다시 컴파일합니다."""
+        with cls._default_lock:
+            cls._default = None
+
+    def _replace(self, match):
+        return self.replacements[match.lastgroup]
+
+    def clean(self, text):
+        """텍스트 하나를 전처리합니다. 문자열이 아니면 str()로 바꾼 값을 그대로 반환합니다."""
+        if not isinstance(text, str):
+            return str(text)
+        if self.normalization is not None:
+            text = unicodedata.normalize(self.normalization, text)
+        if self.cut_regex is not None:
+            match = self.cut_regex.search(text)
+            if match:
+                text = text[:match.start()]
+        for regex, replace in self.replace_steps:
+            text = regex.sub(replace, text)
+        return text.strip()
+
+    def clean_many(self, texts):
+        """컬럼 전체(리스트, Series 등)를 한 번에 전처리해 리스트로 반환합니다.
+
+        clean()과 결과가 같으며, 규칙 확인과 메서드 조회를 행마다 반복하지 않도록 루프 밖에서 준비합니다.
+        """
+        normalize = unicodedata.normalize
+        form = self.normalization
+        cut_search = self.cut_regex.search if self.cut_regex is not None else None
+        replace_steps = [(regex.sub, replace) for regex, replace in self.replace_steps]
+
+        cleaned = []
+        append = cleaned.append
+        for text in texts:
+            if not isinstance(text, str):
+                append(str(text))
+                continue
+            if form is not None:
+                text = normalize(form, text)
+            if cut_search is not None:
+                match = cut_search(text)
+                if match:
+                    text = text[:match.start()]
+            for replace_sub, replace in replace_steps:
+                text = replace_sub(replace, text)
+            append(text.strip())
+        return cleaned